@@ -0,0 +1,156 @@
+"""
+Benchmark for loading config, using synthetic configs of increasing size, with
+every marker, ending, and speaker name overridden.
+
+The set of speakers is fixed, so configs grow through the length of their
+names and markers. Extracting (reading and parsing the JSON), transforming
+(resolving config values and pre-rendering speaker text), and compiling (the
+transitions table) are timed separately, along with a full load with and
+without a snapshot, a reload of an unchanged file, and the memory that the
+loaded config holds on to.
+
+Run from the repository root with:
+
+    python benchmark/config_load.py
+"""
+
+import json
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import (
+    Any,
+    Callable
+)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# pylint: disable=wrong-import-position
+from plover_q_and_a import (
+    config,
+    sign
+)
+from plover_q_and_a.config import (
+    extractor,
+    transformer
+)
+# pylint: enable=wrong-import-position
+
+
+_TEXT_LENGTHS = (1, 10, 100, 1_000, 10_000)
+_SPEAKERS = (
+    "plaintiff_1",
+    "plaintiff_2",
+    "defense_1",
+    "defense_2",
+    "witness",
+    "court",
+    "videographer",
+    "court_reporter",
+    "clerk",
+    "bailiff"
+)
+_REPEAT = 3
+
+def main() -> None:
+    """
+    Times each stage of loading configs of increasing size.
+    """
+    print(
+        f"{'text':>6} {'file':>8} {'extract':>9} {'transform':>10} "
+        f"{'compile':>9} {'load':>9} {'snapshot':>9} {'reload':>9} "
+        f"{'memory':>9}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for length in _TEXT_LENGTHS:
+            config_path = Path(directory) / f"q_and_a_{length}.json"
+            snapshot_path = Path(directory) / f"q_and_a_{length}.snapshot"
+            config_path.write_text(
+                json.dumps(_synthetic_data(length)),
+                encoding="utf-8"
+            )
+            _report(length, config_path, snapshot_path)
+
+def _report(length: int, config_path: Path, snapshot_path: Path) -> None:
+    data: dict[str, Any] = extractor.load(config_path)
+    app_config: config.Config = sign.speaker_signs.prerender(
+        transformer.transform(data)
+    )
+    loaded_config: config.Config = config.load(config_path)
+    config.load(config_path, snapshot_path)
+
+    timings: list[float] = [
+        _best(lambda: extractor.load(config_path)),
+        _best(
+            lambda: sign.speaker_signs.prerender(transformer.transform(data))
+        ),
+        _best(lambda: sign.transitions.build(app_config)),
+        _best(lambda: config.load(config_path)),
+        _best(lambda: config.load(config_path, snapshot_path)),
+        _best(lambda: config.reload(config_path, loaded_config))
+    ]
+    print(
+        f"{length:>6} {config_path.stat().st_size / 1024:>6.0f}KB "
+        + " ".join(
+            f"{timing * 1e3:>{width}.3f}ms"
+            for timing, width in zip(timings, (7, 8, 7, 7, 7, 7))
+        )
+        + f" {_footprint(config_path) / 1024:>7.0f}KB"
+    )
+
+def _synthetic_data(length: int) -> dict[str, Any]:
+    def text(name: str) -> str:
+        return (name * length)[:length]
+
+    def ending() -> dict[str, str]:
+        return {
+            "interrogative": text("?"),
+            "statement": text("."),
+            "interrupt": text("-"),
+            "yield": text("\n")
+        }
+
+    def marker(name: str) -> dict[str, str]:
+        return {"pre": text("<"), "text": text(name), "post": text(">")}
+
+    return {
+        "question": {"marker": marker("Q"), "ending": ending()},
+        "answer": {"marker": marker("A"), "ending": ending()},
+        "byline": {
+            "question": {"marker": marker("BY ")},
+            "answer": {"marker": marker("")}
+        },
+        "speaker": {
+            "marker": {
+                "pre": text("<"),
+                "post": text(">"),
+                "upcase": True,
+                **{speaker: text(f"{speaker} ") for speaker in _SPEAKERS}
+            },
+            "ending": ending()
+        },
+        "sentence_space": text(" "),
+        "set_name_prompt": (
+            text("Set ") + "{speaker_type} ({current_speaker_name}): "
+        )
+    }
+
+def _footprint(config_path: Path) -> int:
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    loaded_config: config.Config = config.load(config_path)
+    after: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del loaded_config
+
+    return after - before
+
+def _best(statement: Callable[[], Any]) -> float:
+    timer = timeit.Timer(statement)
+    number: int = timer.autorange()[0]
+    return min(timer.repeat(number=number, repeat=_REPEAT)) / number
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark for scanning back through the fragments of a context's history, as
+done by `SET_NAME:DONE`, comparing the plugin's reverse scanner with Plover's
+own `RetroFormatter.iter_last_fragments`.
+
+Run from the repository root with:
+
+    python benchmark/fragment_scanner.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# pylint: disable-next=wrong-import-position
+from plover.formatting import (
+    _Action,
+    _Context
+)
+
+# pylint: disable-next=wrong-import-position
+from plover_q_and_a.speaker.formatting import iter_last_fragments
+
+
+_HISTORY_SIZES = (10, 100, 1_000)
+_REPEAT = 5
+
+def main() -> None:
+    """
+    Times a full scan of histories of words separated by spaces, and of words
+    typed as many small attached pieces (eg fingerspelling).
+    """
+    for shape, attached in (("spaced words", False), ("attached pieces", True)):
+        for size in _HISTORY_SIZES:
+            ctx = _context(size, attached)
+            number = max(1, 10_000 // size)
+            plover = _best(
+                lambda ctx=ctx: list(ctx.iter_last_fragments()),
+                number
+            )
+            plugin = _best(
+                lambda ctx=ctx: list(iter_last_fragments(ctx)),
+                number
+            )
+            print(
+                f"{shape:<16} {size:>5} actions: "
+                f"plover {plover * 1e6:9.1f} us  "
+                f"plugin {plugin * 1e6:9.1f} us"
+            )
+
+def _context(size: int, attached: bool) -> _Context:
+    ctx = _Context([], _Action())
+    for index in range(size):
+        action = ctx.new_action()
+        action.text = "ab"[index % 2] if attached else "word"
+        action.prev_attach = attached
+        ctx.translated(action)
+
+    return ctx
+
+def _best(statement, number: int) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=_REPEAT)) / number
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Measures how long importing the extension takes, using Python's own
+`-X importtime` instrumentation, so that import cost stays visible over time.
+
+Each run happens in a fresh interpreter. By default, the Plover modules that a
+running Plover would already have imported are imported first, so that only
+the plugin's own import cost gets measured. The best time for each module over
+all runs is reported, along with a total.
+
+Run from the repository root with:
+
+    python benchmark/import_time.py [--repeat N] [--cold] [--module MODULE]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+# NOTE: Plover imports these itself before it loads any plugins.
+_PLOVER_MODULES = (
+    "plover.engine",
+    "plover.formatting",
+    "plover.log",
+    "plover.machine.base",
+    "plover.oslayer.config",
+    "plover.registry"
+)
+_IMPORT_TIME_RX = re.compile(
+    r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \| "
+    r"(?P<indent>\s*)(?P<module>\S+)$"
+)
+
+def main() -> None:
+    """
+    Measures the import time of a module, and reports on it.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n", maxsplit=1)[0]
+    )
+    parser.add_argument(
+        "--module",
+        default="plover_q_and_a.extension",
+        help="module to import (defaults to the extension)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+        help="number of fresh interpreters to measure the import in"
+    )
+    parser.add_argument(
+        "--cold",
+        action="store_true",
+        help="do not import Plover's own modules first"
+    )
+    args = parser.parse_args()
+
+    best: dict[str, tuple[int, int, int]] = {}
+    for _ in range(args.repeat):
+        for module, timing in _measure(args.module, args.cold).items():
+            if module not in best or timing[1] < best[module][1]:
+                best[module] = timing
+
+    _report(args.module, best)
+
+def _measure(module: str, cold: bool) -> dict[str, tuple[int, int, int]]:
+    """
+    Imports a module in a fresh interpreter, and returns the self time,
+    cumulative time (both in microseconds), and nesting depth of every module
+    that the import pulled in.
+    """
+    preamble = "" if cold else "".join(
+        f"import {plover_module}\n" for plover_module in _PLOVER_MODULES
+    )
+    # NOTE: Only the final import is timed, so split the output there.
+    marker = "q_and_a_import_time_marker"
+    code = f"{preamble}import sys\nprint('{marker}', file=sys.stderr)\n"
+    code += f"import {module}\n"
+    environment = dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join(
+            filter(None, (str(_ROOT / "src"), os.environ.get("PYTHONPATH")))
+        )
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        env=environment,
+        text=True
+    )
+
+    timings: dict[str, tuple[int, int, int]] = {}
+    for line in result.stderr.split(marker, maxsplit=1)[-1].splitlines():
+        match = _IMPORT_TIME_RX.match(line)
+        if match:
+            timings[match["module"]] = (
+                int(match["self"]),
+                int(match["cumulative"]),
+                len(match["indent"]) // 2
+            )
+
+    return timings
+
+def _report(module: str, best: dict[str, tuple[int, int, int]]) -> None:
+    print(f"{'self':>9} {'cumulative':>11}  module")
+    for name, (self_us, cumulative_us, depth) in sorted(
+        best.items(),
+        key=lambda item: item[1][1],
+        reverse=True
+    ):
+        print(
+            f"{self_us / 1e3:>7.2f}ms {cumulative_us / 1e3:>9.2f}ms  "
+            f"{'  ' * depth}{name}"
+        )
+    total = best.get(module, (0, 0, 0))[1]
+    print(f"total {total / 1e3:.2f}ms to import {module}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""
+Replay harness that drives the extension with a recorded session, without a
+running Plover, and reports throughput, per-command latency, and the final
+transcript.
+
+A session can either be a Plover `strokes.log` (with translation logging
+turned on), or a plain text file with one translation per line, eg:
+
+    {:Q_AND_A:QUESTION:INITIAL}
+    Did you see the car{?}
+    {:Q_AND_A:ANSWER:FOLLOWING_INTERROGATIVE}
+    Yes{.}
+    =undo
+
+Translations are formatted by Plover's own `Formatter`, which calls into the
+extension's `Q_AND_A` meta and `translated` hook just like the engine does.
+The extension tests drive the extension with the same stand-ins.
+
+Run from the repository root with:
+
+    python benchmark/replay.py SESSION [--config q_and_a.json] [--repeat N]
+"""
+
+import argparse
+import re
+import sys
+import time
+from collections import deque
+from importlib.metadata import entry_points
+from pathlib import Path
+from statistics import quantiles
+from typing import (
+    Callable,
+    Iterator,
+    Optional
+)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# pylint: disable=wrong-import-position
+from plover.formatting import (
+    _Action,
+    _Context,
+    Formatter
+)
+from plover.oslayer.config import CONFIG_DIR
+from plover.registry import registry
+from plover.translation import (
+    Translation,
+    unescape_translation
+)
+
+from plover_q_and_a import (
+    config,
+    extension
+)
+# pylint: enable=wrong-import-position
+
+
+# NOTE: Plover's translator keeps this many translations around by default,
+# which bounds how far back formatting (and SET_NAME:DONE) can look.
+_UNDO_LEVELS = 100
+_UNDO = "=undo"
+_STROKES_LOG_RX = re.compile(
+    r"(?P<undo>\*?)Translation\(\((?P<strokes>.*?)\) : "
+    r"(?:None|\"(?P<english>.*)\")\)$"
+)
+
+class FormatterEngine:
+    """
+    Stand-in for Plover's `StenoEngine`, which sends the formatter's output
+    notifications to the extension's `translated` hook.
+    """
+
+    def __init__(self, formatter: Formatter) -> None:
+        self._formatter = formatter
+
+    def hook_connect(self, hook: str, callback: Callable[..., None]) -> None:
+        """
+        Connects the `translated` hook (the only one a replay can fire).
+        """
+        if hook == "translated":
+            self._formatter.add_listener(callback)
+
+    def hook_disconnect(self, hook: str, callback: Callable[..., None]) -> None:
+        """
+        Disconnects the `translated` hook.
+        """
+        if hook == "translated":
+            self._formatter.remove_listener(callback)
+
+class TranscriptOutput:
+    """
+    Stand-in for Plover's keyboard emulation, which keeps the transcript.
+    """
+
+    def __init__(self) -> None:
+        self.characters: list[str] = []
+
+    def send_backspaces(self, count: int) -> None:
+        """
+        Deletes characters from the end of the transcript.
+        """
+        del self.characters[-count:]
+
+    def send_string(self, text: str) -> None:
+        """
+        Adds text to the end of the transcript.
+        """
+        self.characters.extend(text)
+
+def main() -> None:
+    """
+    Replays a session and reports on it.
+    """
+    args = _parse_args()
+    session: list[Optional[str]] = list(_read_session(args.session))
+
+    _register_plover_metas()
+    formatter = Formatter()
+    output = TranscriptOutput()
+    formatter.set_output(output)
+    # NOTE: Never read or write the user's real config snapshot.
+    q_and_a = extension.QAndA(
+        FormatterEngine(formatter),
+        config_file=args.config.resolve(),
+        snapshot_file=None
+    )
+    q_and_a.start()
+    # Wait for the config to be loaded, so that only steady state gets timed.
+    # pylint: disable-next=protected-access
+    q_and_a._loaded_engine()
+    latencies: list[int] = []
+    registry.register_plugin("meta", "Q_AND_A", _timed(q_and_a, latencies))
+
+    history: deque[Translation] = deque(maxlen=_UNDO_LEVELS)
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for english in session:
+            _replay(formatter, history, english)
+    elapsed = time.perf_counter() - start
+    q_and_a.stop()
+
+    _report(len(session) * args.repeat, elapsed, latencies)
+    transcript = "".join(output.characters)
+    if args.transcript:
+        args.transcript.write_text(transcript, encoding="utf-8")
+    else:
+        print("-" * 72)
+        print(transcript)
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n", maxsplit=1)[0]
+    )
+    parser.add_argument("session", type=Path, help="strokes.log or text file")
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=Path(CONFIG_DIR) / config.CONFIG_BASENAME,
+        help="Q&A config file (defaults to the one in Plover's config dir)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="number of times to replay the session"
+    )
+    parser.add_argument(
+        "--transcript",
+        type=Path,
+        help="file to write the transcript to, instead of printing it"
+    )
+    return parser.parse_args()
+
+def _register_plover_metas() -> None:
+    """
+    Registers only Plover's own metas (like `{.}` and `{^}`), rather than
+    every installed plugin, some of which need hardware support to load.
+    """
+    plover_entrypoints = entry_points()
+    metas = (
+        plover_entrypoints.select(group="plover.meta")
+        if hasattr(plover_entrypoints, "select")
+        else plover_entrypoints.get("plover.meta", ())
+    )
+    for entrypoint in metas:
+        registry.register_plugin("meta", entrypoint.name, entrypoint.load())
+
+def _read_session(session_path: Path) -> Iterator[Optional[str]]:
+    """
+    Yields the translations in a session, with `None` for an undo.
+    """
+    with session_path.open(encoding="utf-8") as session:
+        for line in session:
+            line = line.rstrip("\n")
+            match = _STROKES_LOG_RX.search(line)
+            if match:
+                if match["undo"]:
+                    yield None
+                elif match["english"] is None:
+                    # Untranslated strokes get output as raw steno.
+                    yield "/".join(re.findall(r"'([^']*)'", match["strokes"]))
+                else:
+                    yield unescape_translation(
+                        match["english"].replace(r"\"", '"')
+                    )
+            elif line == _UNDO:
+                yield None
+            elif line.strip() and "Stroke(" not in line:
+                yield line
+
+def _replay(
+    formatter: Formatter,
+    history: deque[Translation],
+    english: Optional[str]
+) -> None:
+    if english is None:
+        if history:
+            undone = history.pop()
+            formatter.format([undone], [], history)
+        return
+
+    translation = Translation([], english)
+    formatter.format([], [translation], history)
+    history.append(translation)
+
+def _timed(
+    q_and_a: extension.QAndA,
+    latencies: list[int]
+) -> Callable[[_Context, str], _Action]:
+    # pylint: disable-next=protected-access
+    meta = q_and_a._q_and_a
+
+    def _function(ctx: _Context, argument: str) -> _Action:
+        start = time.perf_counter_ns()
+        action = meta(ctx, argument)
+        latencies.append(time.perf_counter_ns() - start)
+        return action
+
+    return _function
+
+def _report(strokes: int, elapsed: float, latencies: list[int]) -> None:
+    print(f"translations        {strokes:>12,}")
+    print(f"elapsed             {elapsed:>12.3f} s")
+    print(f"throughput          {strokes / elapsed:>12,.0f} translations/s")
+    print(f"Q_AND_A commands    {len(latencies):>12,}")
+    if len(latencies) > 1:
+        percentiles = quantiles(latencies, n=100, method="inclusive")
+        print(f"command p50         {percentiles[49] / 1e3:>12.1f} us")
+        print(f"command p99         {percentiles[98] / 1e3:>12.1f} us")
+
+if __name__ == "__main__":
+    main()
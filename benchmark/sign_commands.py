@@ -0,0 +1,170 @@
+"""
+Benchmark for every sign command path, run against each of the example
+configs, with results emitted as JSON so that runs can be compared.
+
+Each sign command is timed both when parsed and rendered from scratch with
+`sign.text` (as for a command that is not in the transitions table), and when
+looked up in the transitions table (as done for every `Q_AND_A` stroke). A
+set speaker name prompt being opened and closed is also timed.
+
+Run from the repository root with:
+
+    python benchmark/sign_commands.py [--output results.json]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import (
+    Any,
+    Iterator
+)
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT / "src"))
+
+# pylint: disable=wrong-import-position
+from plover.formatting import (
+    _Action,
+    _Context
+)
+
+from plover_q_and_a import (
+    BYLINE_SPEAKER_TYPES,
+    SPEAKER_TYPES,
+    config,
+    sign,
+    speaker
+)
+# pylint: enable=wrong-import-position
+
+
+_CONFIGS = (
+    _ROOT / "examples/config/platinum_steno.json",
+    _ROOT / "examples/config/tasmanian_style.json"
+)
+_CURRENT_SIGN_TYPE = "ANSWER"
+_FOLLOWING_VARIANTS = (
+    "FOLLOWING_INTERROGATIVE",
+    "FOLLOWING_STATEMENT",
+    "FOLLOWING_INTERRUPT"
+)
+_FOLLOW_ONS = ((), ("YIELD_AFTER", "Okay"), ("ELABORATE_AFTER", "All right"))
+_NUMBER = 2_000
+_SET_NAME_NUMBER = 200
+_REPEAT = 5
+
+def main() -> None:
+    """
+    Times every sign command path for each example config.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n", maxsplit=1)[0]
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="file to write JSON results to, instead of printing them"
+    )
+    args = parser.parse_args()
+
+    results: list[dict[str, Any]] = []
+    for config_path in _CONFIGS:
+        loaded_config = config.load(config_path)
+        for args_list in _sign_args():
+            command = sign.parse(args_list)
+            results.append(_result(
+                config_path,
+                ":".join(args_list),
+                "text",
+                _best(
+                    lambda args_list=args_list, loaded_config=loaded_config: (
+                        sign.text(_CURRENT_SIGN_TYPE, args_list, loaded_config)
+                    )
+                )
+            ))
+            results.append(_result(
+                config_path,
+                ":".join(args_list),
+                "lookup",
+                _best(
+                    lambda command=command, loaded_config=loaded_config: (
+                        sign.transitions.lookup(
+                            _CURRENT_SIGN_TYPE,
+                            command,
+                            loaded_config
+                        )
+                    )
+                )
+            ))
+        results.append(_result(
+            config_path,
+            "SET_NAME:PLAINTIFF_1 + SET_NAME:DONE",
+            "set_name",
+            _best(
+                lambda loaded_config=loaded_config: _set_name(loaded_config),
+                _SET_NAME_NUMBER
+            )
+        ))
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+def _sign_args() -> Iterator[list[str]]:
+    yield ["QUESTION", "INITIAL"]
+    for sign_type in ("QUESTION", "ANSWER"):
+        for variant in _FOLLOWING_VARIANTS:
+            for follow_on in _FOLLOW_ONS:
+                yield [sign_type, variant, *follow_on]
+
+    for speaker_type in BYLINE_SPEAKER_TYPES:
+        for variant in ("INITIAL",) + _FOLLOWING_VARIANTS:
+            yield ["BYLINE", speaker_type, variant]
+
+    for speaker_type in SPEAKER_TYPES:
+        for variant in ("INITIAL",) + _FOLLOWING_VARIANTS:
+            yield [speaker_type, variant]
+
+def _set_name(loaded_config: config.Config) -> config.Config:
+    ctx = _Context([], _Action())
+    prompts = speaker.Prompts()
+    for set_name_command in ("PLAINTIFF_1", "DONE"):
+        action = ctx.new_action()
+        loaded_config = speaker.set_name(
+            set_name_command,
+            ctx,
+            action,
+            loaded_config,
+            prompts
+        )
+        ctx.translated(action)
+        if set_name_command != "DONE":
+            name = ctx.new_action()
+            name.text = "Smith"
+            ctx.translated(name)
+
+    return loaded_config
+
+def _best(statement: Any, number: int = _NUMBER) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=_REPEAT)) / number
+
+def _result(
+    config_path: Path,
+    command: str,
+    path: str,
+    seconds: float
+) -> dict[str, Any]:
+    return {
+        "config": config_path.name,
+        "command": command,
+        "path": path,
+        "ns": round(seconds * 1e9, 1)
+    }
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Micro-benchmark for the per-translation overhead of the extension's
+`translated` hook.
+
+Run from the repository root with:
+
+    python benchmark/translated_hook.py
+"""
+
+import sys
+import timeit
+import weakref
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# pylint: disable=wrong-import-position
+from plover.formatting import _Action
+
+from plover_q_and_a import (
+    sign,
+    speaker
+)
+from plover_q_and_a.extension import QAndA
+# pylint: enable=wrong-import-position
+
+
+_NUMBER = 1_000_000
+_REPEAT = 5
+
+def main() -> None:
+    """
+    Times the hook against the kinds of translations it sees while writing.
+    """
+    # pylint: disable=protected-access
+    extension = QAndA(engine=None)
+    extension._config_reloader = SimpleNamespace(request=lambda: None)
+    # Set up the state that `start` would, without starting any threads.
+    extension._sign_history = sign.History()
+    extension._set_name_prompts = speaker.Prompts()
+    history = extension._sign_history
+    prompts = extension._set_name_prompts
+    translated = extension._translated
+    # pylint: enable=protected-access
+
+    # NOTE: A sign that stays in the history, so that undoing other actions
+    # has a history to check them against.
+    question_action = _Action(text="\tQ\t")
+    history.push(question_action, "QUESTION")
+    prompt_action = _Action(text="[Set WITNESS (THE WITNESS) =>] ")
+    prompt = speaker.Prompt("WITNESS", weakref.ref(prompt_action))
+    text_action = _Action(text="the")
+    answer_action = _Action(text="?\n\tA\t")
+
+    # Each case is (old, new, redo), where redo puts back whatever the undo
+    # took away before every hook call, and so gets timed along with it.
+    cases = {
+        "plain text": ([], [text_action], ""),
+        "other command": ([], [_Action(command="lookup")], ""),
+        "SET_CONFIG": ([], [_Action(command="SET_CONFIG")], ""),
+        "set_config (lower case)": ([], [_Action(command="set_config")], ""),
+        "undo text": ([text_action], [], ""),
+        "undo sign (+ push)": (
+            [answer_action],
+            [],
+            "history.push(answer_action, 'ANSWER')"
+        )
+    }
+    prompt_open_cases = {
+        "undo text, prompt open": ([text_action], [], ""),
+        "undo prompt (+ open)": ([prompt_action], [], "prompts.open(prompt)")
+    }
+    namespace = {
+        "translated": translated,
+        "history": history,
+        "prompts": prompts,
+        "prompt": prompt,
+        "answer_action": answer_action
+    }
+
+    for name, (old, new, redo) in cases.items():
+        _time(name, old, new, redo, namespace)
+    prompts.open(prompt)
+    for name, (old, new, redo) in prompt_open_cases.items():
+        _time(name, old, new, redo, namespace)
+
+def _time(
+    name: str,
+    old: list[_Action],
+    new: list[_Action],
+    redo: str,
+    namespace: dict[str, Any]
+) -> None:
+    best = min(
+        timeit.repeat(
+            f"{redo}; translated(old, new)" if redo else "translated(old, new)",
+            globals={**namespace, "old": old, "new": new},
+            number=_NUMBER,
+            repeat=_REPEAT
+        )
+    )
+    print(f"{name:<26} {best / _NUMBER * 1e9:8.1f} ns/translation")
+
+if __name__ == "__main__":
+    main()
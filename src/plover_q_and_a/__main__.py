@@ -0,0 +1,191 @@
+"""
+Command line interface for running Q&A formatting without Plover.
+
+Restyle a transcript containing Q_AND_A commands with a given config with:
+
+    python -m plover_q_and_a render [INPUT] --config CONFIG [--output OUTPUT]
+
+Input defaults to stdin, and output to stdout. Restyle many transcripts at
+once, across a pool of worker processes, with:
+
+    python -m plover_q_and_a render INPUT... --config CONFIG --output-dir DIR
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+from pathlib import Path
+from typing import (
+    Iterator,
+    Optional,
+    Sequence,
+    TextIO,
+    cast
+)
+
+from . import (
+    batch,
+    config,
+    transcript
+)
+
+
+_PROG: str = "python -m plover_q_and_a"
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Runs a command line command, and returns its exit status.
+    """
+    parser: argparse.ArgumentParser = _parser()
+    args: argparse.Namespace = parser.parse_args(argv)
+    if not args.config.is_file():
+        parser.error(f"config file not found: {args.config}")
+    if args.output_dir and (args.output or not args.inputs):
+        parser.error("--output-dir needs input files, and no --output")
+    if not args.output_dir and len(args.inputs) > 1:
+        parser.error("rendering more than one input needs --output-dir")
+
+    try:
+        loaded_config: config.Config = config.load(args.config)
+        if args.output_dir:
+            return _render_batch(args, loaded_config)
+
+        with _open(
+            args.inputs[0] if args.inputs else None,
+            "r",
+            sys.stdin
+        ) as input_stream:
+            with _open(args.output, "w", sys.stdout) as output_stream:
+                output_stream.writelines(
+                    transcript.render(
+                        transcript.read_chunks(input_stream),
+                        loaded_config
+                    )
+                )
+    except (OSError, ValueError) as exc:
+        print(f"{_PROG}: error: {exc}", file=sys.stderr)
+        return 1
+
+    return 0
+
+def _parser() -> argparse.ArgumentParser:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog=_PROG,
+        description="Run Q&A formatting without Plover."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    render_parser: argparse.ArgumentParser = subparsers.add_parser(
+        "render",
+        help="render a transcript containing Q_AND_A commands",
+        description=(
+            "Render a transcript containing {:Q_AND_A:...} commands into "
+            "formatted Q&A output."
+        )
+    )
+    render_parser.add_argument(
+        "inputs",
+        nargs="*",
+        type=Path,
+        metavar="INPUT",
+        help="transcript to render (defaults to stdin)"
+    )
+    render_parser.add_argument(
+        "--config",
+        required=True,
+        type=Path,
+        help="Q&A config file to render the transcript with"
+    )
+    render_parser.add_argument(
+        "--output",
+        type=Path,
+        help="file to write the rendered transcript to (defaults to stdout)"
+    )
+    render_parser.add_argument(
+        "--output-dir",
+        type=Path,
+        help=(
+            "directory to write each rendered transcript to, under the same "
+            "name as its input"
+        )
+    )
+    render_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help=(
+            "number of worker processes to render transcripts with when "
+            "using --output-dir (defaults to the number of CPUs)"
+        )
+    )
+
+    return parser
+
+def _render_batch(
+    args: argparse.Namespace,
+    loaded_config: config.Config
+) -> int:
+    """
+    Renders transcript files into an output directory, and reports the
+    throughput for each file, and overall, on stderr.
+    """
+    start: float = time.perf_counter()
+    total_bytes: int = 0
+    failures: int = 0
+    for result in batch.render_files(
+        args.inputs,
+        args.output_dir,
+        loaded_config,
+        args.jobs
+    ):
+        if result.error:
+            failures += 1
+            print(
+                f"{_PROG}: error: {result.input_path}: {result.error}",
+                file=sys.stderr
+            )
+            continue
+
+        total_bytes += result.input_bytes
+        print(
+            f"{result.input_path} -> {result.output_path}: "
+            f"{_throughput(result.input_bytes, result.seconds)}",
+            file=sys.stderr
+        )
+
+    print(
+        f"{len(args.inputs) - failures} of {len(args.inputs)} transcripts "
+        f"rendered with {args.jobs} jobs: "
+        f"{_throughput(total_bytes, time.perf_counter() - start)}",
+        file=sys.stderr
+    )
+
+    return 1 if failures else 0
+
+def _throughput(size: int, seconds: float) -> str:
+    megabytes: float = size / 1_000_000
+    return (
+        f"{megabytes:.2f}MB in {seconds:.3f}s "
+        f"({megabytes / max(seconds, 1e-9):.2f}MB/s)"
+    )
+
+@contextlib.contextmanager
+def _open(
+    path: Optional[Path],
+    mode: str,
+    default: TextIO
+) -> Iterator[TextIO]:
+    """
+    Opens a file as UTF-8 text, leaving line endings untouched, or falls back
+    to a standard stream if no file is given.
+    """
+    if path is None:
+        yield default
+        return
+
+    with path.open(mode, encoding="utf-8", newline="") as stream:
+        yield cast(TextIO, stream)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+Module to handle keeping plugin metadata about Plover actions in a side table,
+rather than as dynamic attributes on the `_Action` objects themselves.
+
+`_Action` defines `__eq__` without `__hash__`, so actions cannot be used as
+keys in a `weakref.WeakKeyDictionary`. Instead, the table is keyed by action
+identity, and each entry is removed as soon as Plover lets go of its action.
+"""
+
+import weakref
+from typing import (
+    Generic,
+    Optional,
+    TypeVar
+)
+
+from plover.formatting import _Action
+
+
+_Value = TypeVar("_Value")
+
+class ActionTable(Generic[_Value]):
+    """
+    Maps actions, by identity, to values, holding only weak references to the
+    actions.
+    """
+
+    _entries: dict[int, tuple["weakref.ReferenceType[_Action]", _Value]]
+
+    def __init__(self) -> None:
+        self._entries = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, action: _Action) -> Optional[_Value]:
+        """
+        Returns the value stored for an action, if any.
+        """
+        entry: Optional[
+            tuple["weakref.ReferenceType[_Action]", _Value]
+        ] = self._entries.get(id(action))
+        if entry is None or entry[0]() is not action:
+            return None
+
+        return entry[1]
+
+    def pop(self, action: _Action) -> Optional[_Value]:
+        """
+        Removes and returns the value stored for an action, if any.
+        """
+        value: Optional[_Value] = self.get(action)
+        if value is not None:
+            del self._entries[id(action)]
+
+        return value
+
+    def set(self, action: _Action, value: _Value) -> None:
+        """
+        Stores a value for an action, replacing any value already stored.
+        """
+        key: int = id(action)
+        if key not in self._entries:
+            weakref.finalize(action, self._entries.pop, key, None)
+
+        self._entries[key] = (weakref.ref(action), value)
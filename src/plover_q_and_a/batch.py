@@ -0,0 +1,159 @@
+"""
+Batch module to re-render many transcript files at once, eg when restyling a
+whole case archive for a firm that has changed its Q&A conventions.
+
+Files are independent of each other, so they are fanned out across a pool of
+worker processes. The compiled config is handed to each worker once, when the
+worker starts, rather than with every file, and each worker streams its files
+through the same constant memory pipeline as a single transcript render.
+
+Every output file is written to a temporary file next to it first, and then
+moved into place, so a failed or interrupted render never leaves a partially
+written transcript behind.
+"""
+
+import os
+import time
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    as_completed
+)
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Iterator,
+    NamedTuple,
+    Optional
+)
+
+from . import transcript
+
+if TYPE_CHECKING:
+    from .config import Config
+
+
+class Result(NamedTuple):
+    """
+    The outcome of rendering a single transcript file.
+    """
+    input_path: Path
+    output_path: Path
+    input_bytes: int
+    seconds: float
+    error: Optional[str] = None
+
+# The config each worker process renders with, set once when it starts.
+_WORKER_CONFIG: Optional["Config"] = None
+
+def output_paths(input_paths: list[Path], output_dir: Path) -> list[Path]:
+    """
+    Returns where each input transcript gets rendered to in an output
+    directory.
+
+    Raises an error if two inputs would be rendered to the same output, or if
+    an output would overwrite its input.
+    """
+    paths: list[Path] = [output_dir / path.name for path in input_paths]
+    seen: set[Path] = set()
+    for input_path, output_path in zip(input_paths, paths):
+        resolved_path: Path = output_path.resolve()
+        if resolved_path in seen:
+            raise ValueError(
+                f"More than one transcript would be written to {output_path}"
+            )
+        if resolved_path == input_path.resolve():
+            raise ValueError(f"Transcript would overwrite itself: {input_path}")
+        seen.add(resolved_path)
+
+    return paths
+
+def render_files(
+    input_paths: list[Path],
+    output_dir: Path,
+    config: "Config",
+    jobs: int
+) -> Iterator[Result]:
+    """
+    Renders transcript files into an output directory, using up to `jobs`
+    worker processes, and yields the result for each file as it finishes.
+
+    A file that cannot be rendered gets a result with an error, rather than
+    stopping the rest from being rendered.
+    """
+    paths: list[tuple[Path, Path]] = list(
+        zip(input_paths, output_paths(input_paths, output_dir))
+    )
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if jobs <= 1 or len(paths) <= 1:
+        for input_path, output_path in paths:
+            yield render_file(input_path, output_path, config)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(paths)),
+        initializer=_start_worker,
+        initargs=(config,)
+    ) as executor:
+        futures: list[Future[Result]] = [
+            executor.submit(_render_in_worker, input_path, output_path)
+            for input_path, output_path in paths
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+def render_file(
+    input_path: Path,
+    output_path: Path,
+    config: "Config"
+) -> Result:
+    """
+    Renders a transcript file, replacing the output file only once the whole
+    transcript has been rendered.
+    """
+    start: float = time.perf_counter()
+    temporary_path: Path = output_path.with_name(
+        f"{output_path.name}.{os.getpid()}.tmp"
+    )
+    try:
+        with input_path.open(encoding="utf-8", newline="") as input_stream:
+            with temporary_path.open(
+                "w",
+                encoding="utf-8",
+                newline=""
+            ) as output_stream:
+                output_stream.writelines(
+                    transcript.render(
+                        transcript.read_chunks(input_stream),
+                        config
+                    )
+                )
+        os.replace(temporary_path, output_path)
+    except (OSError, ValueError) as exc:
+        temporary_path.unlink(missing_ok=True)
+        return Result(
+            input_path,
+            output_path,
+            0,
+            time.perf_counter() - start,
+            str(exc)
+        )
+
+    return Result(
+        input_path,
+        output_path,
+        input_path.stat().st_size,
+        time.perf_counter() - start
+    )
+
+def _start_worker(config: "Config") -> None:
+    # pylint: disable-next=global-statement
+    global _WORKER_CONFIG
+    _WORKER_CONFIG = config
+
+def _render_in_worker(input_path: Path, output_path: Path) -> Result:
+    if _WORKER_CONFIG is None:
+        raise RuntimeError("Worker process was not started with a config")
+
+    return render_file(input_path, output_path, _WORKER_CONFIG)
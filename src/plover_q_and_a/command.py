@@ -0,0 +1,85 @@
+"""
+Module to compile the raw argument string given to the Q_AND_A meta into a
+pre-validated command.
+
+The same small set of argument strings (one per dictionary entry) gets sent to
+the meta over and over again, so compiled commands are cached in a bounded LRU
+cache, keyed by the raw argument string. That way, repeat strokes skip all
+parsing and validation, and only have to render their output.
+"""
+
+from functools import lru_cache
+from typing import (
+    NamedTuple,
+    Optional
+)
+
+from . import (
+    SPEAKER_TYPES,
+    sign
+)
+
+
+RESET_CONFIG: str = "RESET_CONFIG"
+SET_NAME: str = "SET_NAME"
+SIGN: str = "SIGN"
+STATS: str = "STATS"
+
+_ARGUMENT_DIVIDER: str = ":"
+_CACHE_SIZE: int = 256
+
+class Command(NamedTuple):
+    """
+    A compiled Q_AND_A command.
+
+    `name` is one of RESET_CONFIG, SET_NAME, SIGN, or STATS. SET_NAME commands
+    carry their (speaker type or DONE) target, and SIGN commands carry their
+    parsed sign command.
+    """
+    name: str
+    set_name_target: Optional[str] = None
+    sign_command: Optional[sign.Command] = None
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse(argument: str) -> Command:
+    """
+    Parses and validates a raw Q_AND_A meta argument string into a command.
+
+    Raises an error if the argument is blank, or if any part of it is not
+    recognised.
+    """
+    if not argument:
+        raise ValueError("No command provided")
+
+    args: list[str] = argument.split(_ARGUMENT_DIVIDER)
+    command: str
+    command_args: list[str]
+    command, *command_args = args
+    command = command.strip().upper()
+
+    if not command:
+        raise ValueError("No command arguments provided")
+
+    if command == RESET_CONFIG:
+        return Command(RESET_CONFIG)
+
+    if command == STATS:
+        return Command(STATS)
+
+    if command == SET_NAME:
+        return Command(SET_NAME, set_name_target=_set_name_target(command_args))
+
+    return Command(SIGN, sign_command=sign.parse(args))
+
+def _set_name_target(command_args: list[str]) -> str:
+    if not command_args:
+        raise ValueError("No SET_NAME command arguments provided")
+
+    set_name_command: str = command_args[0].strip().upper()
+
+    if not (set_name_command in SPEAKER_TYPES or set_name_command == "DONE"):
+        raise ValueError(
+            f"Unknown SET_NAME command provided: {set_name_command}"
+        )
+
+    return set_name_command
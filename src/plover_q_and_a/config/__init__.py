@@ -1,18 +1,79 @@
 """
 Config - a package dealing with importing JSON data containing sign output
 customisations, munging it into app configuration, and then managing it.
+
+Loading config pulls in a lot of code that is not needed until the config
+reloader thread first runs (or, for the watcher, might never be needed at all),
+so each of the package's attributes only gets imported the first time it is
+used, rather than when Plover starts.
 """
 
 __all__ = [
     "CONFIG_BASENAME",
+    "SNAPSHOT_BASENAME",
+    "Affixes",
+    "Config",
+    "Endings",
+    "Reloader",
+    "Watcher",
     "load",
+    "load_if_changed",
+    "merge",
     "reload"
 ]
 
-from .loader import (
-    load,
-    reload
+import importlib
+from typing import (
+    TYPE_CHECKING,
+    Any
 )
 
+if TYPE_CHECKING:
+    from .app_config import (
+        Affixes,
+        Config,
+        Endings
+    )
+    from .loader import (
+        load,
+        load_if_changed,
+        merge,
+        reload
+    )
+    from .reloader import Reloader
+    from .watcher import Watcher
+
 
 CONFIG_BASENAME: str = "q_and_a.json"
+SNAPSHOT_BASENAME: str = "q_and_a.snapshot"
+
+_ATTRIBUTE_MODULES: dict[str, str] = {
+    "Affixes": "app_config",
+    "Config": "app_config",
+    "Endings": "app_config",
+    "Reloader": "reloader",
+    "Watcher": "watcher",
+    "load": "loader",
+    "load_if_changed": "loader",
+    "merge": "loader",
+    "reload": "loader"
+}
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports a package attribute from its module the first time it is used, and
+    then keeps it, so that later uses are plain attribute reads.
+    """
+    try:
+        module_name: str = _ATTRIBUTE_MODULES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    value: Any = getattr(
+        importlib.import_module(f".{module_name}", __name__),
+        name
+    )
+    globals()[name] = value
+    return value
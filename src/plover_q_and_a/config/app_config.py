@@ -0,0 +1,60 @@
+"""
+Module defining the application-wide config that the JSON config file gets
+compiled into.
+
+Config is immutable: everything that can be worked out from the config file is
+resolved up front into plain strings and small tuples, and any change (like
+setting a speaker name) creates a new config with `_replace`.
+"""
+
+from types import MappingProxyType
+from typing import (
+    Mapping,
+    NamedTuple,
+    Optional
+)
+
+from ..sign.speaker_signs import SpeakerSigns
+from ..sign.transitions import Transitions
+from .identity import Identity
+
+
+class Affixes(NamedTuple):
+    """
+    The text that goes either side of a speaker name.
+    """
+    pre: str
+    post: str
+
+class Endings(NamedTuple):
+    """
+    The resolved sentence endings for a single sign type.
+    """
+    interrogative_yield: str
+    statement_yield: str
+    statement_elaborate: str
+    interrupt_yield: str
+
+class Config(NamedTuple):
+    """
+    Application-wide config.
+
+    `endings` holds the sentence endings to use after each sign type (and
+    after no sign at all, under `None`), and `speaker_signs` holds the
+    pre-rendered byline and speaker text for each speaker in `speaker_names`.
+    """
+    question_marker: str
+    answer_marker: str
+    question_byline: Affixes
+    answer_byline: Affixes
+    speaker_marker: Affixes
+    speaker_names: Mapping[str, str]
+    speaker_upcase: bool
+    endings: Mapping[Optional[str], Endings]
+    set_name_prompt: str
+    watch_config: bool
+    reload_debounce: float
+    collect_stats: bool
+    speaker_signs: Mapping[str, SpeakerSigns] = MappingProxyType({})
+    transitions: Optional[Transitions] = None
+    file_identity: Optional[Identity] = None
@@ -4,7 +4,10 @@ Module to handle extracting config from JSON files
 
 import json
 from pathlib import Path
-from typing import Any
+from typing import (
+    Any,
+    Optional
+)
 
 
 def load(filepath: Path) -> dict[str, Any]:
@@ -13,13 +16,29 @@ def load(filepath: Path) -> dict[str, Any]:
 
     Raises an error if the specified config file is not JSON format.
     """
-    data: dict[str, Any]
+    return parse(read(filepath))
+
+def read(filepath: Path) -> Optional[bytes]:
+    """
+    Reads in the raw contents of a file, or nothing if the file does not exist.
+    """
     try:
-        with filepath.open(encoding="utf-8") as file:
-            data = json.load(file)
-            file.close()
+        return filepath.read_bytes()
     except FileNotFoundError:
-        data = {}
+        return None
+
+def parse(contents: Optional[bytes]) -> dict[str, Any]:
+    """
+    Parses data from the raw contents of a JSON file
+
+    Raises an error if the contents are not JSON format.
+    """
+    if contents is None:
+        return {}
+
+    data: dict[str, Any]
+    try:
+        data = json.loads(contents.decode("utf-8"))
     except json.JSONDecodeError as exc:
         raise ValueError("Unable to decode file contents as JSON") from exc
 
@@ -0,0 +1,59 @@
+"""
+Module to handle identifying the contents of a config file, so that a file that
+has not changed does not need to be parsed and transformed again.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import (
+    NamedTuple,
+    Optional
+)
+
+
+# Stat values for a file that does not exist
+_MISSING_MTIME_NS: int = -1
+_MISSING_SIZE: int = -1
+
+class Identity(NamedTuple):
+    """
+    The modification time, size, and content hash of a file.
+    """
+    mtime_ns: int
+    size: int
+    digest: str
+
+def stat(filepath: Path) -> tuple[int, int]:
+    """
+    Returns the modification time and size of a file.
+
+    NOTE: A file should be stat-ed *before* it is read, so that any change made
+    in between is picked up on the next check.
+    """
+    try:
+        file_stat: os.stat_result = filepath.stat()
+    except FileNotFoundError:
+        return (_MISSING_MTIME_NS, _MISSING_SIZE)
+
+    return (file_stat.st_mtime_ns, file_stat.st_size)
+
+def identify(file_stat: tuple[int, int], contents: Optional[bytes]) -> Identity:
+    """
+    Creates the identity of a file from its stat values and contents.
+    """
+    digest: str = (
+        "" if contents is None else hashlib.sha256(contents).hexdigest()
+    )
+    mtime_ns: int
+    size: int
+    mtime_ns, size = file_stat
+
+    return Identity(mtime_ns, size, digest)
+
+def matches_stat(file_identity: Identity, file_stat: tuple[int, int]) -> bool:
+    """
+    Checks whether a file has the same modification time and size as when its
+    identity was created.
+    """
+    return (file_identity.mtime_ns, file_identity.size) == file_stat
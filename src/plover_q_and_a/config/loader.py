@@ -4,170 +4,140 @@ Module to handle reading in the application JSON config file.
 
 from pathlib import Path
 from typing import (
-    Any,
-    Callable,
-    Optional,
-    cast
+    Mapping,
+    Optional
 )
 
+from .. import sign
+from .app_config import Config
 from . import (
     extractor,
+    identity,
+    snapshot,
     transformer
 )
 
 
-def load(config_path: Path) -> dict[str, Any]:
+def load(
+    config_path: Path,
+    snapshot_path: Optional[Path] = None
+) -> Config:
     """
     Reads in the config JSON file, munges the data into application-wide config,
     and provides defaults in case values aren't specified.
 
+    If a snapshot path is given, and the config file exists, a compiled
+    snapshot of the config is used instead if it was made from the same file
+    contents, and (re)written if not.
+
     Raises an error if the specified config file is not JSON format.
     """
-    config_data: dict[str, Any] = extractor.load(config_path)
-    config: transformer.TransformedData = transformer.transform(config_data)
-
-    return {
-        "QUESTION": config["question_marker"],
-        "QUESTION_FOLLOWING_INTERROGATIVE": lambda current_sign_type: (
-            cast(
-                Callable[[Optional[str]], str],
-                config["interrogative_yield"]
-            )(current_sign_type)
-            + cast(str, config["question_marker"])
-        ),
-        "QUESTION_FOLLOWING_STATEMENT": lambda current_sign_type: (
-            cast(
-                Callable[[Optional[str]], str],
-                config["statement_yield"]
-            )(current_sign_type)
-            + cast(str, config["question_marker"])
-        ),
-        "QUESTION_FOLLOWING_INTERRUPT": lambda current_sign_type: (
-            cast(
-                Callable[[Optional[str]], str],
-                config["interrupt_yield"]
-            )(current_sign_type)
-            + cast(str, config["question_marker"])
-        ),
-        "ANSWER_FOLLOWING_INTERROGATIVE": lambda current_sign_type: (
-            cast(
-                Callable[[Optional[str]], str],
-                config["interrogative_yield"]
-            )(current_sign_type)
-            + cast(str, config["answer_marker"])
-        ),
-        "ANSWER_FOLLOWING_STATEMENT": lambda current_sign_type: (
-            cast(
-                Callable[[Optional[str]], str],
-                config["statement_yield"]
-            )(current_sign_type)
-            + cast(str, config["answer_marker"])
-        ),
-        "ANSWER_FOLLOWING_INTERRUPT": lambda current_sign_type: (
-            cast(
-                Callable[[Optional[str]], str],
-                config["interrupt_yield"]
-            )(current_sign_type)
-            + cast(str, config["answer_marker"])
-        ),
-        "BYLINE_FOR": config["byline_marker"],
-        "BYLINE_FOLLOWING_INTERROGATIVE_FOR": (
-            lambda current_sign_type, speaker_type, speaker_name: (
-                cast(
-                    Callable[[Optional[str]], str],
-                    config["interrogative_yield"]
-                )(current_sign_type)
-                + cast(
-                    Callable[[str, str], str],
-                    config["byline_marker"]
-                )(speaker_type, speaker_name)
-            )
-        ),
-        "BYLINE_FOLLOWING_STATEMENT_FOR": (
-            lambda current_sign_type, speaker_type, speaker_name: (
-                cast(
-                    Callable[[Optional[str]], str],
-                    config["statement_yield"]
-                )(current_sign_type)
-                + cast(
-                    Callable[[str, str], str],
-                    config["byline_marker"]
-                )(speaker_type, speaker_name)
-            )
-        ),
-        "BYLINE_FOLLOWING_INTERRUPT_FOR": (
-            lambda current_sign_type, speaker_type, speaker_name: (
-                cast(
-                    Callable[[Optional[str]], str],
-                    config["interrupt_yield"]
-                )(current_sign_type)
-                + cast(
-                    Callable[[str, str], str],
-                    config["byline_marker"]
-                )(speaker_type, speaker_name)
-            )
-        ),
-        "SPEAKER_FOR": config["speaker_marker"],
-        "SPEAKER_FOLLOWING_INTERROGATIVE_FOR": (
-            lambda current_sign_type, speaker_name: (
-                cast(
-                    Callable[[Optional[str]], str],
-                    config["interrogative_yield"]
-                )(current_sign_type)
-                + cast(
-                    Callable[[str], str],
-                    config["speaker_marker"]
-                )(speaker_name)
-            )
-        ),
-        "SPEAKER_FOLLOWING_STATEMENT_FOR": (
-            lambda current_sign_type, speaker_name: (
-                cast(
-                    Callable[[Optional[str]], str],
-                    config["statement_yield"]
-                )(current_sign_type)
-                + cast(
-                    Callable[[str], str],
-                    config["speaker_marker"]
-                )(speaker_name)
-            )
-        ),
-        "SPEAKER_FOLLOWING_INTERRUPT_FOR": (
-            lambda current_sign_type, speaker_name: (
-                cast(
-                    Callable[[Optional[str]], str],
-                    config["interrupt_yield"]
-                )(current_sign_type)
-                + cast(
-                    Callable[[str], str],
-                    config["speaker_marker"]
-                )(speaker_name)
-            )
-        ),
-        "speaker_names": config["speaker_names"],
-        "SPEAKER_UPCASE": config["speaker_upcase"],
-        # NOTE: Not sure what's going on with pylint with the warning below...
-        # pylint: disable-next=unnecessary-lambda
-        "STATEMENT_ELABORATE": lambda current_sign_type: (
-            cast(
-                Callable[[Optional[str]], str],
-                config["statement_elaborate"]
-            )(current_sign_type)
-        ),
-        "SET_NAME_PROMPT": config["set_name_prompt"]
-    }
+    file_stat: tuple[int, int] = identity.stat(config_path)
+    contents: Optional[bytes] = extractor.read(config_path)
+
+    return _load(
+        contents,
+        identity.identify(file_stat, contents),
+        snapshot_path
+    )
 
 def reload(
     config_filepath: Path,
-    current_config: dict[str, Any]
-) -> dict[str, Any]:
+    current_config: Config,
+    snapshot_path: Optional[Path] = None
+) -> Config:
     """
     Reloads config from defaults, but making sure to keep any speaker name
     changes that have been made.
+
+    If the config file has not changed since the current config was loaded,
+    the current config is returned as-is.
+    """
+    new_config: Config = load_if_changed(
+        config_filepath,
+        current_config,
+        snapshot_path
+    )
+
+    if new_config is current_config:
+        return current_config
+
+    return merge(new_config, current_config)
+
+def load_if_changed(
+    config_filepath: Path,
+    current_config: Config,
+    snapshot_path: Optional[Path] = None
+) -> Config:
     """
-    new_config: dict[str, Any] = load(config_filepath)
-    new_config["speaker_names"] = (
-        new_config["speaker_names"] | current_config["speaker_names"]
+    Loads config from defaults only if the config file has changed since the
+    current config was loaded, otherwise returns the current config.
+
+    Newly loaded config does *not* keep any speaker name changes made to the
+    current config: use `merge` for that.
+    """
+    current_identity: Optional[identity.Identity] = (
+        current_config.file_identity
+    )
+    file_stat: tuple[int, int] = identity.stat(config_filepath)
+
+    if current_identity and identity.matches_stat(current_identity, file_stat):
+        return current_config
+
+    contents: Optional[bytes] = extractor.read(config_filepath)
+    file_identity: identity.Identity = identity.identify(file_stat, contents)
+
+    if current_identity and current_identity.digest == file_identity.digest:
+        # File was touched, but its contents are the same.
+        return current_config._replace(file_identity=file_identity)
+
+    return _load(contents, file_identity, snapshot_path)
+
+def merge(
+    new_config: Config,
+    current_config: Config
+) -> Config:
+    """
+    Keeps any speaker name changes made to the current config in newly loaded
+    config.
+    """
+    default_speaker_names: Mapping[str, str] = new_config.speaker_names
+    merged_config: Config = new_config
+
+    for speaker_type, speaker_name in current_config.speaker_names.items():
+        if default_speaker_names.get(speaker_type) != speaker_name:
+            merged_config = sign.speaker_signs.rename(
+                merged_config,
+                speaker_type,
+                speaker_name
+            )
+
+    return merged_config
+
+def _load(
+    contents: Optional[bytes],
+    file_identity: identity.Identity,
+    snapshot_path: Optional[Path]
+) -> Config:
+    # NOTE: Only config read from a file gets a snapshot, so that there is
+    # never a snapshot of the defaults sitting in the Plover config directory.
+    if contents is None:
+        snapshot_path = None
+
+    app_config: Optional[Config] = (
+        snapshot.read(snapshot_path, file_identity.digest)
+        if snapshot_path
+        else None
     )
 
-    return new_config
+    if app_config is None:
+        app_config = sign.speaker_signs.prerender(
+            transformer.transform(extractor.parse(contents))
+        )
+        app_config = app_config._replace(
+            transitions=sign.transitions.build(app_config)
+        )
+        if snapshot_path:
+            snapshot.write(snapshot_path, file_identity.digest, app_config)
+
+    return app_config._replace(file_identity=file_identity)
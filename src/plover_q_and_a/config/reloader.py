@@ -0,0 +1,114 @@
+"""
+Module to handle running config reloads on a dedicated background thread, so
+that the Plover engine thread never has to wait on config file I/O.
+
+Requests that arrive in a burst (eg a Plover "Reconnect" followed closely by a
+`SET_CONFIG` command) are debounced, so that they result in a single reload.
+
+A reload that fails is logged, and the thread carries on waiting for the next
+request.
+"""
+
+import logging
+import threading
+from typing import (
+    Callable,
+    Optional
+)
+
+
+_STOP_TIMEOUT_SECONDS: float = 2.0
+_THREAD_NAME: str = "plover_q_and_a_config_reloader"
+# NOTE: A child of Plover's own logger, so that messages end up in Plover's
+# log, without this module having to import Plover.
+_LOGGER: logging.Logger = logging.getLogger("plover.q_and_a")
+
+class Reloader:
+    """
+    Calls `reload` from a background thread whenever a reload is requested.
+
+    Once a request arrives, the reload waits until no further requests have
+    arrived for `debounce` seconds (which can be changed at any time).
+    Requests folded into a pending reload are counted in `suppressed_count`.
+    """
+
+    debounce: float
+    suppressed_count: int
+    _reload: Callable[[], None]
+    _pending: int
+    _stopped: bool
+    _condition: threading.Condition
+    _thread: Optional[threading.Thread]
+
+    def __init__(
+        self,
+        reload: Callable[[], None],
+        debounce: float = 0.0
+    ) -> None:
+        self.suppressed_count = 0
+        self._reload = reload
+        self.debounce = debounce
+        self._pending = 0
+        self._stopped = False
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def start(self) -> None:
+        """
+        Starts the background reload thread.
+        """
+        with self._condition:
+            self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run,
+            name=_THREAD_NAME,
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the background reload thread, and waits for any reload in
+        progress to finish.
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread:
+            self._thread.join(_STOP_TIMEOUT_SECONDS)
+            self._thread = None
+
+    def request(self) -> None:
+        """
+        Requests a reload, returning immediately.
+        """
+        with self._condition:
+            self._pending += 1
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            pending: int
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._stopped)
+                self._settle()
+                if self._stopped:
+                    return
+
+                pending, self._pending = self._pending, 0
+
+            self.suppressed_count += pending - 1
+            try:
+                self._reload()
+            # pylint: disable-next=broad-exception-caught
+            except Exception:
+                _LOGGER.exception("Q&A config reload failed")
+
+    def _settle(self) -> None:
+        # NOTE: Called with the condition held. Keep waiting for as long as new
+        # requests keep arriving within the debounce window.
+        while self.debounce > 0 and not self._stopped:
+            seen: int = self._pending
+            self._condition.wait(self.debounce)
+            if self._pending == seen:
+                return
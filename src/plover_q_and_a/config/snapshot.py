@@ -0,0 +1,184 @@
+"""
+Module to handle a compiled snapshot of the config, stored on disk next to the
+config file, so that unchanged config does not need to be compiled again every
+time Plover starts.
+
+The snapshot holds every field of the compiled config (including the
+pre-rendered speaker signs and the transitions table) as plain strings and
+tuples, so loading from it skips parsing, transforming, and rendering
+altogether. It is keyed by the content hash of the config file it was compiled
+from, and by a hash of the plugin code that compiles config. Any snapshot that
+was made from different contents, by different plugin code (eg before a plugin
+upgrade), or by a different version of Python, is ignored and rebuilt.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    Any,
+    Optional
+)
+
+from .. import sign
+from .app_config import (
+    Affixes,
+    Config,
+    Endings
+)
+
+
+# NOTE: Bump this whenever the snapshot format changes. Changes to config
+# defaults, or to the way signs are rendered, are picked up by the code hash.
+_VERSION: int = 3
+_PYTHON_VERSION: tuple[int, int] = sys.version_info[:2]
+_PACKAGE_DIR: Path = Path(__file__).resolve().parents[1]
+# The source files, relative to the package directory, whose code decides
+# what a config file compiles to.
+_COMPILING_SOURCES: tuple[str, ...] = (
+    "__init__.py",
+    "config/app_config.py",
+    "config/extractor.py",
+    "config/snapshot.py",
+    "config/transformer/*.py",
+    "sign/*.py"
+)
+
+def read(snapshot_path: Path, digest: str) -> Optional[Config]:
+    """
+    Reads in a compiled config, or nothing if there is no usable snapshot for
+    config file contents with the given digest.
+
+    The config read in has no file identity: that is up to the caller.
+    """
+    try:
+        header: Any
+        fields: tuple[Any, ...]
+        rows: tuple[Any, ...]
+        header, fields, rows = marshal.loads(snapshot_path.read_bytes())
+        if header != _header(digest):
+            return None
+
+        return _config(fields, rows)
+    except (OSError, EOFError, ValueError, TypeError, AttributeError):
+        return None
+
+def write(snapshot_path: Path, digest: str, config: Config) -> None:
+    """
+    Writes out a compiled config for config file contents with the given
+    digest.
+
+    The snapshot is only an optimisation, so failing to write it (eg to a
+    read-only config directory) is not an error.
+    """
+    fields: tuple[Any, ...] = (
+        config.question_marker,
+        config.answer_marker,
+        tuple(config.question_byline),
+        tuple(config.answer_byline),
+        tuple(config.speaker_marker),
+        dict(config.speaker_names),
+        config.speaker_upcase,
+        {
+            sign_type: tuple(sign_type_endings)
+            for sign_type, sign_type_endings in config.endings.items()
+        },
+        config.set_name_prompt,
+        config.watch_config,
+        config.reload_debounce,
+        config.collect_stats,
+        {
+            speaker_type: tuple(signs)
+            for speaker_type, signs in config.speaker_signs.items()
+        }
+    )
+    rows: tuple[Any, ...] = tuple(
+        (current_sign_type, tuple(command), sign_type, text)
+        for (
+            (current_sign_type, command),
+            (sign_type, text)
+        ) in (config.transitions or {}).items()
+    )
+    contents: bytes = marshal.dumps((_header(digest), fields, rows))
+    temporary_path: Path = snapshot_path.with_name(
+        f"{snapshot_path.name}.{os.getpid()}.tmp"
+    )
+
+    try:
+        temporary_path.write_bytes(contents)
+        os.replace(temporary_path, snapshot_path)
+    except OSError:
+        temporary_path.unlink(missing_ok=True)
+
+@lru_cache(maxsize=1)
+def _code_digest() -> str:
+    """
+    Returns a hash of the plugin code that compiles config. The code does not
+    change while Plover is running, so this is only worked out once.
+
+    Source files that cannot be read are left out.
+    """
+    code_hash = hashlib.sha256()
+    for pattern in _COMPILING_SOURCES:
+        for source_path in sorted(_PACKAGE_DIR.glob(pattern)):
+            code_hash.update(
+                source_path.relative_to(_PACKAGE_DIR).as_posix().encode()
+            )
+            try:
+                code_hash.update(source_path.read_bytes())
+            except OSError:
+                pass
+
+    return code_hash.hexdigest()
+
+def _header(digest: str) -> tuple[Any, ...]:
+    return (_VERSION, _PYTHON_VERSION, _code_digest(), digest)
+
+def _config(fields: tuple[Any, ...], rows: tuple[Any, ...]) -> Config:
+    """
+    Builds a compiled config back up from its snapshot fields, and the rows of
+    its transitions table.
+    """
+    (
+        question_marker,
+        answer_marker,
+        question_byline,
+        answer_byline,
+        speaker_marker,
+        speaker_names,
+        speaker_upcase,
+        endings,
+        set_name_prompt,
+        watch_config,
+        reload_debounce,
+        collect_stats,
+        speaker_signs
+    ) = fields
+    return Config(
+        question_marker=question_marker,
+        answer_marker=answer_marker,
+        question_byline=Affixes(*question_byline),
+        answer_byline=Affixes(*answer_byline),
+        speaker_marker=Affixes(*speaker_marker),
+        speaker_names=speaker_names,
+        speaker_upcase=speaker_upcase,
+        endings={
+            sign_type: Endings(*sign_type_endings)
+            for sign_type, sign_type_endings in endings.items()
+        },
+        set_name_prompt=set_name_prompt,
+        watch_config=watch_config,
+        reload_debounce=reload_debounce,
+        collect_stats=collect_stats,
+        speaker_signs={
+            speaker_type: sign.speaker_signs.SpeakerSigns(*signs)
+            for speaker_type, signs in speaker_signs.items()
+        },
+        transitions={
+            (current_sign_type, sign.Command(*command)): (sign_type, text)
+            for (current_sign_type, command, sign_type, text) in rows
+        }
+    )
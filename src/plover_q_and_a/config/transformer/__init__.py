@@ -7,17 +7,13 @@ __all__ = [
     "transform"
 ]
 
-from typing import (
-    Any,
-    Callable,
-    Mapping,
-    Optional,
-    Union
-)
+from typing import Any
 
+from ..app_config import Config
 from . import (
     answer,
     byline,
+    extension,
     question,
     sentence_ending,
     set_name,
@@ -25,33 +21,21 @@ from . import (
 )
 
 
-TransformedData = dict[
-    str,
-    Union[
-        str,
-        bool,
-        list[str],
-        dict[str, str],
-        Callable[[str], str],
-        Callable[[str, str], str],
-        Callable[[Optional[str]], str]
-    ]
-]
-
-def transform(data: dict[str, Any]) -> TransformedData:
+def transform(data: dict[str, Any]) -> Config:
     """
     Parse config data, providing defaults values where not provided.
     """
-    return {
-        "question_marker": question.marker(data),
-        "answer_marker": answer.marker(data),
-        "byline_marker": byline.marker(data),
-        "speaker_marker": speaker.marker(data),
-        "speaker_names": speaker.names(data),
-        "speaker_upcase": speaker.should_upcase(data),
-        "interrogative_yield": sentence_ending.interrogative_yield(data),
-        "statement_yield": sentence_ending.statement_yield(data),
-        "statement_elaborate": sentence_ending.statement_elaborate(data),
-        "interrupt_yield": sentence_ending.interrupt_yield(data),
-        "set_name_prompt": set_name.prompt(data)
-    }
+    return Config(
+        question_marker=question.marker(data),
+        answer_marker=answer.marker(data),
+        question_byline=byline.question_marker(data),
+        answer_byline=byline.answer_marker(data),
+        speaker_marker=speaker.marker(data),
+        speaker_names=speaker.names(data),
+        speaker_upcase=speaker.should_upcase(data),
+        endings=sentence_ending.resolve(data),
+        set_name_prompt=set_name.prompt(data),
+        watch_config=extension.watch_config(data),
+        reload_debounce=extension.reload_debounce(data),
+        collect_stats=extension.collect_stats(data)
+    )
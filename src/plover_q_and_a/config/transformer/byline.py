@@ -4,10 +4,10 @@ Module to handle parsing and formatting of a byline from config.
 
 from typing import (
     Any,
-    Callable,
     cast
 )
 
+from ..app_config import Affixes
 from . import (
     answer,
     question
@@ -22,57 +22,38 @@ _BYLINE_ANSWER_PRE_FORMATTING: str = ""
 _BYLINE_ANSWER_MARKER_TEXT: str = ""
 _BYLINE_ANSWER_POST_FORMATTING: str = ""
 
-def marker(data: dict[str, Any]) -> Callable[[str, str], str]:
+def question_marker(data: dict[str, Any]) -> Affixes:
     """
-    Format an answer from config.
+    Format the text around a speaker name in a question byline from config.
     """
-    question_byline: Callable[[str], str] = _question_byline(data)
-    answer_byline: Callable[[str], str] = _answer_byline(data)
-
-    def _function(speaker_type: str, speaker_name: str) -> str:
-        if speaker_type == "WITNESS":
-            return answer_byline(speaker_name)
-
-        return question_byline(speaker_name)
-
-    return _function
-
-def _question_byline(data: dict[str, Any]) -> Callable[[str], str]:
     byline_marker: dict[str, str] = _byline_marker_for(data, "question")
-    pre_formatting: str = (
-        byline_marker.get("pre", _BYLINE_QUESTION_PRE_FORMATTING)
-    )
-    marker_text: str = byline_marker.get("text", _BYLINE_QUESTION_MARKER_TEXT)
-    post_formatting: str = (
-        byline_marker.get("post", _BYLINE_QUESTION_POST_FORMATTING)
-    )
-    byline_follow_on: str = question.marker(data)
 
-    return lambda speaker_name: (
-        pre_formatting
-        + marker_text
-        + speaker_name
-        + post_formatting
-        + byline_follow_on
+    return Affixes(
+        pre=(
+            byline_marker.get("pre", _BYLINE_QUESTION_PRE_FORMATTING)
+            + byline_marker.get("text", _BYLINE_QUESTION_MARKER_TEXT)
+        ),
+        post=(
+            byline_marker.get("post", _BYLINE_QUESTION_POST_FORMATTING)
+            + question.marker(data)
+        )
     )
 
-def _answer_byline(data: dict[str, Any]) -> Callable[[str], str]:
+def answer_marker(data: dict[str, Any]) -> Affixes:
+    """
+    Format the text around a speaker name in an answer byline from config.
+    """
     byline_marker: dict[str, str] = _byline_marker_for(data, "answer")
-    pre_formatting: str = (
-        byline_marker.get("pre", _BYLINE_ANSWER_PRE_FORMATTING)
-    )
-    marker_text: str = byline_marker.get("text", _BYLINE_ANSWER_MARKER_TEXT)
-    post_formatting: str = (
-        byline_marker.get("post", _BYLINE_ANSWER_POST_FORMATTING)
-    )
-    byline_follow_on: str = answer.marker(data)
 
-    return lambda speaker_name: (
-        pre_formatting
-        + marker_text
-        + speaker_name
-        + post_formatting
-        + byline_follow_on
+    return Affixes(
+        pre=(
+            byline_marker.get("pre", _BYLINE_ANSWER_PRE_FORMATTING)
+            + byline_marker.get("text", _BYLINE_ANSWER_MARKER_TEXT)
+        ),
+        post=(
+            byline_marker.get("post", _BYLINE_ANSWER_POST_FORMATTING)
+            + answer.marker(data)
+        )
     )
 
 def _byline_marker_for(
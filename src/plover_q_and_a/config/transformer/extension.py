@@ -0,0 +1,44 @@
+"""
+Module to handle parsing of settings for the Plover extension itself from
+config.
+"""
+
+from typing import (
+    Any,
+    cast
+)
+
+
+# Default values
+_WATCH_CONFIG: bool = False
+_RELOAD_DEBOUNCE_MS: int = 100
+_COLLECT_STATS: bool = False
+
+def watch_config(data: dict[str, Any]) -> bool:
+    """
+    Get config value that determines whether to watch the config file for
+    changes, and reload it as soon as it is saved.
+    """
+    return cast(bool, _extension(data).get("watch_config", _WATCH_CONFIG))
+
+def reload_debounce(data: dict[str, Any]) -> float:
+    """
+    Get config value that determines how long, in seconds, to wait for further
+    reload requests before reloading the config file, so that a burst of
+    requests results in only a single reload.
+    """
+    debounce_ms: int = cast(
+        int,
+        _extension(data).get("reload_debounce_ms", _RELOAD_DEBOUNCE_MS)
+    )
+    return max(debounce_ms, 0) / 1000
+
+def collect_stats(data: dict[str, Any]) -> bool:
+    """
+    Get config value that determines whether to record how long each Q_AND_A
+    command takes.
+    """
+    return cast(bool, _extension(data).get("collect_stats", _COLLECT_STATS))
+
+def _extension(data: dict[str, Any]) -> dict[str, Any]:
+    return cast(dict[str, Any], data.get("extension") or {})
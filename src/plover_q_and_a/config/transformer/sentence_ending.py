@@ -1,14 +1,18 @@
 """
 Module to handle parsing and formatting of sentence endings from config.
+
+The sentence endings for each known sign type get resolved up front, so that
+formatting an ending at runtime is only a lookup.
 """
 
 from typing import (
     Any,
-    Callable,
     Optional,
     cast
 )
 
+from ..app_config import Endings
+
 
 # Default values
 _INTERROGATIVE_END_MARKER: str = "?"
@@ -17,86 +21,57 @@ _INTERRUPT_MARKER: str = " --"
 _YIELD_MARKER: str = "\n"
 _SENTENCE_SPACE: str = " "
 
-def interrogative_yield(data: dict[str, Any]) -> Callable[[Optional[str]], str]:
-    """
-    Format a sentence ending interrogative from config.
-    """
-    def _function(current_sign_type: Optional[str]) -> str:
-        sign_type_ending: dict[str, str] = _sign_type_ending(
-            current_sign_type,
-            data
-        )
-
-        return (
-            sign_type_ending.get("interrogative", _INTERROGATIVE_END_MARKER)
-            + _yield_marker(sign_type_ending)
-        )
-
-    return _function
-
-def statement_elaborate(data: dict[str, Any]) -> Callable[[str], str]:
-    """
-    Format an elaborating sentence ending question from config.
-    """
-    def _function(current_sign_type: Optional[str]) -> str:
-        sign_type_ending: dict[str, str] = _sign_type_ending(
-            current_sign_type,
-            data
-        )
-
-        return (
-            _statement_end_marker(sign_type_ending)
-            + cast(str, data.get("sentence_space", _SENTENCE_SPACE))
-        )
+_SIGN_TYPES: tuple[str, ...] = (
+    "QUESTION",
+    "ANSWER",
+    "SPEAKER"
+)
 
-    return _function
+SignTypeEndings = dict[Optional[str], Endings]
 
-def statement_yield(data: dict[str, Any]) -> Callable[[str], str]:
+def resolve(data: dict[str, Any]) -> SignTypeEndings:
     """
-    Format an yielding sentence ending question from config.
+    Resolve the sentence endings from config for each known sign type, as well
+    as for when there is no current sign type.
     """
-    def _function(current_sign_type: Optional[str]) -> str:
-        sign_type_ending: dict[str, str] = _sign_type_ending(
-            current_sign_type,
-            data
+    sentence_space: str = cast(str, data.get("sentence_space", _SENTENCE_SPACE))
+    sign_type_endings: SignTypeEndings = {
+        None: _endings({}, sentence_space)
+    }
+
+    for sign_type in _SIGN_TYPES:
+        sign_type_endings[sign_type] = _endings(
+            _sign_type_ending(sign_type, data),
+            sentence_space
         )
 
-        return (
-            _statement_end_marker(sign_type_ending)
-            + _yield_marker(sign_type_ending)
-        )
+    return sign_type_endings
 
-    return _function
+def _endings(
+    sign_type_ending: dict[str, str],
+    sentence_space: str
+) -> Endings:
+    yield_marker: str = sign_type_ending.get("yield", _YIELD_MARKER)
+    statement_end_marker: str = (
+        sign_type_ending.get("statement", _STATEMENT_END_MARKER)
+    )
 
-def interrupt_yield(data: dict[str, Any]) -> Callable[[str], str]:
-    """
-    Format a sentence ending interruption from config.
-    """
-    def _function(current_sign_type: Optional[str]) -> str:
-        sign_type_ending: dict[str, str] = _sign_type_ending(
-            current_sign_type,
-            data
-        )
-
-        return (
+    return Endings(
+        interrogative_yield=(
+            sign_type_ending.get("interrogative", _INTERROGATIVE_END_MARKER)
+            + yield_marker
+        ),
+        statement_yield=statement_end_marker + yield_marker,
+        statement_elaborate=statement_end_marker + sentence_space,
+        interrupt_yield=(
             sign_type_ending.get("interrupt", _INTERRUPT_MARKER)
-            + _yield_marker(sign_type_ending)
+            + yield_marker
         )
+    )
 
-    return _function
-
-def _sign_type_ending(
-    current_sign_type: Optional[str],
-    data: dict[str, Any]
-) -> dict[str, str]:
-    if not current_sign_type:
-        return {}
-
+def _sign_type_ending(sign_type: str, data: dict[str, Any]) -> dict[str, str]:
     # REF: https://stackoverflow.com/a/77230846/567863
-    return (data.get(current_sign_type.lower()) or {}).get("ending") or {}
-
-def _statement_end_marker(sign_type_ending: dict[str, str]) -> str:
-    return sign_type_ending.get("statement", _STATEMENT_END_MARKER)
-
-def _yield_marker(sign_type_ending: dict[str, str]) -> str:
-    return sign_type_ending.get("yield", _YIELD_MARKER)
+    return cast(
+        dict[str, str],
+        (data.get(sign_type.lower()) or {}).get("ending") or {}
+    )
@@ -4,11 +4,12 @@ Module to handle parsing and formatting of a byline from config.
 
 from typing import (
     Any,
-    Callable,
     Union,
     cast
 )
 
+from ..app_config import Affixes
+
 
 # Default values
 
@@ -33,22 +34,18 @@ _BAILIFF_NAME: str = "THE BAILIFF"
 
 _SpeakerMarker = dict[str, Union[str, bool]]
 
-def marker(data: dict[str, Any]) -> Callable[[str], str]:
+def marker(data: dict[str, Any]) -> Affixes:
     """
-    Format a speaker from config.
+    Format the text around a speaker name from config.
     """
     speaker_marker: _SpeakerMarker = _speaker_marker(data)
-    pre_formatting: str = cast(
-        str,
-        speaker_marker.get("pre", _SPEAKER_NAME_PRE_FORMATTING)
-    )
-    post_formatting: str = cast(
-        str,
-        speaker_marker.get("post", _SPEAKER_NAME_POST_FORMATTING)
-    )
 
-    return lambda speaker_name: (
-        pre_formatting + speaker_name + post_formatting
+    return Affixes(
+        pre=cast(str, speaker_marker.get("pre", _SPEAKER_NAME_PRE_FORMATTING)),
+        post=cast(
+            str,
+            speaker_marker.get("post", _SPEAKER_NAME_POST_FORMATTING)
+        )
     )
 
 def names(data: dict[str, Any]) -> dict[str, str]:
@@ -0,0 +1,174 @@
+"""
+Module to handle watching the config file for changes in a background thread.
+
+On Linux, inotify is used to be told about changes as soon as they happen. On
+other platforms, or if inotify is not available, the config file is polled for
+changes instead.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import (
+    Callable,
+    Optional
+)
+
+from . import identity
+
+
+_POLL_INTERVAL_SECONDS: float = 1.0
+_STOP_TIMEOUT_SECONDS: float = 2.0
+_THREAD_NAME: str = "plover_q_and_a_config_watcher"
+
+# inotify constants from <sys/inotify.h>
+_IN_CLOSE_WRITE: int = 0x00000008
+_IN_MOVED_FROM: int = 0x00000040
+_IN_MOVED_TO: int = 0x00000080
+_IN_DELETE: int = 0x00000200
+_IN_CLOEXEC: int = 0o2000000
+# NOTE: The config file directory is watched, rather than the file itself,
+# since many editors save files by writing a new file and then renaming it
+# over the top of the old one.
+_IN_WATCH_MASK: int = (
+    _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_DELETE
+)
+_IN_EVENT_HEADER: struct.Struct = struct.Struct("iIII")
+_IN_READ_SIZE: int = 64 * 1024
+
+class Watcher:
+    """
+    Calls `on_change` from a background thread whenever the watched file is
+    changed, created, or deleted.
+    """
+
+    _filepath: Path
+    _on_change: Callable[[], None]
+    _poll_interval: float
+    _stopped: threading.Event
+    _thread: Optional[threading.Thread]
+    _inotify_fd: Optional[int]
+    _wake_fds: Optional[tuple[int, int]]
+
+    def __init__(
+        self,
+        filepath: Path,
+        on_change: Callable[[], None],
+        poll_interval: float = _POLL_INTERVAL_SECONDS
+    ) -> None:
+        self._filepath = filepath
+        self._on_change = on_change
+        self._poll_interval = poll_interval
+        self._stopped = threading.Event()
+        self._thread = None
+        self._inotify_fd = None
+        self._wake_fds = None
+
+    def start(self) -> None:
+        """
+        Starts watching the file in a background thread.
+        """
+        self._stopped.clear()
+        self._inotify_fd = _inotify_watch(self._filepath.parent)
+        if self._inotify_fd is None:
+            self._thread = threading.Thread(
+                target=self._poll,
+                args=(identity.stat(self._filepath),),
+                name=_THREAD_NAME,
+                daemon=True
+            )
+        else:
+            self._wake_fds = os.pipe()
+            self._thread = threading.Thread(
+                target=self._notify,
+                args=(self._inotify_fd, self._wake_fds[0]),
+                name=_THREAD_NAME,
+                daemon=True
+            )
+
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops watching the file, and waits for the background thread to finish.
+        """
+        self._stopped.set()
+        if self._wake_fds:
+            os.write(self._wake_fds[1], b"\0")
+
+        if self._thread:
+            self._thread.join(_STOP_TIMEOUT_SECONDS)
+            self._thread = None
+
+        for file_descriptor in (self._inotify_fd, *(self._wake_fds or ())):
+            if file_descriptor is not None:
+                os.close(file_descriptor)
+
+        self._inotify_fd = None
+        self._wake_fds = None
+
+    def _notify(self, inotify_fd: int, wake_fd: int) -> None:
+        while not self._stopped.is_set():
+            readable: list[int]
+            readable, _writable, _errored = select.select(
+                [inotify_fd, wake_fd],
+                [],
+                []
+            )
+            if wake_fd in readable:
+                break
+
+            events: bytes = os.read(inotify_fd, _IN_READ_SIZE)
+            if self._filepath.name in _event_names(events):
+                self._on_change()
+
+    def _poll(self, file_stat: tuple[int, int]) -> None:
+        while not self._stopped.wait(self._poll_interval):
+            new_file_stat: tuple[int, int] = identity.stat(self._filepath)
+            if new_file_stat != file_stat:
+                file_stat = new_file_stat
+                self._on_change()
+
+def _inotify_watch(directory: Path) -> Optional[int]:
+    if not sys.platform.startswith("linux"):
+        return None
+
+    library_name: Optional[str] = ctypes.util.find_library("c")
+    try:
+        libc: ctypes.CDLL = ctypes.CDLL(library_name, use_errno=True)
+        inotify_fd: int = libc.inotify_init1(_IN_CLOEXEC)
+    except (AttributeError, OSError):
+        return None
+
+    if inotify_fd < 0:
+        return None
+
+    watch_descriptor: int = libc.inotify_add_watch(
+        inotify_fd,
+        os.fsencode(directory),
+        _IN_WATCH_MASK
+    )
+    if watch_descriptor < 0:
+        os.close(inotify_fd)
+        return None
+
+    return inotify_fd
+
+def _event_names(events: bytes) -> set[str]:
+    names: set[str] = set()
+    offset: int = 0
+
+    while offset + _IN_EVENT_HEADER.size <= len(events):
+        name_length: int
+        *_header, name_length = _IN_EVENT_HEADER.unpack_from(events, offset)
+        offset += _IN_EVENT_HEADER.size
+        name: bytes = events[offset:offset + name_length].rstrip(b"\0")
+        names.add(os.fsdecode(name))
+        offset += name_length
+
+    return names
@@ -0,0 +1,96 @@
+"""
+Engine module to run Q_AND_A commands without Plover.
+
+An engine holds a compiled config, and the sign type that the last sign left
+the transcript in, and turns each command fed to it into the text for that
+command, eg:
+
+    q_and_a_engine = Engine(config.load(Path("q_and_a.json")))
+    q_and_a_engine.feed("QUESTION:INITIAL")
+    q_and_a_engine.feed("ANSWER:FOLLOWING_INTERROGATIVE")
+
+Nothing here (or anything it imports) depends on Plover, so Q&A formatting can
+run at full speed in batch jobs, benchmarks, and other tools. The Plover
+extension is an adapter over an engine, which adds the things that only make
+sense inside Plover: undo, the SET_NAME prompt, and reloading the config file.
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    Optional
+)
+
+from . import (
+    SPEAKER_TYPES,
+    command,
+    sign
+)
+
+if TYPE_CHECKING:
+    from .config import Config
+
+
+class Engine:
+    """
+    Turns Q_AND_A commands into text, using a compiled config.
+    """
+
+    config: "Config"
+    sign_type: Optional[str]
+
+    def __init__(
+        self,
+        config: "Config",
+        sign_type: Optional[str] = None
+    ) -> None:
+        self.config = config
+        self.sign_type = sign_type
+
+    def feed(self, argument: str) -> str:
+        """
+        Runs a Q_AND_A command, given as the argument string that would follow
+        `{:Q_AND_A:` in a dictionary entry, and returns its text.
+
+        Raises an error if the argument is not a sign command: other commands
+        need Plover to run.
+        """
+        q_and_a_command: command.Command = command.parse(argument)
+        if q_and_a_command.sign_command is None:
+            raise ValueError(
+                f"{q_and_a_command.name} commands can only be run in Plover"
+            )
+
+        return self.sign(q_and_a_command.sign_command)
+
+    def sign(self, sign_command: sign.Command) -> str:
+        """
+        Renders an already parsed sign command, and moves on to the sign type
+        it results in.
+        """
+        text: str
+        (self.sign_type, text) = sign.transitions.lookup(
+            self.sign_type,
+            sign_command,
+            self.config
+        )
+
+        return text
+
+    def set_name(self, speaker_type: str, speaker_name: str) -> None:
+        """
+        Changes the name of a speaker, upper-casing it if the config says so.
+
+        Raises an error if the speaker type is not recognised.
+        """
+        speaker_type = speaker_type.strip().upper()
+        if speaker_type not in SPEAKER_TYPES:
+            raise ValueError(f"Unknown speaker type provided: {speaker_type}")
+
+        if self.config.speaker_upcase:
+            speaker_name = speaker_name.upper()
+
+        self.config = sign.speaker_signs.rename(
+            self.config,
+            speaker_type,
+            speaker_name
+        )
@@ -6,9 +6,15 @@ Plover entry point extension module.
 """
 
 from pathlib import Path
-from typing import Optional
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    cast
+)
 
-from plover.engine import StenoEngine
+from plover import log
 from plover.formatting import (
     _Action,
     Case,
@@ -19,42 +25,93 @@ from plover.oslayer.config import CONFIG_DIR
 from plover.registry import registry
 
 from . import (
+    command,
     config,
     sign,
-    speaker
+    speaker,
+    stats,
+    warm_up
 )
+from .engine import Engine
+
+if TYPE_CHECKING:
+    from plover.engine import StenoEngine
 
 
-_ARGUMENT_DIVIDER: str = ":"
 _CONFIG_FILE: Path = Path(CONFIG_DIR) / config.CONFIG_BASENAME
+_SNAPSHOT_FILE: Path = Path(CONFIG_DIR) / config.SNAPSHOT_BASENAME
+_STATS_FILE: Path = Path(CONFIG_DIR) / stats.FILENAME
+_SET_CONFIG: str = "SET_CONFIG"
 
+# pylint: disable-next=too-many-instance-attributes
 class QAndA:
     """
     Extension class that also registers a meta plugin.
-    The meta deals with creating the Q&A sign outputs, and the extension wrapper
-    around it is needed in order to:
+    The meta is an adapter over a Q&A engine, which creates the Q&A sign
+    outputs, and the extension wrapper around it is needed in order to:
 
         - Read in a config file so that all facets of the Q&A formatting can be
           customised
         - Re-read in the config file whenever the following occur:
             - The Plover UI "Reconnect" button is pressed
             - a SET_CONFIG command is send via a chord
+            - the config file is saved (only if "watch_config" is enabled)
+
+    The config is loaded lazily: the meta is registered straight away, and the
+    config is loaded either by the config reloader thread as soon as it starts,
+    or by the first Q_AND_A stroke, whichever comes first.
+
+    If "collect_stats" is enabled, the time taken by each Q_AND_A command is
+    recorded, and written out on a STATS command, and when Plover stops.
+
+    The config, snapshot, and stats files live in the Plover config directory,
+    unless other ones are given (eg by tools that drive the extension without
+    Plover). Given no snapshot file, no snapshot is kept.
     """
 
-    _engine: StenoEngine
-    _config: dict[str, str]
-    _current_sign_type: Optional[str]
+    _engine: "StenoEngine"
+    _config_file: Path
+    _snapshot_file: Optional[Path]
+    _stats_file: Path
+    _sign_engine: Optional[Engine]
+    _config_lock: threading.Lock
+    _config_reloader: config.Reloader
+    _config_watcher: Optional["config.Watcher"]
+    _sign_history: sign.History
+    _set_name_prompts: speaker.Prompts
+    _stats: Optional[stats.Stats]
 
-    def __init__(self, engine: StenoEngine) -> None:
+    def __init__(
+        self,
+        engine: "StenoEngine",
+        config_file: Path = _CONFIG_FILE,
+        snapshot_file: Optional[Path] = _SNAPSHOT_FILE,
+        stats_file: Path = _STATS_FILE
+    ) -> None:
         self._engine = engine
+        self._config_file = config_file
+        self._snapshot_file = snapshot_file
+        self._stats_file = stats_file
+        self._config_lock = threading.Lock()
+        self._config_watcher = None
 
     def start(self) -> None:
         """
         Sets up the meta plugin and steno engine hooks
         """
-        self._config = config.load(_CONFIG_FILE)
-        self._current_sign_type = None
+        self._sign_engine = None
+        self._stats = None
+        self._sign_history = sign.History()
+        self._set_name_prompts = speaker.Prompts()
+        # NOTE: Register the meta before the first reload can run, so that
+        # the timed meta registered for "collect_stats" is never overwritten.
         registry.register_plugin("meta", "Q_AND_A", self._q_and_a)
+        self._config_reloader = config.Reloader(self._reload_config)
+        self._config_reloader.start()
+        # NOTE: The first reload doubles as a background warm-up that loads
+        # the config, and runs every command, before the first Q_AND_A stroke
+        # needs them.
+        self._config_reloader.request()
         self._engine.hook_connect("translated", self._translated)
         self._engine.hook_connect(
             "machine_state_changed",
@@ -65,6 +122,12 @@ class QAndA:
         """
         Tears down the steno engine hooks
         """
+        self._config_reloader.stop()
+        if self._config_watcher:
+            self._config_watcher.stop()
+            self._config_watcher = None
+        if self._stats:
+            self._write_stats()
         self._engine.hook_disconnect("translated", self._translated)
         self._engine.hook_disconnect(
             "machine_state_changed",
@@ -75,40 +138,58 @@ class QAndA:
         """
         Delegates to meta module to generate the sign to assign to an action.
         """
-        if not argument:
-            raise ValueError("No command provided")
-
-        args: list[str] = argument.split(_ARGUMENT_DIVIDER)
-        command: str
-        command_args: list[str]
-        command, *command_args = args
-        command = command.strip().upper()
-
-        if not command:
-            raise ValueError("No command arguments provided")
-
+        q_and_a_command: command.Command = command.parse(argument)
         action: _Action = ctx.new_action()
 
-        if command == "RESET_CONFIG":
-            self._config = config.load(_CONFIG_FILE)
-        elif command == "SET_NAME":
-            speaker.set_name(command_args, ctx, action, self._config)
+        if q_and_a_command.name == command.RESET_CONFIG:
+            new_config: config.Config = config.load(
+                self._config_file,
+                self._snapshot_file
+            )
+            with self._config_lock:
+                self._publish_config(new_config)
+        elif q_and_a_command.name == command.STATS:
+            self._write_stats()
+        elif q_and_a_command.name == command.SET_NAME:
+            self._loaded_engine()
+            with self._config_lock:
+                self._publish_config(
+                    speaker.set_name(
+                        cast(str, q_and_a_command.set_name_target),
+                        ctx,
+                        action,
+                        cast(Engine, self._sign_engine).config,
+                        self._set_name_prompts
+                    )
+                )
         else:
-            current_sign_type: str
-            text: str
-            (current_sign_type, text) = sign.text(
-                self._current_sign_type,
-                args,
-                self._config
+            # NOTE: Plover can undo signs, so the sign type to follow on from
+            # comes from the sign history, rather than the engine's own.
+            sign_engine: Engine = self._loaded_engine()
+            sign_engine.sign_type = self._sign_history.current_sign_type(ctx)
+            action.text = sign_engine.sign(
+                cast(sign.Command, q_and_a_command.sign_command)
             )
-            self._current_sign_type = current_sign_type
-            action.text = text
+            self._sign_history.push(action, cast(str, sign_engine.sign_type))
             action.prev_attach = True
             action.next_attach = True
             action.next_case = Case.CAP_FIRST_WORD
 
         return action
 
+    def _timed_q_and_a(self, ctx: _Context, argument: str) -> _Action:
+        """
+        The meta that gets registered instead of `_q_and_a` while stats are
+        being collected.
+        """
+        start: int = time.perf_counter_ns()
+        action: _Action = self._q_and_a(ctx, argument)
+        collected_stats: Optional[stats.Stats] = self._stats
+        if collected_stats:
+            collected_stats.record(argument, time.perf_counter_ns() - start)
+
+        return action
+
     def _machine_state_changed(
         self,
         _machine_type: str,
@@ -119,20 +200,162 @@ class QAndA:
         pressed, so also reload the config when that happens.
         """
         if machine_state == STATE_RUNNING:
-            self._config = config.reload(_CONFIG_FILE, self._config)
+            self._config_reloader.request()
 
-    def _translated(self, _old: list[_Action], new: list[_Action]) -> None:
+    def _translated(self, old: list[_Action], new: list[_Action]) -> None:
         """
         This hook is called whenever a chord produces a translation.
         Here, we are listening out for {:COMMAND:SET_CONFIG} commands. This
         command forces dictionaries to be reloaded, so we want the Q&A config
         to also be reloaded at the same time.
+
+        The reload itself happens on the config reloader thread, so the meta
+        keeps using the current config until the new one is ready.
+
+        Undone actions are also removed from the sign history, so that the
+        next sign follows on from the sign before the undone one, and checked
+        against any set speaker name prompt, so that undoing the prompt (or the
+        command that closed it) is reflected in the prompt registry. This undo
+        bookkeeping runs before the command check, whenever a translation
+        replaces or undoes actions, and costs a few microseconds.
         """
-        if len(new) == 0:
+        if old:
+            self._sign_history.undo(old)
+            if self._set_name_prompts.has_tagged_actions():
+                self._set_name_prompts.undo(old)
+
+        # NOTE: This hook runs for every translation Plover makes, and almost
+        # none of them are commands, so bail out on the cheapest check first.
+        if not new:
+            return None
+
+        action_command: Optional[str] = new[0].command
+        if not action_command:
             return None
 
-        action: _Action = new[0]
-        if action.command and action.command.upper() == "SET_CONFIG":
-            self._config = config.reload(_CONFIG_FILE, self._config)
+        if (
+            action_command == _SET_CONFIG
+            or action_command.upper() == _SET_CONFIG
+        ):
+            self._config_reloader.request()
 
         return None
+
+    def _loaded_engine(self) -> Engine:
+        """
+        Returns the engine for the current config, loading the config first if
+        that has not happened yet. Once loaded, this is a single attribute
+        read.
+        """
+        sign_engine: Optional[Engine] = self._sign_engine
+        if sign_engine is None:
+            with self._config_lock:
+                if self._sign_engine is None:
+                    self._publish_config(
+                        config.load(self._config_file, self._snapshot_file)
+                    )
+                sign_engine = cast(Engine, self._sign_engine)
+
+        return sign_engine
+
+    def _publish_config(self, new_config: "config.Config") -> None:
+        """
+        Swaps in a new config, with an engine to run it. Must be called with
+        the config lock held.
+        """
+        self._sign_engine = Engine(new_config)
+        self._config_reloader.debounce = new_config.reload_debounce
+        self._collect_stats(new_config.collect_stats)
+
+    def _collect_stats(self, enabled: bool) -> None:
+        """
+        Swaps the registered meta for one that records the time taken by each
+        command, or back again, so that when stats are not being collected,
+        commands are not even timed.
+        """
+        if enabled == (self._stats is not None):
+            return
+
+        self._stats = stats.Stats() if enabled else None
+        registry.register_plugin(
+            "meta",
+            "Q_AND_A",
+            self._timed_q_and_a if enabled else self._q_and_a
+        )
+
+    def _write_stats(self) -> None:
+        """
+        Writes the collected stats out to a file in the Plover config
+        directory.
+        """
+        collected_stats: Optional[stats.Stats] = self._stats
+        if not collected_stats:
+            log.warning(
+                "Q&A stats are not being collected: "
+                "enable \"collect_stats\" in the config to collect them"
+            )
+            return
+
+        try:
+            collected_stats.write(self._stats_file)
+        except OSError as exc:
+            log.error("Unable to write Q&A stats: %s", exc)
+
+    def _reload_config(self) -> None:
+        """
+        This is called from the config reloader thread whenever a reload has
+        been requested.
+
+        Config is parsed and compiled without holding the config lock, so that
+        the meta is never blocked by disk I/O. Then, any speaker name changes
+        are merged in, and the new config is swapped in with a single
+        assignment.
+
+        The first time round, the config will not have been loaded yet, so
+        load it, and warm up every command with it.
+
+        Errors cannot propagate anywhere useful from the reloader thread, so
+        log them and keep the current config (the file could have been saved
+        mid-edit with invalid JSON, or not be readable at all).
+        """
+        first_load: bool = self._sign_engine is None
+        current_config: config.Config
+        new_config: config.Config
+        try:
+            current_config = self._loaded_engine().config
+            if first_load:
+                log.info(
+                    "Q&A warm-up took %.1fms",
+                    warm_up.run(current_config) * 1000
+                )
+            self._watch_config(current_config)
+            new_config = config.load_if_changed(
+                self._config_file,
+                current_config,
+                self._snapshot_file
+            )
+        except (OSError, ValueError) as exc:
+            log.error("Unable to reload Q&A config: %s", exc)
+            return
+
+        if new_config is current_config:
+            return
+
+        with self._config_lock:
+            self._publish_config(
+                config.merge(new_config, cast(Engine, self._sign_engine).config)
+            )
+
+    def _watch_config(self, current_config: "config.Config") -> None:
+        """
+        Starts watching the config file, if that has been enabled, the first
+        time the config is reloaded.
+        """
+        if self._config_watcher or not current_config.watch_config:
+            return
+
+        self._config_watcher = config.Watcher(
+            self._config_file,
+            self._config_reloader.request
+        )
+        self._config_watcher.start()
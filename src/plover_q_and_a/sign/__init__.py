@@ -2,10 +2,52 @@
 Sign - A package dealing with creating text output for Q&A "signs", like signing
 in a question or answer, or signing in a lawyer to perform a line of
 questioning etc.
+
+Sign history keeps track of Plover actions, so it is only imported the first
+time it is used, leaving the rest of the package free of Plover imports.
 """
 
 __all__ = [
-    "text"
+    "Command",
+    "History",
+    "parse",
+    "render",
+    "speaker_signs",
+    "text",
+    "transitions"
 ]
 
-from .text import text
+import importlib
+from typing import (
+    TYPE_CHECKING,
+    Any
+)
+
+from . import (
+    speaker_signs,
+    transitions
+)
+from .command import Command
+from .text import (
+    parse,
+    render,
+    text
+)
+
+if TYPE_CHECKING:
+    from .history import History
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports sign history the first time it is used, and then keeps it, so that
+    later uses are plain attribute reads.
+    """
+    if name != "History":
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        )
+
+    value: Any = getattr(importlib.import_module(".history", __name__), name)
+    globals()[name] = value
+    return value
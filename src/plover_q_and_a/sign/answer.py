@@ -12,22 +12,24 @@ handled by the `follow_on` module.
 """
 
 from typing import (
-    Any,
-    Callable,
+    TYPE_CHECKING,
     Optional
 )
 
 from . import follow_on
+from .command import Command
+from .ending import (
+    ending,
+    sign_type_endings
+)
 
+if TYPE_CHECKING:
+    from ..config.app_config import Config
 
-def sign(
-    current_sign_type: Optional[str],
-    sign_type: str,
-    args: list[str],
-    config: dict[str, Any]
-) -> tuple[str, str]:
+
+def parse(sign_type: str, args: list[str]) -> Command:
     """
-    Returns the text for an answer type.
+    Parses the arguments for an answer type into a command.
 
     Raises an error if the answer type is blank or not recognised.
     """
@@ -42,23 +44,34 @@ def sign(
     if not answer_type:
         raise ValueError("No answer type provided")
 
-    answer: Callable[[Optional[str]], str]
-    answer_value: str
-    if answer_type in (
+    if answer_type not in (
         "FOLLOWING_INTERROGATIVE",
         "FOLLOWING_STATEMENT",
         "FOLLOWING_INTERRUPT"
     ):
-        answer = config[f"ANSWER_{answer_type}"]
-        (sign_type, answer_value) = follow_on.handle_follow_on(
-            current_sign_type,
-            sign_type,
-            follow_on_args,
-            answer,
-            config,
-            yield_key="QUESTION_FOLLOWING_STATEMENT"
-        )
-    else:
         raise ValueError(f"Unknown answer type provided: {answer_type}")
 
-    return (sign_type, answer_value)
+    return follow_on.parse(sign_type, answer_type, follow_on_args)
+
+def sign(
+    current_sign_type: Optional[str],
+    command: Command,
+    config: "Config"
+) -> tuple[str, str]:
+    """
+    Returns the text for an answer type.
+    """
+    answer: str = (
+        ending(current_sign_type, command.variant, config)
+        + config.answer_marker
+    )
+    return follow_on.handle_follow_on(
+        current_sign_type,
+        command,
+        answer,
+        config,
+        yield_text=(
+            sign_type_endings(current_sign_type, config).statement_yield
+            + config.question_marker
+        )
+    )
@@ -9,23 +9,25 @@ Byline module to handle commands that look like:
 """
 
 from typing import (
-    Any,
-    Optional
+    TYPE_CHECKING,
+    Optional,
+    cast
 )
 
 from .. import BYLINE_SPEAKER_TYPES
 from . import speaker
+from .command import Command
+from .ending import ending
+
+if TYPE_CHECKING:
+    from ..config.app_config import Config
 
 
 _ARGUMENT_DIVIDER: str = ":"
 
-def sign(
-    current_sign_type: Optional[str],
-    args: list[str],
-    config: dict[str, Any]
-) -> tuple[str, str]:
+def parse(sign_type: str, args: list[str]) -> Command:
     """
-    Returns the text for a byline type.
+    Parses the arguments for a byline type into a command.
 
     Raises an error if the byline speaker or sign type are blank or not
     recognised.
@@ -37,43 +39,50 @@ def sign(
         )
 
     speaker_type: str
-    sign_type: str
-    speaker_type, sign_type = speaker.extract_speaker_and_sign(args)
+    byline_type: str
+    speaker_type, byline_type = speaker.extract_speaker_and_sign(args)
 
     if speaker_type not in BYLINE_SPEAKER_TYPES:
         raise ValueError(
             f"Unknown byline speaker type provided: {speaker_type}"
         )
 
-    try:
-        speaker_name: str = config["speaker_names"][speaker_type]
-    except KeyError as exc:
-        raise ValueError(f"No speaker name entry for: {speaker_type}") from exc
-
-    byline: str
-    if sign_type == "INITIAL":
-        byline = config["BYLINE_FOR"](speaker_type, speaker_name)
-    elif sign_type in (
+    if byline_type not in (
+        "INITIAL",
         "FOLLOWING_INTERROGATIVE",
         "FOLLOWING_INTERRUPT",
         "FOLLOWING_STATEMENT"
     ):
-        byline = (
-            config[f"BYLINE_{sign_type}_FOR"](
-                current_sign_type,
-                speaker_type,
-                speaker_name
-            )
-        )
-    else:
         raise ValueError(
-            f"Unknown sign type provided for {speaker_type} byline: {sign_type}"
+            "Unknown sign type provided for "
+            f"{speaker_type} byline: {byline_type}"
         )
 
+    return Command(sign_type, byline_type, speaker_type=speaker_type)
+
+def sign(
+    current_sign_type: Optional[str],
+    command: Command,
+    config: "Config"
+) -> tuple[str, str]:
+    """
+    Returns the text for a byline type.
+
+    Raises an error if there is no name for the byline speaker.
+    """
+    speaker_type: Optional[str] = command.speaker_type
+
+    try:
+        byline: str = config.speaker_signs[cast(str, speaker_type)].byline
+    except KeyError as exc:
+        raise ValueError(f"No speaker name entry for: {speaker_type}") from exc
+
     new_current_sign_type: str
     if speaker_type == "WITNESS":
         new_current_sign_type = "ANSWER"
     else:
         new_current_sign_type = "QUESTION"
 
+    byline = ending(current_sign_type, command.variant, config) + byline
+
     return (new_current_sign_type, byline)
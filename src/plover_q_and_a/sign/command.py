@@ -0,0 +1,39 @@
+"""
+Command module containing the pre-validated form of a sign command.
+
+A command like:
+
+    - {:Q_AND_A:QUESTION:FOLLOWING_STATEMENT:YIELD_AFTER:All right}
+
+gets parsed once into:
+
+    - Command(
+        sign_type="QUESTION",
+        variant="FOLLOWING_STATEMENT",
+        follow_on_action="YIELD_AFTER",
+        follow_on_text="All right"
+      )
+
+which can then be rendered into text any number of times without needing to be
+parsed or validated again.
+"""
+
+from typing import (
+    NamedTuple,
+    Optional
+)
+
+
+class Command(NamedTuple):
+    """
+    A parsed and validated sign command.
+
+    `sign_type` is one of QUESTION, ANSWER, BYLINE, or SPEAKER, and `variant`
+    is one of INITIAL, FOLLOWING_INTERROGATIVE, FOLLOWING_STATEMENT, or
+    FOLLOWING_INTERRUPT.
+    """
+    sign_type: str
+    variant: str
+    speaker_type: Optional[str] = None
+    follow_on_action: Optional[str] = None
+    follow_on_text: str = ""
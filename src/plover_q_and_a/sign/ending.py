@@ -0,0 +1,48 @@
+"""
+Ending module to pick out the sentence ending that a sign variant starts with,
+given the current sign type.
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    Optional
+)
+
+if TYPE_CHECKING:
+    from ..config.app_config import (
+        Config,
+        Endings
+    )
+
+
+def ending(
+    current_sign_type: Optional[str],
+    variant: str,
+    config: "Config"
+) -> str:
+    """
+    Returns the sentence ending that goes before the text of a sign.
+
+    Initial signs have no ending, and sign types without their own configured
+    endings use the endings for no current sign type.
+    """
+    if variant == "INITIAL":
+        return ""
+
+    endings: "Endings" = sign_type_endings(current_sign_type, config)
+    if variant == "FOLLOWING_INTERROGATIVE":
+        return endings.interrogative_yield
+
+    if variant == "FOLLOWING_STATEMENT":
+        return endings.statement_yield
+
+    return endings.interrupt_yield
+
+def sign_type_endings(
+    current_sign_type: Optional[str],
+    config: "Config"
+) -> "Endings":
+    """
+    Returns the sentence endings to use after the current sign type.
+    """
+    return config.endings.get(current_sign_type, config.endings[None])
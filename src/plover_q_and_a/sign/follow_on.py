@@ -9,32 +9,33 @@ Follow on module to handle the final part of commands that look like:
 """
 
 from typing import (
-    Any,
-    Callable,
+    TYPE_CHECKING,
     Optional
 )
 
+from .command import Command
+from .ending import sign_type_endings
+
+if TYPE_CHECKING:
+    from ..config.app_config import Config
+
 
 _ARGUMENT_DIVIDER: str = ":"
 
-# pylint: disable-next=too-many-arguments,too-many-positional-arguments
-def handle_follow_on(
-    current_sign_type: Optional[str],
+def parse(
     sign_type: str,
-    follow_on_args: list[str],
-    sign: Callable[[Optional[str]], str],
-    config: dict[str, Any],
-    yield_key: str
-) -> tuple[str, str]:
+    variant: str,
+    follow_on_args: list[str]
+) -> Command:
     """
-    Generates the text for when there is an extra action performed after a
-    question or answer sign change.
+    Parses the follow on action and user string out of a set of follow on
+    arguments, and adds them to a question or answer command.
 
     Raises an error if the follow on arguments are incorrectly formatted, or if
     the follow on commands are not recognised.
     """
     if not follow_on_args:
-        return (sign_type, sign(current_sign_type))
+        return Command(sign_type, variant)
 
     if not len(follow_on_args) == 2:
         raise ValueError(
@@ -47,26 +48,50 @@ def handle_follow_on(
     follow_on_action, user_string = follow_on_args
     follow_on_action = follow_on_action.upper()
 
-    sign_value: str
-    if follow_on_action == "YIELD_AFTER":
-        sign_value = (
-            sign(current_sign_type)
-            + user_string
-            + config[yield_key](current_sign_type)
+    if follow_on_action not in ("YIELD_AFTER", "ELABORATE_AFTER"):
+        raise ValueError(
+            f"Unknown follow on action provided: {follow_on_action}"
         )
+
+    return Command(
+        sign_type,
+        variant,
+        follow_on_action=follow_on_action,
+        follow_on_text=user_string
+    )
+
+def handle_follow_on(
+    current_sign_type: Optional[str],
+    command: Command,
+    sign_text: str,
+    config: "Config",
+    yield_text: str
+) -> tuple[str, str]:
+    """
+    Generates the text for when there is an extra action performed after a
+    question or answer sign change.
+
+    `yield_text` is the text to end with when yielding to the other side.
+    """
+    sign_type: str = command.sign_type
+    if not command.follow_on_action:
+        return (sign_type, sign_text)
+
+    sign_value: str
+    if command.follow_on_action == "YIELD_AFTER":
+        sign_value = sign_text + command.follow_on_text + yield_text
         if sign_type == "QUESTION":
             sign_type = "ANSWER"
         else:
             sign_type = "QUESTION"
-    elif follow_on_action == "ELABORATE_AFTER":
-        sign_value = (
-            sign(current_sign_type)
-            + user_string
-            + config["STATEMENT_ELABORATE"](current_sign_type)
-        )
     else:
-        raise ValueError(
-            f"Unknown follow on action provided: {follow_on_action}"
+        sign_value = (
+            sign_text
+            + command.follow_on_text
+            + sign_type_endings(
+                current_sign_type,
+                config
+            ).statement_elaborate
         )
 
     return (sign_type, sign_value)
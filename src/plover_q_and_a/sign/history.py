@@ -0,0 +1,119 @@
+"""
+History module to keep track of the sign type that each sign action left the
+transcript in, so that the current sign type stays correct when signs are
+undone.
+
+Plover formats new translations before it reports the ones they replace as
+undone, so the current sign type is looked up from the actions in the
+formatting context, rather than just from the most recent entry. That lookup
+only looks back a fixed number of actions, so its cost does not grow with the
+length of an answer.
+
+Plover drops old actions from its undo history over time, so the history only
+holds weak references to actions. Once an action has been dropped it can no
+longer be undone, and every older entry can be forgotten.
+"""
+
+import weakref
+from collections import deque
+from typing import Optional
+
+from plover.formatting import (
+    _Action,
+    _Context
+)
+
+from ..action_table import ActionTable
+
+
+# NOTE: Signs get replaced within a few strokes of being written, so a sign
+# that is being replaced is always among the last few actions of a context.
+_MAX_SCANNED_ACTIONS: int = 64
+
+class History:
+    """
+    The sign actions output by the meta, most recent last, with the sign type
+    that each one resulted in.
+    """
+
+    _entries: deque[tuple["weakref.ReferenceType[_Action]", str]]
+    _sign_types: ActionTable[str]
+
+    def __init__(self) -> None:
+        self._entries = deque()
+        self._sign_types = ActionTable()
+
+    def current_sign_type(self, ctx: _Context) -> Optional[str]:
+        """
+        Returns the sign type resulting from the most recent sign action
+        before a formatting context's new action.
+
+        Any more recent entries belong to translations that the context's
+        translations are replacing, so they are dropped. The context is
+        searched from the end, back as far as its most recent sign action, but
+        never more than a fixed number of actions: past that, the most recent
+        entry is used as it is, and is only corrected when Plover reports the
+        undo.
+        """
+        scanned_count: int = 0
+        for previous_action in ctx.iter_last_actions():
+            sign_type: Optional[str] = self._sign_types.get(previous_action)
+            if sign_type is not None:
+                self._drop_after(previous_action)
+                return sign_type
+
+            scanned_count += 1
+            if scanned_count == _MAX_SCANNED_ACTIONS:
+                return self._entries[-1][1] if self._entries else None
+
+        # NOTE: No sign in the context means that the most recent sign has
+        # been dropped by Plover, so any entry whose action is still around
+        # belongs to a replaced translation.
+        self._drop_after(None)
+        if not self._entries:
+            return None
+
+        return self._entries[-1][1]
+
+    def push(self, action: _Action, sign_type: str) -> None:
+        """
+        Records the sign type that a new sign action resulted in.
+        """
+        self._entries.append((weakref.ref(action), sign_type))
+        self._sign_types.set(action, sign_type)
+        # NOTE: Entries older than an action that Plover has dropped can never
+        # become current again.
+        while len(self._entries) > 1 and self._entries[1][0]() is None:
+            forgotten_action: Optional[_Action] = self._entries.popleft()[0]()
+            if forgotten_action is not None:
+                self._sign_types.pop(forgotten_action)
+
+    def undo(self, undone_actions: list[_Action]) -> None:
+        """
+        Removes any sign actions that have been undone.
+
+        Undone actions are always among the most recent ones, so they are
+        searched for from the end of the history.
+        """
+        for undone_action in undone_actions:
+            if self._sign_types.pop(undone_action) is None:
+                continue
+
+            for index in range(len(self._entries) - 1, -1, -1):
+                if self._entries[index][0]() is undone_action:
+                    del self._entries[index]
+                    break
+
+    def _drop_after(self, action: Optional[_Action]) -> None:
+        """
+        Drops the entries more recent than a sign action, or, given no action,
+        every entry more recent than the last action Plover has dropped.
+        """
+        while self._entries:
+            entry_action: Optional[_Action] = self._entries[-1][0]()
+            if entry_action is action:
+                return
+
+            self._entries.pop()
+            if entry_action is not None:
+                self._sign_types.pop(entry_action)
@@ -13,22 +13,24 @@ handled by the `follow_on` module.
 """
 
 from typing import (
-    Any,
-    Callable,
+    TYPE_CHECKING,
     Optional
 )
 
 from . import follow_on
+from .command import Command
+from .ending import (
+    ending,
+    sign_type_endings
+)
 
+if TYPE_CHECKING:
+    from ..config.app_config import Config
 
-def sign(
-    current_sign_type: Optional[str],
-    sign_type: str,
-    args: list[str],
-    config: dict[str, Any]
-) -> tuple[str, str]:
+
+def parse(sign_type: str, args: list[str]) -> Command:
     """
-    Assigns the text for a question type.
+    Parses the arguments for a question type into a command.
 
     Raises an error if the question type is blank or not recognised.
     """
@@ -43,25 +45,40 @@ def sign(
     if not question_type:
         raise ValueError("No question type provided")
 
-    question: Callable[[Optional[str]], str]
-    question_value: str
     if question_type == "INITIAL":
-        question_value = config[sign_type]
-    elif question_type in (
+        return Command(sign_type, question_type)
+
+    if question_type in (
         "FOLLOWING_INTERROGATIVE",
         "FOLLOWING_INTERRUPT",
         "FOLLOWING_STATEMENT"
     ):
-        question = config[f"{sign_type}_{question_type}"]
-        (sign_type, question_value) = follow_on.handle_follow_on(
-            current_sign_type,
-            sign_type,
-            follow_on_args,
-            question,
-            config,
-            yield_key="ANSWER_FOLLOWING_INTERROGATIVE"
-        )
-    else:
-        raise ValueError(f"Unknown question type provided: {question_type}")
+        return follow_on.parse(sign_type, question_type, follow_on_args)
+
+    raise ValueError(f"Unknown question type provided: {question_type}")
 
-    return (sign_type, question_value)
+def sign(
+    current_sign_type: Optional[str],
+    command: Command,
+    config: "Config"
+) -> tuple[str, str]:
+    """
+    Assigns the text for a question type.
+    """
+    question: str = (
+        ending(current_sign_type, command.variant, config)
+        + config.question_marker
+    )
+    if command.variant == "INITIAL":
+        return (command.sign_type, question)
+
+    return follow_on.handle_follow_on(
+        current_sign_type,
+        command,
+        question,
+        config,
+        yield_text=(
+            sign_type_endings(current_sign_type, config).interrogative_yield
+            + config.answer_marker
+        )
+    )
@@ -12,50 +12,63 @@ Speaker module to handle commands that look like:
 """
 
 from typing import (
-    Any,
-    Optional
+    TYPE_CHECKING,
+    Optional,
+    cast
 )
 
+from .command import Command
+from .ending import ending
 
-def sign(
-    current_sign_type: Optional[str],
-    args: list[str],
-    config: dict[str, Any]
-) -> tuple[str, str]:
+if TYPE_CHECKING:
+    from ..config.app_config import Config
+
+
+def parse(args: list[str]) -> Command:
     """
-    Returns the text for a known speaker.
+    Parses the arguments for a known speaker into a command.
 
-    Raises an error if the speaker is not recognised, or if the sign type is
-    blank or not recognised.
+    Raises an error if the sign type is blank or not recognised.
     """
+    speaker_type: str
     sign_type: str
     speaker_type, sign_type = extract_speaker_and_sign(args)
 
-    try:
-        speaker_name: str = config["speaker_names"][speaker_type]
-    except KeyError as exc:
-        raise ValueError(
-            f"Unknown speaker type provided: {speaker_type}"
-        ) from exc
-
-    speaker: str
-    if sign_type == "INITIAL":
-        speaker = config["SPEAKER_FOR"](speaker_name)
-    elif sign_type in (
+    if sign_type not in (
+        "INITIAL",
         "FOLLOWING_INTERROGATIVE",
         "FOLLOWING_STATEMENT",
         "FOLLOWING_INTERRUPT"
     ):
-        speaker = config[f"SPEAKER_{sign_type}_FOR"](
-            current_sign_type,
-            speaker_name
-        )
-    else:
         raise ValueError(
             f"Unknown sign type provided for {speaker_type}: {sign_type}"
         )
 
-    return ("SPEAKER", speaker)
+    return Command("SPEAKER", sign_type, speaker_type=speaker_type)
+
+def sign(
+    current_sign_type: Optional[str],
+    command: Command,
+    config: "Config"
+) -> tuple[str, str]:
+    """
+    Returns the text for a known speaker.
+
+    Raises an error if the speaker is not recognised.
+    """
+    speaker_type: Optional[str] = command.speaker_type
+
+    try:
+        speaker: str = config.speaker_signs[cast(str, speaker_type)].speaker
+    except KeyError as exc:
+        raise ValueError(
+            f"Unknown speaker type provided: {speaker_type}"
+        ) from exc
+
+    return (
+        "SPEAKER",
+        ending(current_sign_type, command.variant, config) + speaker
+    )
 
 def extract_speaker_and_sign(args: list[str]) -> tuple[str, str]:
     """
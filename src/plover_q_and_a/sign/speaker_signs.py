@@ -0,0 +1,88 @@
+"""
+Speaker signs module to pre-render the parts of byline and speaker signs that
+contain a speaker name.
+
+Everything in a byline or speaker sign except the sentence ending before it
+depends only on the speaker's name, which rarely changes. So, the text for
+each speaker in the config is rendered once, when the config is loaded, and
+then only re-rendered for a single speaker when that speaker's name is set.
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    NamedTuple
+)
+
+from . import transitions
+
+if TYPE_CHECKING:
+    from ..config.app_config import (
+        Affixes,
+        Config
+    )
+
+
+class SpeakerSigns(NamedTuple):
+    """
+    The rendered byline and speaker text for a single speaker.
+    """
+    byline: str
+    speaker: str
+
+def prerender(config: "Config") -> "Config":
+    """
+    Returns a copy of the config with the signs for every speaker in it
+    rendered.
+    """
+    return config._replace(
+        speaker_signs={
+            speaker_type: render(config, speaker_type, speaker_name)
+            for speaker_type, speaker_name in config.speaker_names.items()
+        }
+    )
+
+def rename(
+    config: "Config",
+    speaker_type: str,
+    speaker_name: str
+) -> "Config":
+    """
+    Returns a copy of the config with a speaker's name changed, and only that
+    speaker's signs and transitions re-rendered.
+    """
+    renamed_config: "Config" = config._replace(
+        speaker_names={**config.speaker_names, speaker_type: speaker_name}
+    )
+    renamed_config = renamed_config._replace(
+        speaker_signs={
+            **config.speaker_signs,
+            speaker_type: render(renamed_config, speaker_type, speaker_name)
+        }
+    )
+
+    return transitions.invalidate(renamed_config, speaker_type)
+
+def render(
+    config: "Config",
+    speaker_type: str,
+    speaker_name: str
+) -> SpeakerSigns:
+    """
+    Renders the byline and speaker text for a speaker.
+
+    The witness gets an answer byline, and everyone else a question byline.
+    """
+    byline_marker: "Affixes" = (
+        config.answer_byline
+        if speaker_type == "WITNESS"
+        else config.question_byline
+    )
+
+    return SpeakerSigns(
+        byline=byline_marker.pre + speaker_name + byline_marker.post,
+        speaker=(
+            config.speaker_marker.pre
+            + speaker_name
+            + config.speaker_marker.post
+        )
+    )
@@ -15,7 +15,7 @@ list of `SPEAKER_TYPES`.
 """
 
 from typing import (
-    Any,
+    TYPE_CHECKING,
     Optional
 )
 
@@ -26,16 +26,29 @@ from . import (
     question,
     speaker
 )
+from .command import Command
+
+if TYPE_CHECKING:
+    from ..config.app_config import Config
 
 
 def text(
     current_sign_type: Optional[str],
     args: list[str],
-    config: dict[str, Any]
+    config: "Config"
 ) -> tuple[str, str]:
     """
-    Checks the sign type and delegates handling to the appropriate module to
-    generate the correct sign text.
+    Parses the sign command arguments and generates the correct sign text for
+    them.
+
+    Raises an error if the sign type is blank or not recognised.
+    """
+    return render(current_sign_type, parse(args), config)
+
+def parse(args: list[str]) -> Command:
+    """
+    Checks the sign type and delegates parsing of the rest of the arguments to
+    the appropriate module.
 
     Raises an error if the sign type is blank or not recognised.
     """
@@ -47,34 +60,53 @@ def text(
     if not sign_type:
         raise ValueError("No sign type provided")
 
-    sign_text: str
+    command: Command
     if sign_type == "QUESTION":
+        command = question.parse(sign_type, sign_type_args)
+    elif sign_type == "ANSWER":
+        command = answer.parse(sign_type, sign_type_args)
+    elif sign_type == "BYLINE":
+        command = byline.parse(sign_type, sign_type_args)
+    elif sign_type in SPEAKER_TYPES:
+        command = speaker.parse(args)
+    else:
+        raise ValueError(f"Unknown sign type provided: {sign_type}")
+
+    return command
+
+def render(
+    current_sign_type: Optional[str],
+    command: Command,
+    config: "Config"
+) -> tuple[str, str]:
+    """
+    Delegates handling of an already parsed command to the appropriate module
+    to generate the correct sign text.
+    """
+    sign_text: str
+    if command.sign_type == "QUESTION":
         (current_sign_type, sign_text) = question.sign(
             current_sign_type,
-            sign_type,
-            sign_type_args,
+            command,
             config
         )
-    elif sign_type == "ANSWER":
+    elif command.sign_type == "ANSWER":
         (current_sign_type, sign_text) = answer.sign(
             current_sign_type,
-            sign_type,
-            sign_type_args,
+            command,
             config
         )
-    elif sign_type == "BYLINE":
+    elif command.sign_type == "BYLINE":
         (current_sign_type, sign_text) = byline.sign(
             current_sign_type,
-            sign_type_args,
+            command,
             config
         )
-    elif sign_type in SPEAKER_TYPES:
+    else:
         (current_sign_type, sign_text) = speaker.sign(
             current_sign_type,
-            args,
+            command,
             config
         )
-    else:
-        raise ValueError(f"Unknown sign type provided: {sign_type}")
 
     return (current_sign_type, sign_text)
@@ -0,0 +1,132 @@
+"""
+Transitions module to materialise the output of every built-in sign command.
+
+The output of a sign command depends only on the current sign type, the
+command itself, and the config. So, when config is loaded, a table of:
+
+    (current_sign_type, command) -> (new_sign_type, text)
+
+is built for every built-in command and speaker, meaning that rendering a sign
+at runtime becomes a single lookup. Commands that are not built in (those with
+follow on user strings) are rendered every time they are used. They are not
+added to the table. Follow on strings can be anything, so adding them would
+let the table grow without limit.
+
+The table is never changed once it has been built, so it can be shared by
+configs that are in use on different threads.
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    Iterator,
+    Optional
+)
+
+from .. import (
+    BYLINE_SPEAKER_TYPES,
+    SPEAKER_TYPES
+)
+from .command import Command
+from .text import render
+
+if TYPE_CHECKING:
+    from ..config.app_config import Config
+
+
+Transitions = dict[tuple[Optional[str], Command], tuple[str, str]]
+
+CURRENT_SIGN_TYPES: tuple[Optional[str], ...] = (
+    None,
+    "QUESTION",
+    "ANSWER",
+    "SPEAKER"
+)
+_FOLLOWING_VARIANTS: tuple[str, ...] = (
+    "FOLLOWING_INTERROGATIVE",
+    "FOLLOWING_STATEMENT",
+    "FOLLOWING_INTERRUPT"
+)
+_VARIANTS: tuple[str, ...] = ("INITIAL",) + _FOLLOWING_VARIANTS
+
+def build(config: "Config") -> Transitions:
+    """
+    Renders every built-in command for every current sign type.
+    """
+    transitions: Transitions = {}
+    for command in builtin_commands():
+        _add_rows(transitions, command, config)
+
+    return transitions
+
+def lookup(
+    current_sign_type: Optional[str],
+    command: Command,
+    config: "Config"
+) -> tuple[str, str]:
+    """
+    Returns the new sign type and text for a command from the config's
+    transitions table. Commands that are not in the table, and config without
+    a transitions table, get rendered directly.
+    """
+    transitions: Optional[Transitions] = config.transitions
+    transition: Optional[tuple[str, str]] = (
+        None
+        if transitions is None
+        else transitions.get((current_sign_type, command))
+    )
+    if transition is None:
+        return render(current_sign_type, command, config)
+
+    return transition
+
+def invalidate(config: "Config", speaker_type: str) -> "Config":
+    """
+    Returns a copy of the config with only the rows of its transitions table
+    that contain a given speaker's name re-rendered.
+
+    The config's own table is left untouched, as it may still be in use.
+    """
+    if config.transitions is None:
+        return config
+
+    transitions: Transitions = dict(config.transitions)
+    new_config: "Config" = config._replace(transitions=transitions)
+    commands: set[Command] = {
+        command
+        for (_current_sign_type, command) in transitions
+        if command.speaker_type == speaker_type
+    }
+    for command in commands:
+        _add_rows(transitions, command, new_config)
+
+    return new_config
+
+def builtin_commands() -> Iterator[Command]:
+    """
+    Yields every command that does not take a follow on user string.
+    """
+    for variant in _VARIANTS:
+        yield Command("QUESTION", variant)
+
+    for variant in _FOLLOWING_VARIANTS:
+        yield Command("ANSWER", variant)
+
+    for speaker_type in BYLINE_SPEAKER_TYPES:
+        for variant in _VARIANTS:
+            yield Command("BYLINE", variant, speaker_type=speaker_type)
+
+    for speaker_type in SPEAKER_TYPES:
+        for variant in _VARIANTS:
+            yield Command("SPEAKER", variant, speaker_type=speaker_type)
+
+def _add_rows(
+    transitions: Transitions,
+    command: Command,
+    config: "Config"
+) -> None:
+    for current_sign_type in CURRENT_SIGN_TYPES:
+        transitions[(current_sign_type, command)] = render(
+            current_sign_type,
+            command,
+            config
+        )
@@ -3,7 +3,13 @@ Speaker - a package for dealing with Q&A speaker-related functionality.
 """
 
 __all__ = [
+    "Prompt",
+    "Prompts",
     "set_name"
 ]
 
-from .set_name import set_name
+from .set_name import (
+    Prompt,
+    Prompts,
+    set_name
+)
@@ -1,28 +1,46 @@
 """
-Modified from Plover's plover.formatting.RetroFormatter.iter_last_fragments().
-The only change made was to to `yield` up the `action`, as well as the
-`fragment`, in order to determine whether a `set_name_speaker_type` property
-had been set.
+A reverse fragment scanner, equivalent to Plover's
+plover.formatting.RetroFormatter.iter_last_fragments(), except that it also
+`yield`s up the `action` that each `fragment` was completed in, in order to
+determine when the action that opened a set speaker name prompt has been
+reached.
+
+Plover's version re-runs `FRAGMENT_RX` over each action's text joined to the
+fragment carried over from the actions after it, which becomes quadratic when
+a long fragment is typed in many small attached pieces. Here, `FRAGMENT_RX`
+only ever scans each action's own text, and the carried fragment is kept as a
+list of pieces that is only joined together once the fragment is complete.
 """
 
-from typing import Generator
+from typing import (
+    Generator,
+    Optional
+)
 
-from plover.formatting import _Context
+from plover.formatting import (
+    _Action,
+    _Context
+)
 
 
-# NOTE: Function mostly lifted directly from Plover's codebase.
-def iter_last_fragments(ctx: _Context) -> Generator[_Context, None, None]:
+def iter_last_fragments(
+    ctx: _Context
+) -> Generator[tuple[_Action, str], None, None]:
     """
     Iterate over last text fragments (last first).
 
     A text fragment is a series of non-whitespace characters
     followed by zero or more trailing whitespace characters.
     """
-    replace = 0
-    next_action = None
-    current_fragment = ""
+    replace: int = 0
+    next_action: Optional[_Action] = None
+    # The carried (incomplete) fragment is split into its leading whitespace
+    # and its body (a word and its trailing whitespace), both kept as
+    # non-empty pieces in reverse order.
+    lead: list[str] = []
+    body: list[str] = []
     for action in ctx.iter_last_actions():
-        part = "" if action.text is None else action.text
+        part: str = "" if action.text is None else action.text
         if (
             next_action is not None
             and next_action.text is not None
@@ -31,21 +49,63 @@ def iter_last_fragments(ctx: _Context) -> Generator[_Context, None, None]:
             part += next_action.space_char
         if replace:
             # Ignore replaced content.
-            if len(part) > replace:
-                part = part[:-replace]
-                replace = 0
-            else:
-                replace -= len(part)
-                part = ''
+            part, replace = _unreplaced(part, replace)
         if part:
-            # Find out new complete fragments.
-            fragments = ctx.FRAGMENT_RX.findall(part + current_fragment)
-            for fragment in reversed(fragments[1:]):
-                yield action, fragment
-            current_fragment = fragments[0]
+            # Only this action's text gets scanned, and the carried fragment
+            # is joined on to the result piece by piece.
+            fragments: list[str] = ctx.FRAGMENT_RX.findall(part)
+            first: str = fragments[0]
+            if first.isspace():
+                lead.append(part)
+            else:
+                if body:
+                    completed: Optional[str]
+                    completed, lead = _close_carried(part, lead, body)
+                    if completed is not None:
+                        yield action, completed
+                    body = []
+
+                word: str = first.lstrip()
+                if len(fragments) > 1:
+                    lead.append(fragments[-1])
+                    yield action, "".join(reversed(lead))
+                    for fragment in reversed(fragments[1:-1]):
+                        yield action, fragment
+                    body = [word]
+                else:
+                    lead.append(word)
+                    body = lead
+
+                lead = [first[:-len(word)]] if len(word) < len(first) else []
         replace += len(action.prev_replace)
         next_action = action
 
     # Don't forget to process the current (first) fragment.
-    if not current_fragment.isspace():
-        yield next_action, current_fragment.lstrip()
+    if body or not lead:
+        yield next_action, "".join(reversed(body))
+
+def _unreplaced(part: str, replace: int) -> tuple[str, int]:
+    """
+    Drops replaced content from the end of a part, returning what is left of
+    it, and how much content is still to be replaced.
+    """
+    if len(part) > replace:
+        return (part[:-replace], 0)
+
+    return ("", replace - len(part))
+
+def _close_carried(
+    part: str,
+    lead: list[str],
+    body: list[str]
+) -> tuple[Optional[str], list[str]]:
+    """
+    Closes off the carried fragment when a part with a word in it comes before
+    it, returning the completed carried fragment, if any, and the new lead.
+    """
+    if lead or part[-1].isspace():
+        # The carried word can no longer grow, so is complete.
+        return ("".join(reversed(body)), lead)
+
+    # This part ends in the middle of the carried word.
+    return (None, body)
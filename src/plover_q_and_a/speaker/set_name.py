@@ -10,9 +10,11 @@ In the first example above, PLAINTIFF_1 is included in the recognised
 list of `SPEAKER_TYPES`.
 """
 
+import weakref
 from typing import (
-    Any,
-    Union
+    TYPE_CHECKING,
+    NamedTuple,
+    Optional
 )
 
 from plover.formatting import (
@@ -20,90 +22,169 @@ from plover.formatting import (
     _Context
 )
 
-from .. import SPEAKER_TYPES
+from ..action_table import ActionTable
+from ..engine import Engine
 from .formatting import iter_last_fragments
 
+if TYPE_CHECKING:
+    from ..config import Config
+
+
+class Prompt(NamedTuple):
+    """
+    A set speaker name prompt, and the action it was opened in.
+
+    Prompts are stored as values in an action table, so they only hold a weak
+    reference to their action: a strong one would keep the action (the
+    table's key) alive forever.
+    """
+    speaker_type: str
+    action_ref: "weakref.ReferenceType[_Action]"
+
+class Prompts:
+    """
+    Registry of the currently open set speaker name prompt.
+
+    Every action that opens or closes a prompt is tagged with that prompt in a
+    side table, so that undoing either of them can be reflected in the registry
+    without any searching.
+    """
+
+    open_prompt: Optional[Prompt]
+    _tagged_actions: ActionTable[Prompt]
+
+    def __init__(self) -> None:
+        self.open_prompt = None
+        self._tagged_actions = ActionTable()
+
+    def has_tagged_actions(self) -> bool:
+        """
+        Checks whether any action that Plover still holds on to has opened or
+        closed a prompt.
+        """
+        return len(self._tagged_actions) > 0
+
+    def open(self, prompt: Prompt) -> None:
+        """
+        Registers a newly opened prompt.
+        """
+        action: Optional[_Action] = prompt.action_ref()
+        if action is not None:
+            self._tagged_actions.set(action, prompt)
+        self.open_prompt = prompt
+
+    def close(self, action: _Action) -> None:
+        """
+        Closes the open prompt, tagging the action that closed it.
+        """
+        if self.open_prompt:
+            self._tagged_actions.set(action, self.open_prompt)
+        self.open_prompt = None
+
+    def undo(self, undone_actions: list[_Action]) -> None:
+        """
+        Updates the registry for actions that have been undone: undoing a
+        prompt forgets it, and undoing the command that closed a prompt
+        re-opens it.
+        """
+        for undone_action in undone_actions:
+            prompt: Optional[Prompt] = self._tagged_actions.get(undone_action)
+            if prompt is None:
+                continue
+
+            if undone_action is prompt.action_ref():
+                if self.open_prompt is prompt:
+                    self.open_prompt = None
+            else:
+                self.open_prompt = prompt
 
 def set_name(
-    command_args: list[str],
+    set_name_command: str,
     ctx: _Context,
     action: _Action,
-    config: dict[str, Any]
-) -> None:
+    config: "Config",
+    prompts: Prompts
+) -> "Config":
     """
-    Checks the set name command and delegates handling to the appropriate
-    function.
+    Checks the (already validated) set name command and delegates handling to
+    the appropriate function.
 
-    Raises an error if the set name argument is blank or not recognised.
+    Config is never changed in place: if a speaker name gets set, a new config
+    with that name is returned, otherwise the given config is.
     """
-    if not command_args:
-        raise ValueError("No SET_NAME command arguments provided")
-
-    set_name_command: str = command_args[0].strip().upper()
+    if set_name_command == "DONE":
+        return _end_set_speaker_name(ctx, action, config, prompts)
 
-    if set_name_command in SPEAKER_TYPES:
-        _begin_set_speaker_name(set_name_command, action, config)
-    elif set_name_command == "DONE":
-        _end_set_speaker_name(ctx, action, config)
-    else:
-        raise ValueError(
-            f"Unknown SET_NAME command provided: {set_name_command}"
-        )
+    _begin_set_speaker_name(set_name_command, action, config, prompts)
+    return config
 
 def _begin_set_speaker_name(
     speaker_type: str,
     action: _Action,
-    config: dict[str, Any]
+    config: "Config",
+    prompts: Prompts
 ) -> None:
     """
-    Opens up a prompt to set the speaker name, and marks an action as the place
-    where the prompt started so it can be searched for later.
+    Opens up a prompt to set the speaker name, and registers the action where
+    the prompt started so that it does not need to be searched for later.
     """
-    # NOTE: This is an arbitrary attr that is being set on an `_Action` object,
-    # and is *not* part of the `_Action` API (but doing this kind of dynamic
-    # attribute assignment seems to be allowed).
-    setattr(action, "set_name_speaker_type", speaker_type.strip())
-    current_speaker_name: str = config["speaker_names"][speaker_type]
-    action.text = config["SET_NAME_PROMPT"].format(
+    current_speaker_name: str = config.speaker_names[speaker_type]
+    action.text = config.set_name_prompt.format(
         speaker_type=speaker_type,
         current_speaker_name=current_speaker_name
     )
     action.next_attach = True
+    prompts.open(Prompt(speaker_type.strip(), weakref.ref(action)))
 
 def _end_set_speaker_name(
     ctx: _Context,
     action: _Action,
-    config: dict[str, Any]
-) -> None:
+    config: "Config",
+    prompts: Prompts
+) -> "Config":
     """
-    Searches the previous actions in a context for the place where a set speaker
-    name prompt began. Once found, take the text entered after the prompt, set
-    that name in the config, and delete the prompt text from the current action.
+    Takes the text entered in a context after the open set speaker name prompt,
+    returns a new config with that name set, and deletes the prompt text from
+    the current action.
+
+    Only the actions entered since the prompt are looked at, so the cost does
+    not depend on how much history the context has.
     """
-    begin_action: Union[_Action, None] = None
+    prompt: Optional[Prompt] = prompts.open_prompt
+    # Ignore SET_NAME:DONE command if called before SET_NAME:<SPEAKER>
+    if not prompt:
+        return config
+
+    prompt_action: Optional[_Action] = prompt.action_ref()
+    if prompt_action is None:
+        # Plover has already let go of the prompt, so it cannot be in the
+        # context any more.
+        prompts.open_prompt = None
+        return config
+
     name: str = ""
     for prev_action, fragment in iter_last_fragments(ctx):
         if fragment:
             name = fragment + name
 
-        if hasattr(prev_action, "set_name_speaker_type"):
-            begin_action = prev_action
+        if prev_action is prompt_action:
             break
+    else:
+        # The prompt is no longer in the context.
+        prompts.open_prompt = None
+        return config
 
-    # Ignore SET_NAME:DONE command if called before SET_NAME:<SPEAKER>
-    if not begin_action:
-        return None
-
-    speaker_type: str = getattr(begin_action, "set_name_speaker_type")
-
-    if config["SPEAKER_UPCASE"]:
-        name = name.upper()
-
-    config["speaker_names"][speaker_type] = name
+    name_engine: Engine = Engine(config)
+    name_engine.set_name(prompt.speaker_type, name)
+    new_config: "Config" = name_engine.config
 
     # NOTE: prev_replace text gets deleted.
-    action.prev_replace = f"{begin_action.text} {name}"
+    action.prev_replace = (
+        f"{prompt_action.text} "
+        f"{new_config.speaker_names[prompt.speaker_type]}"
+    )
     action.prev_attach = True
     action.text = ""
+    prompts.close(action)
 
-    return None
+    return new_config
@@ -0,0 +1,119 @@
+"""
+Module to handle recording how long each Q_AND_A command takes, so that the
+plugin can be ruled in or out when there is lag during realtime writing.
+
+Latencies are kept in a histogram per command family, with buckets that grow
+exponentially in width, so that memory use stays constant however many
+commands are recorded, while percentiles stay accurate to within one bucket
+(1/8th of the latency).
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from . import command
+
+
+FILENAME: str = "q_and_a_stats.json"
+
+_PERCENTILES: tuple[int, ...] = (50, 95, 99)
+# Each power of two gets split into 2 ** _SUB_BUCKET_BITS buckets.
+_SUB_BUCKET_BITS: int = 3
+
+class Histogram:
+    """
+    A histogram of latencies in nanoseconds.
+    """
+
+    count: int
+    _buckets: dict[int, int]
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._buckets = {}
+
+    def record(self, nanoseconds: int) -> None:
+        """
+        Adds a latency to the histogram.
+        """
+        shift: int = max(nanoseconds.bit_length() - 1 - _SUB_BUCKET_BITS, 0)
+        bucket: int = (nanoseconds >> shift) << shift
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+        self.count += 1
+
+    def percentile(self, percent: float) -> int:
+        """
+        Returns the upper bound of the bucket that the given percentile of
+        latencies falls into, or 0 if nothing has been recorded.
+        """
+        rank: float = self.count * percent / 100
+        seen: int = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                return bucket + _bucket_width(bucket) - 1
+
+        return 0
+
+class Stats:
+    """
+    Latency histograms for each family of Q_AND_A command.
+    """
+
+    _histograms: dict[str, Histogram]
+
+    def __init__(self) -> None:
+        self._histograms = {}
+
+    def record(self, argument: str, nanoseconds: int) -> None:
+        """
+        Adds the latency of a Q_AND_A command to the histogram for its family.
+        """
+        family: str = _family(argument)
+        histogram: Histogram
+        try:
+            histogram = self._histograms[family]
+        except KeyError:
+            histogram = self._histograms[family] = Histogram()
+        histogram.record(nanoseconds)
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """
+        Returns the count and percentile latencies (in microseconds) for each
+        family of Q_AND_A command.
+        """
+        return {
+            family: {
+                "count": histogram.count,
+                **{
+                    f"p{percent}_us": histogram.percentile(percent) / 1000
+                    for percent in _PERCENTILES
+                }
+            }
+            for family, histogram in sorted(self._histograms.items())
+        }
+
+    def write(self, stats_path: Path) -> None:
+        """
+        Writes out the summary of the stats as JSON.
+        """
+        temporary_path: Path = stats_path.with_name(
+            f"{stats_path.name}.{os.getpid()}.tmp"
+        )
+        temporary_path.write_text(
+            json.dumps(self.summary(), indent=2) + "\n",
+            encoding="utf-8"
+        )
+        os.replace(temporary_path, stats_path)
+
+def _bucket_width(bucket: int) -> int:
+    return 1 << max(bucket.bit_length() - 1 - _SUB_BUCKET_BITS, 0)
+
+def _family(argument: str) -> str:
+    q_and_a_command: command.Command = command.parse(argument)
+    if q_and_a_command.sign_command:
+        return q_and_a_command.sign_command.sign_type
+
+    return q_and_a_command.name
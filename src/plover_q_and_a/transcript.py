@@ -0,0 +1,232 @@
+"""
+Transcript module to render a stream of text containing Q_AND_A commands, eg:
+
+    {:Q_AND_A:QUESTION:INITIAL}
+    did you see the car
+    {:Q_AND_A:ANSWER:FOLLOWING_INTERROGATIVE}
+    yes
+
+into a formatted transcript, without Plover.
+
+Sign commands are formatted the same way the meta formats them in Plover: they
+attach to the text on either side of them (so any whitespace around them is
+dropped), and capitalise the first word after them. The text entered after a
+SET_NAME command, up until SET_NAME:DONE, becomes the new speaker name, and a
+RESET_CONFIG command resets speaker names back to the ones in the config.
+Commands that do not output any text get dropped, along with any whitespace
+after them.
+
+The transcript is rendered as a pipeline of generators, which only ever hold
+on to a single chunk of input (plus the start of any command cut off at the
+end of it), so transcripts of any size can be rendered in constant memory.
+"""
+
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    TextIO,
+    cast
+)
+
+from . import (
+    command,
+    sign
+)
+from .engine import Engine
+
+if TYPE_CHECKING:
+    from .config import Config
+
+
+CHUNK_SIZE: int = 64 * 1024
+
+_COMMAND_START: str = "{:Q_AND_A:"
+_COMMAND_END: str = "}"
+# Anything longer than this is not a command, but a missing closing brace.
+_MAX_COMMAND_LENGTH: int = 1024
+_MAX_SPEAKER_NAME_LENGTH: int = 1024
+
+class Token(NamedTuple):
+    """
+    A piece of a transcript: either some text, or the argument of a Q_AND_A
+    command.
+    """
+    text: str = ""
+    argument: Optional[str] = None
+
+class _Renderer:
+    """
+    The state carried from one token of a transcript to the next.
+    """
+
+    _engine: Engine
+    _config: "Config"
+    _strip_next: bool
+    _capitalise_next: bool
+    _trailing_space: str
+    _set_name_target: Optional[str]
+    _speaker_name: str
+
+    def __init__(self, config: "Config") -> None:
+        self._engine = Engine(config)
+        self._config = config
+        self._strip_next = False
+        self._capitalise_next = False
+        self._trailing_space = ""
+        self._set_name_target = None
+        self._speaker_name = ""
+
+    def text(self, text: str) -> Iterator[str]:
+        """
+        Yields transcript text, holding back any trailing whitespace in case a
+        command that attaches to it comes next.
+        """
+        if self._set_name_target:
+            self._speaker_name += text
+            if len(self._speaker_name) > _MAX_SPEAKER_NAME_LENGTH:
+                raise ValueError(
+                    f"No SET_NAME:DONE command after SET_NAME:"
+                    f"{self._set_name_target}"
+                )
+            return
+
+        if self._strip_next:
+            text = text.lstrip()
+            if not text:
+                return
+            self._strip_next = False
+
+        if self._capitalise_next:
+            text = text[0].upper() + text[1:]
+            self._capitalise_next = False
+
+        stripped_text: str = text.rstrip()
+        if not stripped_text:
+            self._trailing_space += text
+            return
+
+        yield self._trailing_space + stripped_text
+        self._trailing_space = text[len(stripped_text):]
+
+    def command(self, argument: str) -> Iterator[str]:
+        """
+        Yields the text for a Q_AND_A command.
+        """
+        q_and_a_command: command.Command = command.parse(argument)
+        self._strip_next = True
+        if q_and_a_command.name == command.SET_NAME:
+            self._set_name(cast(str, q_and_a_command.set_name_target))
+        elif q_and_a_command.name == command.RESET_CONFIG:
+            self._engine.config = self._config
+        elif q_and_a_command.name == command.SIGN:
+            self._trailing_space = ""
+            self._capitalise_next = True
+            yield self._engine.sign(
+                cast(sign.Command, q_and_a_command.sign_command)
+            )
+
+    def end(self) -> Iterator[str]:
+        """
+        Yields any whitespace still being held back at the end of the
+        transcript.
+        """
+        if self._trailing_space:
+            yield self._trailing_space
+
+    def _set_name(self, set_name_target: str) -> None:
+        if set_name_target != "DONE":
+            self._set_name_target = set_name_target
+            self._speaker_name = ""
+        elif self._set_name_target:
+            self._engine.set_name(
+                self._set_name_target,
+                self._speaker_name.strip()
+            )
+            self._set_name_target = None
+
+def render(chunks: Iterable[str], config: "Config") -> Iterator[str]:
+    """
+    Renders a stream of transcript text containing Q_AND_A commands.
+
+    Raises an error if a command is not recognised, or never closed.
+    """
+    renderer: _Renderer = _Renderer(config)
+    for token in tokenize(chunks):
+        if token.argument is None:
+            yield from renderer.text(token.text)
+        else:
+            yield from renderer.command(token.argument)
+
+    yield from renderer.end()
+
+def read_chunks(
+    stream: TextIO,
+    chunk_size: int = CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Reads a text stream in fixed size chunks.
+    """
+    return iter(partial(stream.read, chunk_size), "")
+
+def tokenize(chunks: Iterable[str]) -> Iterator[Token]:
+    """
+    Splits a stream of text up into text and Q_AND_A commands, including
+    commands that are split across chunks.
+
+    Raises an error if a command is never closed.
+    """
+    pending: str = ""
+    for chunk in chunks:
+        pending += chunk
+        position: int = 0
+        while True:
+            start: int = pending.find(_COMMAND_START, position)
+            end: int = (
+                -1
+                if start == -1
+                else pending.find(_COMMAND_END, start + len(_COMMAND_START))
+            )
+            if end == -1:
+                break
+
+            if start > position:
+                yield Token(text=pending[position:start])
+            yield Token(argument=pending[start + len(_COMMAND_START):end])
+            position = end + len(_COMMAND_END)
+
+        held: int = _command_start(pending, position)
+        if held > position:
+            yield Token(text=pending[position:held])
+        pending = pending[held:]
+
+    if pending.startswith(_COMMAND_START):
+        raise ValueError(f"Q_AND_A command never closed: {pending[:80]}")
+    if pending:
+        yield Token(text=pending)
+
+def _command_start(text: str, position: int) -> int:
+    """
+    Returns where an unclosed command (or what could be the start of one)
+    begins in some text, or the end of the text if there is none.
+    """
+    start: int = text.find(_COMMAND_START, position)
+    if start != -1:
+        if len(text) - start > _MAX_COMMAND_LENGTH:
+            raise ValueError(
+                f"Q_AND_A command never closed: {text[start:start + 80]}"
+            )
+        return start
+
+    for length in range(
+        min(len(_COMMAND_START) - 1, len(text) - position),
+        0,
+        -1
+    ):
+        if _COMMAND_START.startswith(text[-length:]):
+            return len(text) - length
+
+    return len(text)
@@ -0,0 +1,93 @@
+"""
+Warm up module to run every built-in Q_AND_A command once, before any strokes
+arrive, so that the first stroke of each command is as fast as the rest.
+
+The transitions table already holds the rendered output of every built-in
+command, but a stroke also has to parse its argument string (which only
+happens once per string, after which it is cached), look up its transition
+through an engine, and record its sign type in the sign history. Doing all of
+that up front also means that every function a stroke calls has already run,
+and been specialised by the interpreter, before a reporter writes their first
+"Q".
+"""
+
+import time
+from typing import (
+    TYPE_CHECKING,
+    Iterator,
+    cast
+)
+
+from plover.formatting import (
+    _Action,
+    _Context
+)
+
+from . import (
+    command,
+    sign
+)
+from .engine import Engine
+
+if TYPE_CHECKING:
+    from .config import Config
+
+
+# NOTE: Follow on strings are up to the user, so these ones only warm up the
+# code paths that follow on commands take; their output never gets stored.
+_FOLLOW_ONS: tuple[tuple[str, ...], ...] = (
+    ("YIELD_AFTER", "Okay"),
+    ("ELABORATE_AFTER", "Okay")
+)
+
+def run(config: "Config") -> float:
+    """
+    Runs every built-in command for every current sign type, and returns how
+    long that took, in seconds.
+    """
+    start: float = time.perf_counter()
+    history: sign.History = sign.History()
+    sign_engine: Engine = Engine(config)
+    for argument in arguments():
+        sign_command: sign.Command = _sign_command(argument)
+        for current_sign_type in sign.transitions.CURRENT_SIGN_TYPES:
+            sign_engine.sign_type = current_sign_type
+            sign_engine.sign(sign_command)
+            ctx: _Context = _Context((), _Action())
+            action: _Action = ctx.new_action()
+            history.push(action, cast(str, sign_engine.sign_type))
+            ctx.translated(action)
+            history.current_sign_type(ctx)
+            history.undo([action])
+
+    for follow_on in _FOLLOW_ONS:
+        for sign_type in ("QUESTION", "ANSWER"):
+            sign.text(
+                sign_type,
+                [sign_type, "FOLLOWING_STATEMENT", *follow_on],
+                config
+            )
+
+    return time.perf_counter() - start
+
+def arguments() -> Iterator[str]:
+    """
+    Yields the meta argument string for every built-in command, in the form
+    used in the example dictionaries.
+    """
+    for sign_command in sign.transitions.builtin_commands():
+        if sign_command.sign_type == "BYLINE":
+            yield (
+                f"BYLINE:{sign_command.speaker_type}:{sign_command.variant}"
+            )
+        elif sign_command.sign_type == "SPEAKER":
+            yield f"{sign_command.speaker_type}:{sign_command.variant}"
+        else:
+            yield f"{sign_command.sign_type}:{sign_command.variant}"
+
+def _sign_command(argument: str) -> sign.Command:
+    q_and_a_command: command.Command = command.parse(argument)
+    if q_and_a_command.sign_command is None:
+        raise ValueError(f"Not a sign command: {argument}")
+
+    return q_and_a_command.sign_command
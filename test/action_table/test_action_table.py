@@ -0,0 +1,34 @@
+import gc
+
+from plover.formatting import _Action
+
+from plover_q_and_a.action_table import ActionTable
+
+
+def test_values_are_looked_up_by_action_identity():
+    table = ActionTable()
+    action = _Action(text="Q")
+    equal_action = _Action(text="Q")
+    table.set(action, "QUESTION")
+
+    assert action == equal_action
+    assert table.get(action) == "QUESTION"
+    assert table.get(equal_action) is None
+
+def test_setting_a_value_again_replaces_it():
+    table = ActionTable()
+    action = _Action()
+    table.set(action, "QUESTION")
+    table.set(action, "ANSWER")
+
+    assert table.get(action) == "ANSWER"
+    assert len(table) == 1
+
+def test_entries_are_removed_when_actions_are_dropped():
+    table = ActionTable()
+    action = _Action()
+    table.set(action, "QUESTION")
+    del action
+    gc.collect()
+
+    assert len(table) == 0
@@ -0,0 +1,26 @@
+import pytest
+
+from plover_q_and_a import command
+
+
+@pytest.fixture(autouse=True)
+def clear_command_cache():
+    command.parse.cache_clear()
+
+# Arguments
+
+@pytest.fixture
+def yield_after_argument():
+    return "question:following_statement:YIELD_AFTER:All right"
+
+@pytest.fixture
+def byline_argument():
+    return "BYLINE: plaintiff_1 :INITIAL"
+
+@pytest.fixture
+def set_name_argument():
+    return "SET_NAME:plaintiff_1"
+
+@pytest.fixture
+def unknown_set_name_argument():
+    return "SET_NAME:UNKNOWN"
@@ -0,0 +1,70 @@
+import pytest
+
+from plover_q_and_a import (
+    command,
+    sign
+)
+
+
+def test_blank_argument():
+    with pytest.raises(ValueError, match="No command provided"):
+        command.parse("")
+
+def test_blank_command():
+    with pytest.raises(ValueError, match="No command arguments provided"):
+        command.parse(" :INITIAL")
+
+def test_reset_config():
+    assert command.parse("reset_config") == command.Command("RESET_CONFIG")
+
+def test_stats():
+    assert command.parse("stats") == command.Command("STATS")
+
+def test_set_name(set_name_argument):
+    assert command.parse(set_name_argument) == command.Command(
+        "SET_NAME",
+        set_name_target="PLAINTIFF_1"
+    )
+
+def test_missing_set_name_args():
+    with pytest.raises(
+        ValueError,
+        match="No SET_NAME command arguments provided"
+    ):
+        command.parse("SET_NAME")
+
+def test_unknown_set_name_args(unknown_set_name_argument):
+    with pytest.raises(
+        ValueError,
+        match="Unknown SET_NAME command provided: UNKNOWN"
+    ):
+        command.parse(unknown_set_name_argument)
+
+def test_sign_command_with_follow_on(yield_after_argument):
+    assert command.parse(yield_after_argument) == command.Command(
+        "SIGN",
+        sign_command=sign.Command(
+            "QUESTION",
+            "FOLLOWING_STATEMENT",
+            follow_on_action="YIELD_AFTER",
+            follow_on_text="All right"
+        )
+    )
+
+def test_byline_command(byline_argument):
+    assert command.parse(byline_argument) == command.Command(
+        "SIGN",
+        sign_command=sign.Command(
+            "BYLINE",
+            "INITIAL",
+            speaker_type="PLAINTIFF_1"
+        )
+    )
+
+def test_repeat_arguments_are_served_from_cache(yield_after_argument):
+    first_command = command.parse(yield_after_argument)
+    second_command = command.parse(yield_after_argument)
+
+    assert first_command is second_command
+    assert command.parse.cache_info().hits == 1
+    assert command.parse.cache_info().maxsize is not None
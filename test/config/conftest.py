@@ -1,6 +1,8 @@
 from pathlib import Path
 import pytest
 
+from plover_q_and_a import config
+
 
 @pytest.fixture
 def bad_config_path():
@@ -35,34 +37,43 @@ def set_name_prompt_no_current_speaker_name_config_path():
     return _path("files/set_name_prompt_no_current_speaker_name.json")
 
 @pytest.fixture
-def default_config_path():
-    return _path("../../examples/config/platinum_steno.json")
-
-def _path(path):
-    return (Path(__file__).parent / path).resolve()
-
-# Arguments
+def sign_type_endings_config_path():
+    return _path("files/sign_type_endings.json")
 
 @pytest.fixture
-def speaker_type_questioner():
-    return "PLAINTIFF_1"
+def extension_settings_config_path():
+    return _path("files/extension_settings.json")
 
 @pytest.fixture
-def speaker_name_questioner():
-    return "MR. STPHAO"
+def default_config_path():
+    return _path("../../examples/config/platinum_steno.json")
 
 @pytest.fixture
-def speaker_type_answerer():
-    return "WITNESS"
+def writable_config_path(tmp_path, overrides_config_path):
+    config_path = tmp_path / "q_and_a.json"
+    config_path.write_bytes(overrides_config_path.read_bytes())
+    return config_path
 
 @pytest.fixture
-def speaker_name_answerer():
-    return "THE WITNESS"
+def snapshot_path(tmp_path):
+    return tmp_path / "q_and_a.snapshot"
+
+def _path(path):
+    return (Path(__file__).parent / path).resolve()
+
+# Config
 
 @pytest.fixture
-def config_with_local_speaker_name_changes():
-    return {
-        "speaker_names": {
+def config_with_local_speaker_name_changes(non_existent_config_path):
+    loaded_config = config.load(non_existent_config_path)
+    return loaded_config._replace(
+        speaker_names={
+            **loaded_config.speaker_names,
             "PLAINTIFF_1": "MR. CUSTOM NAME"
-        }
-    }
+        },
+        file_identity=None
+    )
+
+@pytest.fixture
+def changed_config_contents():
+    return '{"question": {"marker": {"text": "QUESTION"}}}'
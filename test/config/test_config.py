@@ -1,35 +1,14 @@
 import json
+import os
+import subprocess
+import sys
 import pytest
 
-from plover_q_and_a import config
-
-
-_NON_LAMBDA_CONFIG_KEYS = [
-    "QUESTION",
-    "SET_NAME_PROMPT",
-    "speaker_names",
-]
-_ONE_ARG_LAMBDA_CONFIG_KEYS = [
-    "QUESTION_FOLLOWING_INTERROGATIVE",
-    "QUESTION_FOLLOWING_STATEMENT",
-    "QUESTION_FOLLOWING_INTERRUPT",
-    "ANSWER_FOLLOWING_INTERROGATIVE",
-    "ANSWER_FOLLOWING_STATEMENT",
-    "ANSWER_FOLLOWING_INTERRUPT",
-    "SPEAKER_FOR",
-    "STATEMENT_ELABORATE"
-]
-_TWO_ARG_LAMBDA_CONFIG_KEYS = [
-    "BYLINE_FOR",
-    "SPEAKER_FOLLOWING_INTERRUPT_FOR",
-    "SPEAKER_FOLLOWING_INTERROGATIVE_FOR",
-    "SPEAKER_FOLLOWING_STATEMENT_FOR"
-]
-_THREE_ARG_LAMBDA_CONFIG_KEYS = [
-    "BYLINE_FOLLOWING_INTERROGATIVE_FOR",
-    "BYLINE_FOLLOWING_STATEMENT_FOR",
-    "BYLINE_FOLLOWING_INTERRUPT_FOR"
-]
+from plover_q_and_a import (
+    config,
+    sign
+)
+
 
 def test_bad_config(bad_config_path):
     with pytest.raises(
@@ -64,85 +43,74 @@ def test_no_current_speaker_name_in_set_name_prompt(
 
 def test_non_existent_config_loads_defaults(
     non_existent_config_path,
-    default_config_path,
-    speaker_name_questioner,
-    speaker_name_answerer,
-    speaker_type_questioner,
-    speaker_type_answerer
+    default_config_path
 ):
     loaded_config = config.load(non_existent_config_path)
     default_config = config.load(default_config_path)
-    for key in _NON_LAMBDA_CONFIG_KEYS:
-        assert loaded_config[key] == default_config[key]
-    for key in _ONE_ARG_LAMBDA_CONFIG_KEYS:
-        assert (
-            loaded_config[key](speaker_name_questioner)
-            == default_config[key](speaker_name_questioner)
-        )
-    for key in _TWO_ARG_LAMBDA_CONFIG_KEYS:
-        assert (
-            loaded_config[key]("", speaker_name_questioner)
-            == default_config[key]("", speaker_name_questioner)
-        )
-    for key in _THREE_ARG_LAMBDA_CONFIG_KEYS:
-        assert (
-            loaded_config[key](
-                "",
-                speaker_type_questioner,
-                speaker_name_questioner
-            ) == default_config[key](
-                "",
-                speaker_type_questioner,
-                speaker_name_questioner
-            )
-        )
-        assert (
-            loaded_config[key](
-                "",
-                speaker_type_answerer,
-                speaker_name_answerer
-            ) == default_config[key](
-                "",
-                speaker_type_answerer,
-                speaker_name_answerer
-            )
-        )
+
+    assert loaded_config.transitions == default_config.transitions
+    assert (
+        loaded_config._replace(transitions=None, file_identity=None)
+        == default_config._replace(transitions=None, file_identity=None)
+    )
 
 def test_specified_config_overwrites_defaults(
     overrides_config_path,
     default_config_path
 ):
     loaded_config = config.load(overrides_config_path)
-    loaded_config_speaker_name = loaded_config["speaker_names"]["PLAINTIFF_1"]
-    loaded_config_speaker = (
-        loaded_config["SPEAKER_FOR"](loaded_config_speaker_name)
-    )
     default_config = config.load(default_config_path)
-    default_config_speaker_name = default_config["speaker_names"]["PLAINTIFF_1"]
-    default_config_speaker = (
-        default_config["SPEAKER_FOR"](default_config_speaker_name)
-    )
 
-    assert loaded_config_speaker == "> PLAINTIFF 1 ->"
-    assert not loaded_config_speaker == default_config_speaker
+    assert loaded_config.speaker_marker == config.Affixes(pre="> ", post=" ->")
+    assert loaded_config.speaker_names["PLAINTIFF_1"] == "PLAINTIFF 1"
+    assert not loaded_config.speaker_marker == default_config.speaker_marker
+
+def test_sentence_endings_resolve_per_sign_type(sign_type_endings_config_path):
+    loaded_config = config.load(sign_type_endings_config_path)
+
+    assert loaded_config.endings["ANSWER"].statement_yield == "!\n\n"
+    assert loaded_config.endings["SPEAKER"].statement_yield == ".\n"
+    assert loaded_config.endings[None].statement_yield == ".\n"
+    assert loaded_config.endings["ANSWER"].statement_elaborate == "!  "
+    assert loaded_config.endings["QUESTION"].statement_elaborate == ".  "
+
+def test_config_is_immutable(non_existent_config_path):
+    loaded_config = config.load(non_existent_config_path)
+
+    with pytest.raises(AttributeError):
+        loaded_config.question_marker = "Q"
+
+def test_extension_settings_default_when_not_given(non_existent_config_path):
+    loaded_config = config.load(non_existent_config_path)
+
+    assert loaded_config.watch_config is False
+    assert loaded_config.reload_debounce == 0.1
+    assert loaded_config.collect_stats is False
+
+def test_extension_settings_read_from_config(extension_settings_config_path):
+    loaded_config = config.load(extension_settings_config_path)
+
+    assert loaded_config.watch_config is True
+    assert loaded_config.reload_debounce == 0.25
+    assert loaded_config.collect_stats is True
 
 def test_lower_case_speaker_names_get_upcased_when_no_formatting_upcase_given(
     lower_case_with_no_upcase_config_path
 ):
     loaded_config = config.load(lower_case_with_no_upcase_config_path)
-    assert loaded_config["speaker_names"]["PLAINTIFF_1"] == "MR. JOHNSON"
+    assert loaded_config.speaker_names["PLAINTIFF_1"] == "MR. JOHNSON"
 
 def test_lower_case_speaker_names_get_upcased_when_formatting_upcase_true(
     lower_case_with_upcase_config_path
 ):
     loaded_config = config.load(lower_case_with_upcase_config_path)
-    assert loaded_config["speaker_names"]["PLAINTIFF_1"] == "MR. JOHNSON"
+    assert loaded_config.speaker_names["PLAINTIFF_1"] == "MR. JOHNSON"
 
 def test_lower_case_speaker_names_stay_lowercased_when_formatting_upcase_false(
     lower_case_without_upcase_config_path
 ):
     loaded_config = config.load(lower_case_without_upcase_config_path)
-    assert loaded_config["speaker_names"]["PLAINTIFF_1"] == "mr. johnson"
+    assert loaded_config.speaker_names["PLAINTIFF_1"] == "mr. johnson"
 
 def test_reloading_does_not_overwrite_local_changes_to_speaker_names(
     default_config_path,
@@ -153,6 +121,59 @@ def test_reloading_does_not_overwrite_local_changes_to_speaker_names(
         config_with_local_speaker_name_changes
     )
     # Custom value stays
-    assert reloaded_config["speaker_names"]["PLAINTIFF_1"] == "MR. CUSTOM NAME"
+    assert reloaded_config.speaker_names["PLAINTIFF_1"] == "MR. CUSTOM NAME"
     # Default values inserted
-    assert reloaded_config["speaker_names"]["PLAINTIFF_2"] == "MR. SKWRAO"
+    assert reloaded_config.speaker_names["PLAINTIFF_2"] == "MR. SKWRAO"
+
+def test_reloading_unchanged_config_returns_current_config(
+    writable_config_path
+):
+    loaded_config = config.load(writable_config_path)
+
+    assert config.reload(writable_config_path, loaded_config) is loaded_config
+
+def test_reloading_touched_but_unchanged_config_reuses_current_config(
+    writable_config_path
+):
+    loaded_config = config.load(writable_config_path)
+    stat = writable_config_path.stat()
+    os.utime(
+        writable_config_path,
+        ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000)
+    )
+    reloaded_config = config.reload(writable_config_path, loaded_config)
+
+    assert reloaded_config.transitions is loaded_config.transitions
+    assert reloaded_config.file_identity != loaded_config.file_identity
+
+def test_reloading_changed_config_returns_new_config(writable_config_path):
+    loaded_config = config.load(writable_config_path)
+    writable_config_path.write_text(
+        json.dumps({"question": {"marker": {"text": "QUESTION"}}}),
+        encoding="utf-8"
+    )
+    reloaded_config = config.reload(writable_config_path, loaded_config)
+
+    assert reloaded_config is not loaded_config
+    assert reloaded_config.question_marker == "\tQUESTION\t"
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+        config.unknown
+
+def test_importing_extension_does_not_import_config_loading():
+    imported_modules = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, plover_q_and_a.extension; print(*sys.modules)"
+        ],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True
+    ).stdout.split()
+
+    assert "plover_q_and_a.config.reloader" in imported_modules
+    assert "plover_q_and_a.config.loader" not in imported_modules
+    assert "plover_q_and_a.config.watcher" not in imported_modules
@@ -0,0 +1,95 @@
+import threading
+import time
+
+from plover_q_and_a import config
+
+
+_TIMEOUT_SECONDS = 5
+
+def test_reloader_reloads_on_request():
+    reloaded = threading.Event()
+    config_reloader = config.Reloader(reloaded.set)
+    config_reloader.start()
+    try:
+        assert not reloaded.wait(0.05)
+        config_reloader.request()
+        assert reloaded.wait(_TIMEOUT_SECONDS)
+    finally:
+        config_reloader.stop()
+
+def test_reloader_folds_pending_requests_together():
+    reload_started = threading.Event()
+    release_reload = threading.Event()
+    reloads = []
+
+    def reload():
+        reloads.append(threading.current_thread().name)
+        reload_started.set()
+        release_reload.wait(_TIMEOUT_SECONDS)
+
+    config_reloader = config.Reloader(reload)
+    config_reloader.start()
+    try:
+        config_reloader.request()
+        assert reload_started.wait(_TIMEOUT_SECONDS)
+        for _ in range(10):
+            config_reloader.request()
+        release_reload.set()
+    finally:
+        config_reloader.stop()
+
+    assert 1 <= len(reloads) <= 2
+    assert reloads[0] != threading.current_thread().name
+
+def test_reloader_debounces_a_burst_of_requests_into_one_reload():
+    reloaded = threading.Event()
+    reloads = []
+
+    def reload():
+        reloads.append(True)
+        reloaded.set()
+
+    config_reloader = config.Reloader(reload, debounce=0.2)
+    config_reloader.start()
+    try:
+        for _ in range(5):
+            config_reloader.request()
+        assert reloaded.wait(_TIMEOUT_SECONDS)
+        time.sleep(0.3)
+    finally:
+        config_reloader.stop()
+
+    assert len(reloads) == 1
+    assert config_reloader.suppressed_count == 4
+
+def test_reloader_keeps_reloading_after_a_failed_reload(caplog):
+    reloaded = threading.Event()
+    reloads = []
+
+    def reload():
+        reloads.append(True)
+        if len(reloads) == 1:
+            raise PermissionError("q_and_a.json")
+        reloaded.set()
+
+    config_reloader = config.Reloader(reload)
+    config_reloader.start()
+    try:
+        config_reloader.request()
+        while not reloads:
+            time.sleep(0.01)
+        config_reloader.request()
+        assert reloaded.wait(_TIMEOUT_SECONDS)
+    finally:
+        config_reloader.stop()
+
+    assert "Q&A config reload failed" in caplog.text
+
+def test_reloader_does_not_reload_after_stop():
+    reloads = []
+    config_reloader = config.Reloader(lambda: reloads.append(True))
+    config_reloader.start()
+    config_reloader.stop()
+    config_reloader.request()
+
+    assert not reloads
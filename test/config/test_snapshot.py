@@ -0,0 +1,85 @@
+from plover_q_and_a import config
+from plover_q_and_a.config import (
+    snapshot,
+    transformer
+)
+from plover_q_and_a.sign import (
+    speaker_signs,
+    transitions
+)
+
+
+def test_loading_writes_snapshot(default_config_path, snapshot_path):
+    config.load(default_config_path, snapshot_path)
+
+    assert snapshot_path.exists()
+
+def test_loading_from_snapshot_matches_compiling(
+    monkeypatch,
+    default_config_path,
+    snapshot_path
+):
+    compiled_config = config.load(default_config_path, snapshot_path)
+    monkeypatch.setattr(transformer, "transform", _fail)
+    monkeypatch.setattr(speaker_signs, "prerender", _fail)
+    monkeypatch.setattr(transitions, "build", _fail)
+    snapshot_config = config.load(default_config_path, snapshot_path)
+
+    assert snapshot_config == compiled_config
+
+def test_missing_config_file_gets_no_snapshot(
+    non_existent_config_path,
+    snapshot_path
+):
+    config.load(non_existent_config_path, snapshot_path)
+
+    assert not snapshot_path.exists()
+
+def test_snapshot_for_other_contents_is_rebuilt(
+    writable_config_path,
+    changed_config_contents,
+    snapshot_path
+):
+    config.load(writable_config_path, snapshot_path)
+    writable_config_path.write_text(changed_config_contents, encoding="utf-8")
+    loaded_config = config.load(writable_config_path, snapshot_path)
+
+    assert loaded_config.question_marker == "\tQUESTION\t"
+    assert config.load(writable_config_path, snapshot_path).question_marker == (
+        "\tQUESTION\t"
+    )
+
+def test_snapshot_from_other_version_is_ignored(
+    monkeypatch,
+    default_config_path,
+    snapshot_path
+):
+    loaded_config = config.load(default_config_path, snapshot_path)
+    digest = loaded_config.file_identity.digest
+    assert snapshot.read(snapshot_path, digest) is not None
+
+    monkeypatch.setattr(snapshot, "_VERSION", -1)
+    assert snapshot.read(snapshot_path, digest) is None
+
+def test_snapshot_from_other_plugin_code_is_ignored(
+    monkeypatch,
+    default_config_path,
+    snapshot_path
+):
+    loaded_config = config.load(default_config_path, snapshot_path)
+    digest = loaded_config.file_identity.digest
+    assert snapshot.read(snapshot_path, digest) is not None
+
+    monkeypatch.setattr(snapshot, "_code_digest", lambda: "upgraded")
+    assert snapshot.read(snapshot_path, digest) is None
+
+def test_corrupt_snapshot_is_ignored(default_config_path, snapshot_path):
+    snapshot_path.write_bytes(b"not a snapshot")
+    loaded_config = config.load(default_config_path, snapshot_path)
+    digest = loaded_config.file_identity.digest
+
+    assert loaded_config.question_marker == "\tQ\t"
+    assert snapshot.read(snapshot_path, digest) is not None
+
+def _fail(_config):
+    raise AssertionError("config should have been read from snapshot")
@@ -0,0 +1,58 @@
+import threading
+
+from plover_q_and_a import config
+from plover_q_and_a.config import watcher
+
+
+_TIMEOUT_SECONDS = 5
+
+def test_watcher_notices_file_changes(
+    writable_config_path,
+    changed_config_contents
+):
+    changed = threading.Event()
+    config_watcher = config.Watcher(writable_config_path, changed.set)
+    config_watcher.start()
+    try:
+        writable_config_path.write_text(
+            changed_config_contents,
+            encoding="utf-8"
+        )
+        assert changed.wait(_TIMEOUT_SECONDS)
+    finally:
+        config_watcher.stop()
+
+def test_watcher_ignores_other_files_in_directory(writable_config_path):
+    changed = threading.Event()
+    config_watcher = config.Watcher(writable_config_path, changed.set)
+    config_watcher.start()
+    try:
+        (writable_config_path.parent / "other.json").write_text(
+            "{}",
+            encoding="utf-8"
+        )
+        assert not changed.wait(0.2)
+    finally:
+        config_watcher.stop()
+
+def test_watcher_falls_back_to_polling(
+    monkeypatch,
+    writable_config_path,
+    changed_config_contents
+):
+    monkeypatch.setattr(watcher, "_inotify_watch", lambda _directory: None)
+    changed = threading.Event()
+    config_watcher = config.Watcher(
+        writable_config_path,
+        changed.set,
+        poll_interval=0.01
+    )
+    config_watcher.start()
+    try:
+        writable_config_path.write_text(
+            changed_config_contents,
+            encoding="utf-8"
+        )
+        assert changed.wait(_TIMEOUT_SECONDS)
+    finally:
+        config_watcher.stop()
@@ -0,0 +1,15 @@
+from pathlib import Path
+
+import pytest
+
+from plover_q_and_a import config
+from plover_q_and_a.engine import Engine
+
+
+@pytest.fixture
+def default_config(tmp_path):
+    return config.load(Path(tmp_path) / "non_existent.json")
+
+@pytest.fixture
+def q_and_a_engine(default_config):
+    return Engine(default_config)
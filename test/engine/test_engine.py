@@ -0,0 +1,68 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def test_feed_follows_on_from_previous_sign(q_and_a_engine):
+    assert q_and_a_engine.feed("QUESTION:INITIAL") == "\tQ\t"
+    assert q_and_a_engine.sign_type == "QUESTION"
+    assert q_and_a_engine.feed("ANSWER:FOLLOWING_INTERROGATIVE") == (
+        "?\n\tA\t"
+    )
+    assert q_and_a_engine.sign_type == "ANSWER"
+
+def test_feed_non_sign_command(q_and_a_engine):
+    with pytest.raises(
+        ValueError,
+        match="SET_NAME commands can only be run in Plover"
+    ):
+        q_and_a_engine.feed("SET_NAME:PLAINTIFF_1")
+
+def test_feed_unknown_command(q_and_a_engine):
+    with pytest.raises(ValueError, match="Unknown sign type provided: FOO"):
+        q_and_a_engine.feed("FOO:INITIAL")
+
+def test_set_name(q_and_a_engine, default_config):
+    q_and_a_engine.set_name(" plaintiff_1 ", "MR. SMITH")
+
+    assert q_and_a_engine.feed("BYLINE:PLAINTIFF_1:INITIAL") == (
+        "BY MR. SMITH:\n\tQ\t"
+    )
+    assert q_and_a_engine.feed("PLAINTIFF_1:FOLLOWING_STATEMENT") == (
+        ".\n\tMR. SMITH:  "
+    )
+    assert default_config.speaker_names["PLAINTIFF_1"] != "MR. SMITH"
+
+def test_set_name_upcases_name(q_and_a_engine):
+    q_and_a_engine.set_name("PLAINTIFF_1", "Mr. Smith")
+
+    assert q_and_a_engine.config.speaker_names["PLAINTIFF_1"] == "MR. SMITH"
+
+def test_set_name_unknown_speaker_type(q_and_a_engine):
+    with pytest.raises(
+        ValueError,
+        match="Unknown speaker type provided: JUROR"
+    ):
+        q_and_a_engine.set_name("juror", "MS. JONES")
+
+def test_importing_engine_does_not_import_plover():
+    imported_modules = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, plover_q_and_a.engine; print(*sys.modules)"
+        ],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True
+    ).stdout.split()
+
+    assert "plover_q_and_a.engine" in imported_modules
+    assert not [
+        module
+        for module in imported_modules
+        if module == "plover" or module.startswith("plover.")
+    ]
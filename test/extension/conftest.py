@@ -0,0 +1,38 @@
+from pathlib import Path
+
+import pytest
+
+from plover.formatting import Formatter
+from replay import (
+    FormatterEngine,
+    TranscriptOutput
+)
+
+from plover_q_and_a import extension
+
+
+@pytest.fixture
+def config_path():
+    return Path(__file__).parents[1] / "config/files/sign_type_endings.json"
+
+@pytest.fixture
+def output():
+    return TranscriptOutput()
+
+@pytest.fixture
+def formatter(output):
+    formatter = Formatter()
+    formatter.set_output(output)
+    return formatter
+
+@pytest.fixture
+def q_and_a(tmp_path, formatter, config_path):
+    q_and_a = extension.QAndA(
+        FormatterEngine(formatter),
+        config_file=config_path,
+        snapshot_file=None,
+        stats_file=tmp_path / "stats.json"
+    )
+    q_and_a.start()
+    yield q_and_a
+    q_and_a.stop()
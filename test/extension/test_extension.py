@@ -0,0 +1,137 @@
+from pathlib import Path
+
+import pytest
+
+from plover.registry import registry
+from plover.translation import Translation
+
+from plover_q_and_a import config
+
+
+_EXTENSION_SETTINGS_CONFIG_PATH = (
+    Path(__file__).parents[1] / "config/files/extension_settings.json"
+)
+
+
+def _translate(formatter, translations, english):
+    translation = Translation([], english)
+    formatter.format([], [translation], translations)
+    translations.append(translation)
+
+def _retranslate(formatter, translations, english):
+    translation = Translation([], english)
+    formatter.format([translations.pop()], [translation], translations)
+    translations.append(translation)
+
+def _undo(formatter, translations):
+    formatter.format([translations.pop()], [], translations)
+
+@pytest.fixture
+def reload_on_request(monkeypatch):
+    monkeypatch.setattr(
+        config.Reloader,
+        "request",
+        lambda config_reloader: config_reloader._reload()
+    )
+
+@pytest.fixture
+def answered_translations(q_and_a, formatter):
+    translations = []
+    for english in (
+        "{:Q_AND_A:QUESTION:INITIAL}",
+        "did you see it",
+        "{:Q_AND_A:ANSWER:FOLLOWING_INTERROGATIVE}",
+        "yes"
+    ):
+        _translate(formatter, translations, english)
+
+    return translations
+
+def test_signs_follow_on_from_each_other(
+    answered_translations,
+    formatter,
+    output
+):
+    _translate(
+        formatter,
+        answered_translations,
+        "{:Q_AND_A:QUESTION:FOLLOWING_STATEMENT}"
+    )
+
+    assert "".join(output.characters) == (
+        "\tQ\tDid you see it?\n\tA\tYes!\n\n\tQ\t"
+    )
+
+def test_replacing_a_sign_follows_on_from_the_sign_before_it(
+    answered_translations,
+    formatter,
+    output
+):
+    _translate(
+        formatter,
+        answered_translations,
+        "{:Q_AND_A:QUESTION:FOLLOWING_STATEMENT}"
+    )
+    _retranslate(
+        formatter,
+        answered_translations,
+        "{:Q_AND_A:QUESTION:FOLLOWING_STATEMENT}Where"
+    )
+
+    assert "".join(output.characters).endswith("Yes!\n\n\tQ\tWhere")
+
+def test_replacing_a_sign_and_text_follows_on_from_the_sign_before_it(
+    answered_translations,
+    formatter,
+    output
+):
+    _translate(
+        formatter,
+        answered_translations,
+        "{:Q_AND_A:QUESTION:FOLLOWING_STATEMENT}Where"
+    )
+    _retranslate(
+        formatter,
+        answered_translations,
+        "{:Q_AND_A:QUESTION:FOLLOWING_STATEMENT}"
+    )
+
+    assert "".join(output.characters).endswith("Yes!\n\n\tQ\t")
+
+def test_undoing_a_sign_follows_on_from_the_sign_before_it(
+    answered_translations,
+    formatter,
+    output
+):
+    _translate(
+        formatter,
+        answered_translations,
+        "{:Q_AND_A:QUESTION:FOLLOWING_STATEMENT}"
+    )
+    _undo(formatter, answered_translations)
+    _translate(
+        formatter,
+        answered_translations,
+        "{:Q_AND_A:QUESTION:FOLLOWING_STATEMENT}"
+    )
+
+    assert "".join(output.characters).endswith("Yes!\n\n\tQ\t")
+
+def test_unreadable_config_keeps_the_current_config(
+    q_and_a,
+    monkeypatch,
+    tmp_path,
+    caplog
+):
+    loaded_config = q_and_a._loaded_engine().config
+    monkeypatch.setattr(q_and_a, "_config_file", tmp_path)
+    q_and_a._reload_config()
+
+    assert q_and_a._loaded_engine().config is loaded_config
+    assert "Unable to reload Q&A config" in caplog.text
+
+@pytest.mark.parametrize("config_path", [_EXTENSION_SETTINGS_CONFIG_PATH])
+def test_first_reload_keeps_the_timed_meta(reload_on_request, q_and_a):
+    assert registry.get_plugin("meta", "Q_AND_A").obj == (
+        q_and_a._timed_q_and_a
+    )
@@ -57,63 +57,47 @@ def answer_following_interrogative_then_elaborate_type(
 # Config
 
 @pytest.fixture
-def answer_following_interrupt_config():
-    return {
-        "ANSWER_FOLLOWING_INTERRUPT": lambda _current_sign_type: " --\n\tA\t"
-    }
+def answer_config(sign_config):
+    return sign_config._replace(answer_marker="\tA\t")
 
 @pytest.fixture
-def answer_following_statement_config():
-    return {
-        "ANSWER_FOLLOWING_STATEMENT": lambda _current_sign_type: ".\n\tA\t"
-    }
+def answer_following_interrupt_config(answer_config, sign_endings):
+    return answer_config._replace(
+        endings={None: sign_endings._replace(interrupt_yield=" --\n")}
+    )
 
 @pytest.fixture
-def question_following_statement_config():
-    return {
-        "QUESTION_FOLLOWING_STATEMENT": lambda _current_sign_type: ".\n\tQ\t"
-    }
+def answer_following_statement_config(answer_config):
+    return answer_config
 
 @pytest.fixture
 def answer_following_statement_then_yield_to_question_config(
-    answer_following_statement_config,
-    question_following_statement_config
+    answer_following_statement_config
 ):
-    return (
-        answer_following_statement_config
-        | question_following_statement_config
+    return answer_following_statement_config._replace(
+        question_marker="\tQ\t"
     )
 
-@pytest.fixture
-def statement_elaborate_config():
-    return { "STATEMENT_ELABORATE": lambda _current_sign_type: ". " }
-
 @pytest.fixture
 def answer_following_statement_then_elaborate_config(
-    answer_following_statement_config,
-    statement_elaborate_config
+    answer_following_statement_config
 ):
-    return answer_following_statement_config | statement_elaborate_config
+    return answer_following_statement_config
 
 @pytest.fixture
-def answer_following_interrogative_config():
-    return {
-        "ANSWER_FOLLOWING_INTERROGATIVE": lambda _current_sign_type: "?\n\tA\t"
-    }
+def answer_following_interrogative_config(answer_config):
+    return answer_config
 
 @pytest.fixture
 def answer_following_interrogative_then_yield_to_question_config(
-    answer_following_interrogative_config,
-    question_following_statement_config
+    answer_following_interrogative_config
 ):
-    return (
-        answer_following_interrogative_config
-        | question_following_statement_config
+    return answer_following_interrogative_config._replace(
+        question_marker="\tQ\t"
     )
 
 @pytest.fixture
 def answer_following_interrogative_then_elaborate_config(
-    answer_following_interrogative_config,
-    statement_elaborate_config
+    answer_following_interrogative_config
 ):
-    return answer_following_interrogative_config | statement_elaborate_config
+    return answer_following_interrogative_config
@@ -1,5 +1,10 @@
 import pytest
 
+from plover_q_and_a import (
+    config,
+    sign
+)
+
 
 # Command Arguments
 
@@ -62,95 +67,56 @@ def answer_byline_following_interrupt_type(byline_arg):
 # Config
 
 @pytest.fixture
-def question_byline_speaker_config():
-    return {
-        "speaker_names": {
-            "PLAINTIFF_1": "MR. STPHAO"
-        }
-    }
+def byline_config(sign_config):
+    return sign_config._replace(
+        question_byline=config.Affixes(pre="BY ", post=":\n\tQ\t"),
+        answer_byline=config.Affixes(pre="", post=":\tA\t")
+    )
+
+@pytest.fixture
+def question_byline_speaker_config(byline_config):
+    return sign.speaker_signs.prerender(
+        byline_config._replace(speaker_names={"PLAINTIFF_1": "MR. STPHAO"})
+    )
 
 @pytest.fixture
-def answer_byline_speaker_config():
-    return {
-        "speaker_names": {
-            "WITNESS": "THE WITNESS"
-        }
-    }
+def answer_byline_speaker_config(byline_config):
+    return sign.speaker_signs.prerender(
+        byline_config._replace(speaker_names={"WITNESS": "THE WITNESS"})
+    )
 
 @pytest.fixture
-def no_byline_speaker_name_config_for_speaker_type():
-    return {
-        "speaker_names": {
-            "PLAINTIFF_2": "MR. SKWRAO"
-        }
-    }
+def no_byline_speaker_name_config_for_speaker_type(byline_config):
+    return sign.speaker_signs.prerender(
+        byline_config._replace(speaker_names={"PLAINTIFF_2": "MR. SKWRAO"})
+    )
 
 @pytest.fixture
 def initial_byline_config(question_byline_speaker_config):
-    return question_byline_speaker_config | {
-        "BYLINE_FOR": (
-            lambda speaker_type, speaker_name: f"BY {speaker_name}:\n\tQ\t"
-        )
-    }
+    return question_byline_speaker_config
 
 @pytest.fixture
 def question_byline_following_interrogative_config(
     question_byline_speaker_config
 ):
-    return question_byline_speaker_config | {
-        "BYLINE_FOLLOWING_INTERROGATIVE_FOR": (
-            lambda _current_sign_type, _speaker_type, speaker_name: (
-                f"?\nBY {speaker_name}:\n\tQ\t"
-            )
-        )
-    }
+    return question_byline_speaker_config
 
 @pytest.fixture
 def question_byline_following_statement_config(question_byline_speaker_config):
-    return question_byline_speaker_config | {
-        "BYLINE_FOLLOWING_STATEMENT_FOR": (
-            lambda _current_sign_type, _speaker_type, speaker_name: (
-                f".\nBY {speaker_name}:\n\tQ\t"
-            )
-        )
-    }
+    return question_byline_speaker_config
 
 @pytest.fixture
 def question_byline_following_interrupt_config(question_byline_speaker_config):
-    return question_byline_speaker_config | {
-        "BYLINE_FOLLOWING_INTERRUPT_FOR": (
-            lambda _current_sign_type, _speaker_type, speaker_name: (
-                f"--\nBY {speaker_name}:\n\tQ\t"
-            )
-        )
-    }
+    return question_byline_speaker_config
 
 @pytest.fixture
 def answer_byline_following_interrogative_config(answer_byline_speaker_config):
-    return answer_byline_speaker_config | {
-        "BYLINE_FOLLOWING_INTERROGATIVE_FOR": (
-            lambda _current_sign_type, _speaker_type, speaker_name: (
-                f"?\n{speaker_name}:\tA\t"
-            )
-        )
-    }
+    return answer_byline_speaker_config
 
 @pytest.fixture
 def answer_byline_following_statement_config(answer_byline_speaker_config):
-    return answer_byline_speaker_config | {
-        "BYLINE_FOLLOWING_STATEMENT_FOR": (
-            lambda _current_sign_type, _speaker_type, speaker_name: (
-                f".\n{speaker_name}:\tA\t"
-            )
-        )
-    }
+    return answer_byline_speaker_config
 
 @pytest.fixture
 def answer_byline_following_interrupt_config(answer_byline_speaker_config):
-    return answer_byline_speaker_config | {
-        "BYLINE_FOLLOWING_INTERRUPT_FOR": (
-            lambda _current_sign_type, _speaker_type, speaker_name: (
-                f"--\n{speaker_name}:\tA\t"
-            )
-        )
-    }
+    return answer_byline_speaker_config
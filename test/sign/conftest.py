@@ -1,6 +1,43 @@
 import pytest
 
+from plover_q_and_a import config
+
+
+@pytest.fixture
+def blank_endings():
+    return config.Endings(
+        interrogative_yield="",
+        statement_yield="",
+        statement_elaborate="",
+        interrupt_yield=""
+    )
+
+@pytest.fixture
+def blank_config(blank_endings):
+    return config.Config(
+        question_marker="",
+        answer_marker="",
+        question_byline=config.Affixes(pre="", post=""),
+        answer_byline=config.Affixes(pre="", post=""),
+        speaker_marker=config.Affixes(pre="", post=""),
+        speaker_names={},
+        speaker_upcase=False,
+        endings={None: blank_endings},
+        set_name_prompt="",
+        watch_config=False,
+        reload_debounce=0.0,
+        collect_stats=False
+    )
+
+@pytest.fixture
+def sign_endings(blank_endings):
+    return blank_endings._replace(
+        interrogative_yield="?\n",
+        statement_yield=".\n",
+        statement_elaborate=". ",
+        interrupt_yield="--\n"
+    )
 
 @pytest.fixture
-def blank_config():
-    return {}
+def sign_config(blank_config, sign_endings):
+    return blank_config._replace(endings={None: sign_endings})
@@ -22,13 +22,9 @@ def unknown_follow_on_action_type(no_follow_on_args_type):
 # Config
 
 @pytest.fixture
-def no_follow_on_args_config():
-    return {
-        "QUESTION_FOLLOWING_STATEMENT": lambda _current_sign_type: ".\n\tQ\t"
-    }
+def no_follow_on_args_config(sign_config):
+    return sign_config._replace(question_marker="\tQ\t")
 
 @pytest.fixture
 def follow_on_args_config(no_follow_on_args_config):
-    return no_follow_on_args_config | {
-        "STATEMENT_ELABORATE": lambda _current_sign_type: ". "
-    }
+    return no_follow_on_args_config
@@ -0,0 +1,117 @@
+import gc
+
+from plover.formatting import (
+    _Action,
+    _Context
+)
+
+from plover_q_and_a import sign
+
+
+class _CountingContext(_Context):
+    scanned_count = 0
+
+    def iter_last_actions(self):
+        for action in super().iter_last_actions():
+            self.scanned_count += 1
+            yield action
+
+def _ctx(*previous_actions):
+    ctx = _Context([], _Action())
+    for previous_action in previous_actions:
+        ctx.translated(previous_action)
+
+    return ctx
+
+def test_empty_history_has_no_current_sign_type():
+    assert sign.History().current_sign_type(_ctx()) is None
+
+def test_current_sign_type_is_from_most_recent_sign():
+    history = sign.History()
+    question_action = _Action()
+    answer_action = _Action()
+    history.push(question_action, "QUESTION")
+    history.push(answer_action, "ANSWER")
+
+    assert history.current_sign_type(
+        _ctx(question_action, answer_action, _Action(text="text"))
+    ) == "ANSWER"
+
+def test_undoing_a_sign_restores_the_previous_sign_type():
+    history = sign.History()
+    question_action = _Action()
+    answer_action = _Action()
+    history.push(question_action, "QUESTION")
+    history.push(answer_action, "ANSWER")
+    history.undo([_Action(text="text"), answer_action])
+
+    assert history.current_sign_type(_ctx(question_action)) == "QUESTION"
+
+def test_undoing_a_retranslated_sign_keeps_its_replacement():
+    history = sign.History()
+    question_action = _Action()
+    replacement_action = _Action()
+    history.push(question_action, "QUESTION")
+    history.push(replacement_action, "SPEAKER")
+    history.undo([question_action])
+
+    assert history.current_sign_type(_ctx(replacement_action)) == "SPEAKER"
+
+def test_undoing_every_sign_leaves_no_current_sign_type():
+    history = sign.History()
+    question_action = _Action()
+    history.push(question_action, "QUESTION")
+    history.undo([question_action])
+
+    assert history.current_sign_type(_ctx()) is None
+
+def test_sign_being_replaced_is_not_current():
+    history = sign.History()
+    question_action = _Action()
+    answer_action = _Action()
+    history.push(question_action, "QUESTION")
+    history.push(answer_action, "ANSWER")
+
+    assert history.current_sign_type(
+        _ctx(question_action, _Action(text="text"))
+    ) == "QUESTION"
+    history.undo([answer_action])
+    assert history.current_sign_type(_ctx(question_action)) == "QUESTION"
+
+def test_only_sign_being_replaced_is_not_current():
+    history = sign.History()
+    question_action = _Action()
+    history.push(question_action, "QUESTION")
+
+    assert history.current_sign_type(_ctx(_Action(text="text"))) is None
+
+def test_dropped_actions_keep_their_sign_type():
+    history = sign.History()
+    history.push(_Action(), "QUESTION")
+    gc.collect()
+    answer_action = _Action()
+    history.push(answer_action, "ANSWER")
+    history.undo([answer_action])
+
+    assert history.current_sign_type(_ctx()) == "QUESTION"
+
+def test_dropped_actions_keep_their_sign_type_while_replacing():
+    history = sign.History()
+    history.push(_Action(), "QUESTION")
+    gc.collect()
+    answer_action = _Action()
+    history.push(answer_action, "ANSWER")
+
+    assert history.current_sign_type(_ctx(_Action(text="text"))) == "QUESTION"
+
+def test_long_answer_is_not_scanned_back_to_its_sign():
+    history = sign.History()
+    answer_action = _Action()
+    history.push(answer_action, "ANSWER")
+    ctx = _CountingContext([], _Action())
+    ctx.translated(answer_action)
+    for _ in range(1000):
+        ctx.translated(_Action(text="word"))
+
+    assert history.current_sign_type(ctx) == "ANSWER"
+    assert ctx.scanned_count < 100
@@ -61,69 +61,43 @@ def question_following_interrupt_type(question_arg):
 # Config
 
 @pytest.fixture
-def initial_question_config():
-    return { "QUESTION": "\tQ\t" }
+def initial_question_config(sign_config):
+    return sign_config._replace(question_marker="\tQ\t")
 
 @pytest.fixture
-def question_following_interrupt_config():
-    return {
-        "QUESTION_FOLLOWING_INTERRUPT": lambda _current_sign_type: "--\n\tQ\t"
-    }
+def question_following_interrupt_config(initial_question_config):
+    return initial_question_config
 
 @pytest.fixture
-def question_following_statement_config():
-    return {
-        "QUESTION_FOLLOWING_STATEMENT": lambda _current_sign_type: ".\n\tQ\t"
-    }
-
-@pytest.fixture
-def answer_following_interrogative_config():
-    return {
-        "ANSWER_FOLLOWING_INTERROGATIVE": lambda _current_sign_type: "?\n\tA\t"
-    }
+def question_following_statement_config(initial_question_config):
+    return initial_question_config
 
 @pytest.fixture
 def question_following_statement_then_yield_to_answer_config(
-    question_following_statement_config,
-    answer_following_interrogative_config
+    question_following_statement_config
 ):
-    return (
-        question_following_statement_config
-        | answer_following_interrogative_config
-    )
-
-@pytest.fixture
-def statement_elaborate_config():
-    return { "STATEMENT_ELABORATE": lambda _current_sign_type: ". " }
+    return question_following_statement_config._replace(answer_marker="\tA\t")
 
 @pytest.fixture
 def question_following_statement_then_elaborate_config(
-    question_following_statement_config,
-    statement_elaborate_config
+    question_following_statement_config
 ):
-    return question_following_statement_config | statement_elaborate_config
+    return question_following_statement_config
 
 @pytest.fixture
-def question_following_interrogative_config():
-    return {
-        "QUESTION_FOLLOWING_INTERROGATIVE": (
-            lambda _current_sign_type: "?\n\tQ\t"
-        )
-    }
+def question_following_interrogative_config(initial_question_config):
+    return initial_question_config
 
 @pytest.fixture
 def question_following_interrogative_then_yield_to_answer_config(
-    question_following_interrogative_config,
-    answer_following_interrogative_config
+    question_following_interrogative_config
 ):
-    return (
-        question_following_interrogative_config
-        | answer_following_interrogative_config
+    return question_following_interrogative_config._replace(
+        answer_marker="\tA\t"
     )
 
 @pytest.fixture
 def question_following_interrogative_then_elaborate_config(
-    question_following_interrogative_config,
-    statement_elaborate_config
+    question_following_interrogative_config
 ):
-    return question_following_interrogative_config | statement_elaborate_config
+    return question_following_interrogative_config
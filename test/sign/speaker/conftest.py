@@ -1,5 +1,10 @@
 import pytest
 
+from plover_q_and_a import (
+    config,
+    sign
+)
+
 
 # Command Arguments
 
@@ -34,53 +39,37 @@ def speaker_following_interrupt_type(speaker_arg):
 # Config
 
 @pytest.fixture
-def unknown_speaker_config():
-    return {
-        "speaker_names": {
-            "COURT": "THE COURT"
-        }
-    }
+def speaker_marker_config(sign_config):
+    return sign_config._replace(
+        speaker_marker=config.Affixes(pre="\t", post=":  ")
+    )
+
+@pytest.fixture
+def unknown_speaker_config(speaker_marker_config):
+    return sign.speaker_signs.prerender(
+        speaker_marker_config._replace(speaker_names={"COURT": "THE COURT"})
+    )
 
 @pytest.fixture
-def speaker_config():
-    return {
-        "speaker_names": {
-            "WITNESS": "THE WITNESS"
-        }
-    }
+def speaker_config(speaker_marker_config):
+    return sign.speaker_signs.prerender(
+        speaker_marker_config._replace(
+            speaker_names={"WITNESS": "THE WITNESS"}
+        )
+    )
 
 @pytest.fixture
 def initial_speaker_config(speaker_config):
-    return speaker_config | {
-        "SPEAKER_FOR": lambda speaker_name: f"\t{speaker_name}:  "
-    }
+    return speaker_config
 
 @pytest.fixture
 def speaker_following_interrogative_config(speaker_config):
-    return speaker_config | {
-        "SPEAKER_FOLLOWING_INTERROGATIVE_FOR": (
-            lambda _current_sign_type, speaker_name: (
-                f"?\n\t{speaker_name}:  "
-            )
-        )
-    }
+    return speaker_config
 
 @pytest.fixture
 def speaker_following_statement_config(speaker_config):
-    return speaker_config | {
-        "SPEAKER_FOLLOWING_STATEMENT_FOR": (
-            lambda _current_sign_type, speaker_name: (
-                f".\n\t{speaker_name}:  "
-            )
-        )
-    }
+    return speaker_config
 
 @pytest.fixture
 def speaker_following_interrupt_config(speaker_config):
-    return speaker_config | {
-        "SPEAKER_FOLLOWING_INTERRUPT_FOR": (
-            lambda _current_sign_type, speaker_name: (
-                f"--\n\t{speaker_name}:  "
-            )
-        )
-    }
+    return speaker_config
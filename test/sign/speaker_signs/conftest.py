@@ -0,0 +1,31 @@
+from pathlib import Path
+import pytest
+
+from plover_q_and_a import (
+    config,
+    sign
+)
+
+
+@pytest.fixture
+def loaded_config():
+    return config.load(
+        (
+            Path(__file__).parent
+            / "../../../examples/config/platinum_steno.json"
+        ).resolve()
+    )
+
+# Commands
+
+@pytest.fixture
+def speaker_command():
+    return sign.Command(
+        "SPEAKER",
+        "FOLLOWING_STATEMENT",
+        speaker_type="PLAINTIFF_1"
+    )
+
+@pytest.fixture
+def other_speaker_command():
+    return sign.Command("SPEAKER", "INITIAL", speaker_type="DEFENSE_1")
@@ -0,0 +1,57 @@
+from plover_q_and_a import sign
+
+
+def test_every_speaker_is_prerendered(loaded_config):
+    assert loaded_config.speaker_signs.keys() == (
+        loaded_config.speaker_names.keys()
+    )
+    assert loaded_config.speaker_signs["PLAINTIFF_1"] == (
+        sign.speaker_signs.SpeakerSigns(
+            byline="BY MR. STPHAO:\n\tQ\t",
+            speaker="\tMR. STPHAO:  "
+        )
+    )
+    assert loaded_config.speaker_signs["WITNESS"].byline == (
+        "THE WITNESS\tA\t"
+    )
+
+def test_rename_only_rerenders_affected_speaker(
+    loaded_config,
+    speaker_command,
+    other_speaker_command
+):
+    other_speaker_row = loaded_config.transitions[(None, other_speaker_command)]
+    renamed_config = sign.speaker_signs.rename(
+        loaded_config,
+        "PLAINTIFF_1",
+        "MR. CUSTOM NAME"
+    )
+
+    assert renamed_config.speaker_names["PLAINTIFF_1"] == "MR. CUSTOM NAME"
+    assert renamed_config.speaker_signs["PLAINTIFF_1"].speaker == (
+        "\tMR. CUSTOM NAME:  "
+    )
+    assert renamed_config.speaker_signs["DEFENSE_1"] is (
+        loaded_config.speaker_signs["DEFENSE_1"]
+    )
+    assert (
+        sign.transitions.lookup("ANSWER", speaker_command, renamed_config)
+        == ("SPEAKER", ".\n\tMR. CUSTOM NAME:  ")
+    )
+    assert renamed_config.transitions[(None, other_speaker_command)] is (
+        other_speaker_row
+    )
+
+def test_rename_leaves_original_config_untouched(
+    loaded_config,
+    speaker_command
+):
+    original_row = loaded_config.transitions[("ANSWER", speaker_command)]
+    sign.speaker_signs.rename(loaded_config, "PLAINTIFF_1", "MR. CUSTOM NAME")
+
+    assert loaded_config.speaker_names["PLAINTIFF_1"] == "MR. STPHAO"
+    assert (
+        sign.transitions.lookup("ANSWER", speaker_command, loaded_config)
+        == original_row
+        == ("SPEAKER", ".\n\tMR. STPHAO:  ")
+    )
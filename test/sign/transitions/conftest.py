@@ -0,0 +1,55 @@
+from pathlib import Path
+import pytest
+
+from plover_q_and_a import (
+    config,
+    sign
+)
+
+
+@pytest.fixture
+def loaded_config():
+    return config.load(
+        (
+            Path(__file__).parent
+            / "../../../examples/config/platinum_steno.json"
+        ).resolve()
+    )
+
+# Commands
+
+@pytest.fixture
+def byline_command():
+    return sign.Command("BYLINE", "INITIAL", speaker_type="PLAINTIFF_1")
+
+@pytest.fixture
+def speaker_command():
+    return sign.Command(
+        "SPEAKER",
+        "FOLLOWING_STATEMENT",
+        speaker_type="PLAINTIFF_1"
+    )
+
+@pytest.fixture
+def other_speaker_command():
+    return sign.Command("SPEAKER", "INITIAL", speaker_type="DEFENSE_1")
+
+@pytest.fixture
+def follow_on_command():
+    return sign.Command(
+        "ANSWER",
+        "FOLLOWING_INTERROGATIVE",
+        follow_on_action="YIELD_AFTER",
+        follow_on_text="Correct"
+    )
+
+# Config
+
+@pytest.fixture
+def speaker_config(blank_config):
+    return sign.speaker_signs.prerender(
+        blank_config._replace(
+            speaker_names={"PLAINTIFF_1": "MR. STPHAO"},
+            speaker_marker=config.Affixes(pre="\t", post=":  ")
+        )
+    )
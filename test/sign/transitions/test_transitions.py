@@ -0,0 +1,34 @@
+from plover_q_and_a import sign
+
+
+def test_built_in_commands_are_prerendered(loaded_config, byline_command):
+    transitions = loaded_config.transitions
+
+    assert (None, byline_command) in transitions
+    assert (
+        sign.transitions.lookup("ANSWER", byline_command, loaded_config)
+        == sign.render("ANSWER", byline_command, loaded_config)
+        == ("QUESTION", "BY MR. STPHAO:\n\tQ\t")
+    )
+
+def test_follow_on_commands_get_rendered_without_being_added(
+    loaded_config,
+    follow_on_command
+):
+    transitions = loaded_config.transitions
+    transitions_length = len(transitions)
+
+    assert (
+        sign.transitions.lookup("QUESTION", follow_on_command, loaded_config)
+        == ("QUESTION", "?\n\tA\tCorrect.\n\tQ\t")
+    )
+    assert ("QUESTION", follow_on_command) not in transitions
+    assert len(transitions) == transitions_length
+
+def test_config_without_transitions_gets_rendered_directly(speaker_config):
+    command = sign.Command("SPEAKER", "INITIAL", speaker_type="PLAINTIFF_1")
+
+    assert (
+        sign.transitions.lookup(None, command, speaker_config)
+        == ("SPEAKER", "\tMR. STPHAO:  ")
+    )
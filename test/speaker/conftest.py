@@ -0,0 +1,23 @@
+import pytest
+
+from plover.formatting import (
+    _Action,
+    _Context
+)
+
+from plover_q_and_a import config
+
+
+@pytest.fixture
+def ctx():
+    return _Context([], _Action())
+
+@pytest.fixture
+def default_config(tmp_path):
+    return config.load(tmp_path / "non_existent.json")
+
+# Arguments
+
+@pytest.fixture
+def speaker_type():
+    return "PLAINTIFF_1"
@@ -0,0 +1,56 @@
+import pytest
+
+from plover.formatting import (
+    _Action,
+    _Context
+)
+
+from plover_q_and_a.speaker.formatting import iter_last_fragments
+
+
+@pytest.mark.parametrize(
+    "actions",
+    [
+        [],
+        [("Mr.", False, ""), ("Smith", False, "")],
+        [("S", True, ""), ("m", True, ""), ("i", True, ""), ("th", True, "")],
+        [
+            ("  ", False, ""),
+            ("a b ", True, ""),
+            (" c", True, ""),
+            ("d", True, "")
+        ],
+        [("Jones", False, ""), ("Smyth", False, ""), ("ith", True, "yth")],
+        [("one two", False, ""), (None, False, ""), ("\t", True, "")],
+    ]
+)
+def test_fragments_match_plover(actions):
+    ctx = _Context([], _Action())
+    for text, prev_attach, prev_replace in actions:
+        action = ctx.new_action()
+        action.text = text
+        action.prev_attach = prev_attach
+        action.prev_replace = prev_replace
+        ctx.translated(action)
+
+    fragments = [fragment for _action, fragment in iter_last_fragments(ctx)]
+
+    assert fragments == list(ctx.iter_last_fragments())
+
+def test_fragments_come_with_the_action_they_were_completed_in(ctx):
+    prompt_action = ctx.new_action()
+    prompt_action.text = "[Set name =>] "
+    prompt_action.next_attach = True
+    ctx.translated(prompt_action)
+    for text in ("Mr.", "Smith"):
+        action = ctx.new_action()
+        action.text = text
+        ctx.translated(action)
+
+    fragments = list(iter_last_fragments(ctx))
+
+    assert [fragment for _action, fragment in fragments[:2]] == [
+        "Smith",
+        "Mr. "
+    ]
+    assert fragments[1][0] is prompt_action
@@ -0,0 +1,160 @@
+import gc
+
+from plover.formatting import (
+    _Action,
+    _Context
+)
+
+from plover_q_and_a import speaker
+
+
+def test_done_without_open_prompt_is_ignored(ctx, default_config):
+    prompts = speaker.Prompts()
+    action = ctx.new_action()
+    new_config = speaker.set_name(
+        "DONE",
+        ctx,
+        action,
+        default_config,
+        prompts
+    )
+
+    assert new_config is default_config
+    assert action.prev_replace == ""
+    assert not prompts.has_tagged_actions()
+
+def test_done_sets_name_typed_since_prompt(ctx, default_config, speaker_type):
+    prompts = speaker.Prompts()
+    _translate_set_name(ctx, default_config, speaker_type, prompts)
+    _translate_text(ctx, "Mr.")
+    _translate_text(ctx, "Smith")
+    action = ctx.new_action()
+    new_config = speaker.set_name(
+        "DONE",
+        ctx,
+        action,
+        default_config,
+        prompts
+    )
+
+    assert new_config.speaker_names[speaker_type] == "MR. SMITH"
+    assert default_config.speaker_names[speaker_type] != "MR. SMITH"
+    assert action.prev_replace.endswith(" MR. SMITH")
+    assert prompts.open_prompt is None
+
+def test_done_after_closed_prompt_is_ignored(
+    ctx,
+    default_config,
+    speaker_type
+):
+    prompts = speaker.Prompts()
+    _translate_set_name(ctx, default_config, speaker_type, prompts)
+    _translate_text(ctx, "Smith")
+    _translate_set_name(ctx, default_config, "DONE", prompts)
+    _translate_text(ctx, "Jones")
+    action = ctx.new_action()
+    new_config = speaker.set_name(
+        "DONE",
+        ctx,
+        action,
+        default_config,
+        prompts
+    )
+
+    assert action.prev_replace == ""
+    assert new_config is default_config
+
+def test_undoing_prompt_forgets_it(ctx, default_config, speaker_type):
+    prompts = speaker.Prompts()
+    prompt_action = _translate_set_name(
+        ctx,
+        default_config,
+        speaker_type,
+        prompts
+    )
+    prompts.undo([prompt_action])
+
+    assert prompts.open_prompt is None
+
+def test_undoing_done_reopens_prompt(ctx, default_config, speaker_type):
+    prompts = speaker.Prompts()
+    prompt_action = _translate_set_name(
+        ctx,
+        default_config,
+        speaker_type,
+        prompts
+    )
+    done_action = _translate_set_name(ctx, default_config, "DONE", prompts)
+    prompts.undo([done_action])
+
+    assert prompts.open_prompt.action_ref() is prompt_action
+
+def test_undoing_other_actions_keeps_prompt(ctx, default_config, speaker_type):
+    prompts = speaker.Prompts()
+    _translate_set_name(ctx, default_config, speaker_type, prompts)
+    open_prompt = prompts.open_prompt
+    prompts.undo([ctx.new_action()])
+
+    assert prompts.open_prompt is open_prompt
+
+def test_dropped_prompt_action_is_forgotten(ctx, default_config, speaker_type):
+    prompts = speaker.Prompts()
+    prompt_action = _Action()
+    speaker.set_name(speaker_type, ctx, prompt_action, default_config, prompts)
+
+    assert prompts.has_tagged_actions()
+
+    del prompt_action
+    gc.collect()
+
+    assert not prompts.has_tagged_actions()
+
+def test_dropped_prompt_and_done_actions_are_forgotten(
+    default_config,
+    speaker_type
+):
+    prompts = speaker.Prompts()
+    context = _Context([], _Action())
+    _translate_set_name(context, default_config, speaker_type, prompts)
+    _translate_text(context, "Smith")
+    _translate_set_name(context, default_config, "DONE", prompts)
+
+    assert prompts.has_tagged_actions()
+
+    # NOTE: Plover drops old actions as new translations come in.
+    del context
+    gc.collect()
+
+    assert not prompts.has_tagged_actions()
+
+def test_done_after_prompt_action_dropped_is_ignored(
+    ctx,
+    default_config,
+    speaker_type
+):
+    prompts = speaker.Prompts()
+    speaker.set_name(speaker_type, ctx, _Action(), default_config, prompts)
+    gc.collect()
+    done_action = ctx.new_action()
+
+    new_config = speaker.set_name(
+        "DONE",
+        ctx,
+        done_action,
+        default_config,
+        prompts
+    )
+
+    assert new_config is default_config
+    assert prompts.open_prompt is None
+
+def _translate_set_name(ctx, default_config, set_name_command, prompts):
+    action = ctx.new_action()
+    speaker.set_name(set_name_command, ctx, action, default_config, prompts)
+    ctx.translated(action)
+    return action
+
+def _translate_text(ctx, text):
+    action = ctx.new_action()
+    action.text = text
+    ctx.translated(action)
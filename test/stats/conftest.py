@@ -0,0 +1,22 @@
+import pytest
+
+from plover_q_and_a import stats
+
+
+@pytest.fixture
+def histogram():
+    return stats.Histogram()
+
+@pytest.fixture
+def collected_stats():
+    collected = stats.Stats()
+    for nanoseconds in range(1_000, 101_000, 1_000):
+        collected.record("QUESTION:INITIAL", nanoseconds)
+    collected.record("BYLINE:PLAINTIFF_1:INITIAL", 5_000)
+    collected.record("SET_NAME:WITNESS", 7_000)
+
+    return collected
+
+@pytest.fixture
+def stats_path(tmp_path):
+    return tmp_path / stats.FILENAME
@@ -0,0 +1,41 @@
+import json
+
+from plover_q_and_a import stats
+
+
+def test_empty_histogram_percentile(histogram):
+    assert histogram.count == 0
+    assert histogram.percentile(50) == 0
+
+def test_histogram_percentile_is_within_one_bucket(histogram):
+    for nanoseconds in range(1, 10_001):
+        histogram.record(nanoseconds)
+
+    assert histogram.count == 10_000
+    for percent in (50, 95, 99):
+        exact = 10_000 * percent // 100
+        assert exact <= histogram.percentile(percent) < exact * 9 / 8
+
+def test_histogram_records_small_latencies_exactly(histogram):
+    for nanoseconds in (3, 3, 5):
+        histogram.record(nanoseconds)
+
+    assert histogram.percentile(50) == 3
+    assert histogram.percentile(100) == 5
+
+def test_stats_summary_is_bucketed_by_family(collected_stats):
+    summary = collected_stats.summary()
+
+    assert list(summary) == ["BYLINE", "QUESTION", "SET_NAME"]
+    assert summary["QUESTION"]["count"] == 100
+    assert 50 <= summary["QUESTION"]["p50_us"] < 50 * 9 / 8
+    assert 99 <= summary["QUESTION"]["p99_us"] < 99 * 9 / 8
+    assert summary["SET_NAME"]["count"] == 1
+
+def test_stats_write(collected_stats, stats_path):
+    collected_stats.write(stats_path)
+
+    assert json.loads(stats_path.read_text(encoding="utf-8")) == (
+        collected_stats.summary()
+    )
+    assert list(stats_path.parent.iterdir()) == [stats_path]
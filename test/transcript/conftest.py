@@ -0,0 +1,63 @@
+from pathlib import Path
+
+import pytest
+
+from plover_q_and_a import config
+
+
+@pytest.fixture
+def platinum_steno_config_path():
+    return Path(__file__).parents[2] / "examples/config/platinum_steno.json"
+
+@pytest.fixture
+def platinum_steno_config(platinum_steno_config_path):
+    return config.load(platinum_steno_config_path)
+
+@pytest.fixture
+def session():
+    return (
+        "{:Q_AND_A:QUESTION:INITIAL}\n"
+        "did you see the car\n"
+        "{:Q_AND_A:ANSWER:FOLLOWING_INTERROGATIVE}\n"
+        "yes {:Q_AND_A:SET_NAME:PLAINTIFF_1} MR. SMITH "
+        "{:Q_AND_A:SET_NAME:DONE} "
+        "{:Q_AND_A:BYLINE:PLAINTIFF_1:FOLLOWING_STATEMENT} "
+        "and then {:Q_AND_A:ANSWER:FOLLOWING_INTERROGATIVE} no  "
+        "{:Q_AND_A:RESET_CONFIG} "
+        "{:Q_AND_A:BYLINE:PLAINTIFF_1:FOLLOWING_STATEMENT}"
+        "{:Q_AND_A:STATS} okay\n"
+    )
+
+@pytest.fixture
+def rendered_session():
+    return (
+        "\tQ\tDid you see the car?\n"
+        "\tA\tYes.\n"
+        "BY MR. SMITH:\n"
+        "\tQ\tAnd then?\n"
+        "\tA\tNo.\n"
+        "BY MR. STPHAO:\n"
+        "\tQ\tOkay\n"
+    )
+
+@pytest.fixture
+def session_path(tmp_path, session):
+    session_path = tmp_path / "session.txt"
+    session_path.write_text(session, encoding="utf-8")
+    return session_path
+
+@pytest.fixture
+def session_paths(tmp_path, session):
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    session_paths = [input_dir / f"session_{index}.txt" for index in range(3)]
+    for session_path in session_paths:
+        session_path.write_text(session, encoding="utf-8")
+    return session_paths
+
+@pytest.fixture
+def bad_session_path(tmp_path):
+    bad_session_path = tmp_path / "input" / "bad_session.txt"
+    bad_session_path.parent.mkdir(exist_ok=True)
+    bad_session_path.write_text("{:Q_AND_A:FOO}", encoding="utf-8")
+    return bad_session_path
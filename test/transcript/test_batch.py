@@ -0,0 +1,131 @@
+import pytest
+
+from plover_q_and_a import batch
+from plover_q_and_a.__main__ import main
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_render_files(
+    jobs,
+    session_paths,
+    rendered_session,
+    platinum_steno_config,
+    tmp_path
+):
+    output_dir = tmp_path / "output"
+
+    results = list(
+        batch.render_files(
+            session_paths,
+            output_dir,
+            platinum_steno_config,
+            jobs
+        )
+    )
+
+    assert sorted(result.input_path for result in results) == session_paths
+    assert not [result for result in results if result.error]
+    for session_path in session_paths:
+        assert (output_dir / session_path.name).read_text(
+            encoding="utf-8"
+        ) == rendered_session
+    assert len(list(output_dir.iterdir())) == len(session_paths)
+
+def test_render_files_in_one_process_leaves_transitions_untouched(
+    platinum_steno_config,
+    tmp_path
+):
+    transitions_length = len(platinum_steno_config.transitions)
+    input_paths = []
+    for index in range(10):
+        input_path = tmp_path / f"session_{index}.txt"
+        input_path.write_text(
+            "".join(
+                "{:Q_AND_A:ANSWER:FOLLOWING_INTERROGATIVE:YIELD_AFTER:"
+                f"Yes {index} {line}}}"
+                for line in range(100)
+            ),
+            encoding="utf-8"
+        )
+        input_paths.append(input_path)
+
+    results = list(
+        batch.render_files(
+            input_paths,
+            tmp_path / "output",
+            platinum_steno_config,
+            1
+        )
+    )
+
+    assert not [result for result in results if result.error]
+    assert len(platinum_steno_config.transitions) == transitions_length
+
+def test_render_files_with_error(
+    session_paths,
+    bad_session_path,
+    platinum_steno_config,
+    tmp_path
+):
+    output_dir = tmp_path / "output"
+
+    results = {
+        result.input_path: result
+        for result in batch.render_files(
+            [bad_session_path, *session_paths],
+            output_dir,
+            platinum_steno_config,
+            2
+        )
+    }
+
+    assert results[bad_session_path].error == (
+        "Unknown sign type provided: FOO"
+    )
+    assert sorted(path.name for path in output_dir.iterdir()) == [
+        session_path.name for session_path in session_paths
+    ]
+
+def test_output_paths_clash(session_paths, tmp_path):
+    with pytest.raises(ValueError, match="More than one transcript"):
+        batch.output_paths(
+            [session_paths[0], tmp_path / session_paths[0].name],
+            tmp_path / "output"
+        )
+
+def test_output_paths_overwrite_input(session_paths):
+    with pytest.raises(ValueError, match="Transcript would overwrite itself"):
+        batch.output_paths(session_paths, session_paths[0].parent)
+
+def test_main_render_batch(
+    session_paths,
+    bad_session_path,
+    platinum_steno_config_path,
+    tmp_path,
+    capsys
+):
+    assert main([
+        "render",
+        *map(str, [*session_paths, bad_session_path]),
+        "--config",
+        str(platinum_steno_config_path),
+        "--output-dir",
+        str(tmp_path / "output"),
+        "--jobs",
+        "2"
+    ]) == 1
+    assert "3 of 4 transcripts rendered with 2 jobs" in (
+        capsys.readouterr().err
+    )
+
+def test_main_render_many_inputs_without_output_dir(
+    session_paths,
+    platinum_steno_config_path
+):
+    with pytest.raises(SystemExit):
+        main([
+            "render",
+            *map(str, session_paths),
+            "--config",
+            str(platinum_steno_config_path)
+        ])
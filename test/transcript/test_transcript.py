@@ -0,0 +1,108 @@
+import pytest
+
+from plover_q_and_a import transcript
+from plover_q_and_a.__main__ import main
+
+
+def test_render(session, rendered_session, platinum_steno_config):
+    assert "".join(
+        transcript.render([session], platinum_steno_config)
+    ) == rendered_session
+
+def test_render_commands_split_across_chunks(
+    session,
+    rendered_session,
+    platinum_steno_config
+):
+    for chunk_size in range(1, 40):
+        chunks = [
+            session[start:start + chunk_size]
+            for start in range(0, len(session), chunk_size)
+        ]
+        assert "".join(
+            transcript.render(chunks, platinum_steno_config)
+        ) == rendered_session
+
+def test_render_follow_on_commands_leaves_transitions_untouched(
+    platinum_steno_config
+):
+    transitions_length = len(platinum_steno_config.transitions)
+    chunks = (
+        f"{{:Q_AND_A:ANSWER:FOLLOWING_INTERROGATIVE:YIELD_AFTER:Yes {index}}}"
+        f"{{:Q_AND_A:QUESTION:FOLLOWING_STATEMENT:ELABORATE_AFTER:Ok {index}}}"
+        for index in range(1000)
+    )
+
+    for _text in transcript.render(chunks, platinum_steno_config):
+        pass
+
+    assert len(platinum_steno_config.transitions) == transitions_length
+
+def test_render_upcases_set_name(platinum_steno_config):
+    assert "".join(
+        transcript.render(
+            [
+                "{:Q_AND_A:SET_NAME:PLAINTIFF_1} Smith {:Q_AND_A:SET_NAME:DONE}"
+                "{:Q_AND_A:BYLINE:PLAINTIFF_1:INITIAL}"
+            ],
+            platinum_steno_config
+        )
+    ) == "BY SMITH:\n\tQ\t"
+
+def test_tokenize_keeps_text_that_looks_like_a_command_start():
+    assert list(transcript.tokenize(["a {:Q_AND", "_b} {:Q"])) == [
+        transcript.Token(text="a "),
+        transcript.Token(text="{:Q_AND_b} "),
+        transcript.Token(text="{:Q")
+    ]
+
+def test_tokenize_unclosed_command():
+    with pytest.raises(ValueError, match="Q_AND_A command never closed"):
+        list(transcript.tokenize(["{:Q_AND_A:QUESTION:INITIAL"]))
+
+def test_tokenize_runaway_command():
+    with pytest.raises(ValueError, match="Q_AND_A command never closed"):
+        list(transcript.tokenize(["{:Q_AND_A:QUESTION:", "x" * 2048]))
+
+def test_render_unknown_command(platinum_steno_config):
+    with pytest.raises(ValueError, match="Unknown sign type provided: FOO"):
+        list(transcript.render(["{:Q_AND_A:FOO}"], platinum_steno_config))
+
+def test_main_render(
+    session_path,
+    rendered_session,
+    platinum_steno_config_path,
+    tmp_path
+):
+    output_path = tmp_path / "output.txt"
+
+    assert main([
+        "render",
+        str(session_path),
+        "--config",
+        str(platinum_steno_config_path),
+        "--output",
+        str(output_path)
+    ]) == 0
+    assert output_path.read_text(encoding="utf-8") == rendered_session
+
+def test_main_render_error(tmp_path, platinum_steno_config_path, capsys):
+    session_path = tmp_path / "session.txt"
+    session_path.write_text("{:Q_AND_A:FOO}", encoding="utf-8")
+
+    assert main([
+        "render",
+        str(session_path),
+        "--config",
+        str(platinum_steno_config_path)
+    ]) == 1
+    assert "Unknown sign type provided: FOO" in capsys.readouterr().err
+
+def test_main_render_missing_config(session_path, tmp_path):
+    with pytest.raises(SystemExit):
+        main([
+            "render",
+            str(session_path),
+            "--config",
+            str(tmp_path / "non_existent.json")
+        ])
@@ -0,0 +1,17 @@
+from pathlib import Path
+
+import pytest
+
+from plover_q_and_a import (
+    command,
+    config
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_command_cache():
+    command.parse.cache_clear()
+
+@pytest.fixture
+def default_config(tmp_path):
+    return config.load(Path(tmp_path) / "non_existent.json")
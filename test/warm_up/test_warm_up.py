@@ -0,0 +1,25 @@
+from plover_q_and_a import (
+    command,
+    sign,
+    warm_up
+)
+
+
+def test_arguments_cover_every_builtin_command():
+    assert [
+        command.parse(argument).sign_command
+        for argument in warm_up.arguments()
+    ] == list(sign.transitions.builtin_commands())
+
+def test_run_caches_every_argument(default_config):
+    warm_up.run(default_config)
+
+    assert command.parse.cache_info().currsize == len(
+        list(warm_up.arguments())
+    )
+
+def test_run_leaves_transitions_untouched(default_config):
+    transitions = dict(default_config.transitions)
+
+    assert warm_up.run(default_config) > 0
+    assert default_config.transitions == transitions